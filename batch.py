@@ -0,0 +1,98 @@
+import contextlib
+import glob
+import io
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import compiler
+from frontend import get_frontend
+from optimize import optimize
+
+# Compiling many files in one process.
+#
+# Building the lexer and parser is most of the cost of compiling a small
+# script, so a batch builds the frontend once, in the parent, and forks its
+# workers from there.  The workers share the built tables copy-on-write and
+# each compiles a run of files with its own warm frontend.
+
+# Program parsed before forking, so every table is built and every generated
+# module is loaded by then
+_warmup = "set x 1\n"
+
+
+class FileResult:
+    __slots__ = ("path", "program", "code", "diagnostics")
+
+    def __init__(self, path, program, code, diagnostics):
+        self.path = path
+        self.program = program  # c_program, None on syntax errors
+        self.code = code  # Transpiled Python code, None if it failed
+        self.diagnostics = diagnostics  # Lines printed while compiling
+
+    @property
+    def ok(self):
+        return self.code is not None
+
+
+def find_sources(patterns):
+    """Return the .bthn files under directories and matching glob patterns."""
+    paths = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            pattern = os.path.join(pattern, "**", "*.bthn")
+        paths.extend(sorted(glob.glob(pattern, recursive=True)))
+    return list(dict.fromkeys(paths))
+
+
+def compile_file(path, scanner="lex", parser="lr", optimized=True):
+    """Parse, optimize unless optimized is false, and transpile one file.
+
+    Returns its FileResult.
+    """
+    output = io.StringIO()
+    program = code = None
+    with contextlib.redirect_stdout(output):
+        try:
+            with open(path, encoding="utf-8") as f:
+                source = f.read()
+            program = get_frontend(scanner, parser).parse(source)
+            if program is not None:
+                if optimized:
+                    optimize(program)
+                code = program.transpile(compiler.BuiltInEnv.copy())
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"cannot read file: {e}")
+        except Exception as e:
+            print(f"{type(e).__name__}: {e}")
+    return FileResult(path, program, code, output.getvalue().splitlines())
+
+
+def compile_batch(paths, workers=None, scanner="lex", parser="lr", optimized=True):
+    """Compile paths in a pool of forked workers.
+
+    Generates a FileResult per path, in the order of paths.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    frontend = get_frontend(scanner, parser)
+    with contextlib.redirect_stdout(io.StringIO()):
+        frontend.parse(_warmup)
+    if workers <= 1 or len(paths) <= 1:
+        for path in paths:
+            yield compile_file(path, scanner, parser, optimized)
+        return
+
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("fork" if "fork" in methods else None)
+    # Hand the files out in runs, so small files don't cost a round trip each
+    chunksize = max(1, min(64, len(paths) // (workers * 4)))
+    with ProcessPoolExecutor(workers, mp_context=context) as executor:
+        yield from executor.map(
+            compile_file,
+            paths,
+            [scanner] * len(paths),
+            [parser] * len(paths),
+            [optimized] * len(paths),
+            chunksize=chunksize,
+        )
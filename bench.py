@@ -0,0 +1,825 @@
+import argparse
+import contextlib
+import functools
+import io
+import mmap
+import os
+import random
+import sys
+import tempfile
+import time
+
+import closures
+import compiler
+import yacc
+from batch import compile_batch
+from frontend import Frontend, make_lexer, make_parser, parsers, scanners
+from incremental import IncrementalLexer, IncrementalParser
+from lexer import IndentFilter
+from optimize import optimize
+from parallel import parse_parallel
+
+# Frontend benchmarks.  Run "python bench.py" for all of them or name the
+# ones to run.  A benchmark that checks for a regression exits with an error
+# when it finds one.
+
+benchmarks = {}
+
+
+def benchmark(func):
+    benchmarks[func.__name__.replace("bench_", "")] = func
+    return func
+
+
+def best_time(func, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def check_linear(name, make_source, n):
+    # Parse programs of size n / 10 and n.  A linear parse takes about 10
+    # times longer on the larger one, a quadratic one about 100 times.
+    frontend = Frontend()
+    small = best_time(lambda: frontend.parse(make_source(n // 10)))
+    large = best_time(lambda: frontend.parse(make_source(n)))
+    ratio = large / small
+    print(f"{name}: {n // 10}: {small:.3f}s  {n}: {large:.3f}s  ratio {ratio:.1f}")
+    if ratio > 25:
+        print(f"{name}: parse time grows faster than linearly", file=sys.stderr)
+        return False
+    return True
+
+
+@benchmark
+def bench_statements(n=100_000):
+    """Top-level statement list of n statements"""
+    return check_linear(
+        "statements", lambda k: "".join(f"set x{i} {i}\n" for i in range(k)), n
+    )
+
+
+@benchmark
+def bench_arguments(n=100_000):
+    """Function call with n arguments"""
+    return check_linear(
+        "arguments", lambda k: "prn " + " ".join(map(str, range(k))) + "\n", n
+    )
+
+
+@benchmark
+def bench_streaming(size=1_000_000):
+    """Lexing a string literal much longer than the lexer window
+
+    The source is lexed from a str, a file object and an mmap, which must
+    all give the same tokens.
+    """
+    source = 'prn "' + "s" * size + '" x\nset y 2\n'
+    data = source.encode()
+    frontend = Frontend()
+    expected = token_tuples(frontend.tokenize(source))
+    ok = True
+    with tempfile.TemporaryFile() as f:
+        f.write(data)
+        f.flush()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+
+            def rewound(stream):
+                stream.seek(0)
+                return stream
+
+            inputs = {
+                "str": lambda: source,
+                "file": lambda: io.BytesIO(data),
+                "mmap": lambda: rewound(mapped),
+            }
+            for name, make_input in inputs.items():
+                output = io.StringIO()
+                with contextlib.redirect_stdout(output):
+                    tokens = token_tuples(frontend.tokenize(make_input()))
+                    columns = frontend.tokenstream.tokenize_all(make_input())
+                elapsed = best_time(lambda: frontend.tokenize(make_input()))
+                print(f"streaming: {name}: {len(source)} characters: {elapsed:.3f}s")
+                columns = token_tuples(columns)
+                if tokens != expected or columns != expected or output.getvalue():
+                    print(f"streaming: {name} gives other tokens", file=sys.stderr)
+                    ok = False
+
+    # No token starts with an illegal character, so it is reported without
+    # reading the rest of the stream into the window
+    source = "$\n" + "set y 2\n" * (size // 8)
+    with contextlib.redirect_stdout(io.StringIO()):
+        frontend.lexer.input(io.StringIO(source))
+        frontend.lexer.token()
+    if frontend.lexer.lexlen >= len(source):
+        print(
+            "streaming: an illegal character reads the whole stream", file=sys.stderr
+        )
+        ok = False
+    return ok
+
+
+def token_tuples(tokens):
+    return [(t.type, t.value, t.lexpos, t.lineno) for t in tokens]
+
+
+def synthetic_grammar(n):
+    """Return a Bithon-like grammar with n binary operators and n statements.
+
+    The operators are spread over n // 4 precedence levels, and every
+    statement takes a keyword, a possibly empty argument list and a block.
+    """
+    operators = [f"OP{i}" for i in range(n)]
+    keywords = [f"KW{i}" for i in range(n)]
+    terminals = operators + keywords
+    terminals += ["IDENT", "NUMBER", "LPAREN", "RPAREN", "INDENT", "DEDENT"]
+    grammar = yacc.Grammar(terminals)
+    levels = max(n // 4, 1)
+    for i, op in enumerate(operators):
+        grammar.set_precedence(op, "left", i % levels + 1)
+
+    grammar.add_production("program", ["statements"])
+    grammar.add_production("statements", ["statement"])
+    grammar.add_production("statements", ["statements", "statement"])
+    grammar.add_production("block", ["INDENT", "statements", "DEDENT"])
+    grammar.add_production("statement", ["expression"])
+    grammar.add_production("args", [])
+    grammar.add_production("args", ["args", "expression"])
+    for kw in keywords:
+        grammar.add_production(f"statement_{kw}", [kw, "IDENT", "args", "block"])
+        grammar.add_production("statement", [f"statement_{kw}"])
+    grammar.add_production("expression", ["NUMBER"])
+    grammar.add_production("expression", ["IDENT"])
+    grammar.add_production("expression", ["LPAREN", "expression", "RPAREN"])
+    for op in operators:
+        grammar.add_production("expression", ["expression", op, "expression"])
+    grammar.set_start()
+    return grammar
+
+
+@benchmark
+def bench_tables(sizes=(20, 80, 160)):
+    """LALR table construction for synthetic grammars
+
+    Bithon itself has about 20 operators and statement kinds, so the sizes
+    run from its own size to 8 times that.
+    """
+    for n in sizes:
+        elapsed = best_time(lambda: yacc.LRTable(synthetic_grammar(n)), repeat=1)
+        print(f"tables: {n} operators and statements: {elapsed:.3f}s")
+
+
+def sample_sources():
+    # The .bthn files next to this script
+    directory = os.path.dirname(os.path.abspath(__file__))
+    sources = []
+    for name in sorted(os.listdir(directory)):
+        if name.endswith(".bthn"):
+            with open(os.path.join(directory, name)) as f:
+                sources.append(f.read())
+    return sources
+
+
+@benchmark
+def bench_parsers(copies=500):
+    """Every parser on the sample programs
+
+    The corpus holds copies of every .bthn file next to this script.  Each
+    parser is timed on the tokens alone and from the source, and must give
+    the same trees as the LRParser.
+    """
+    sources = sample_sources()
+    frontend = Frontend()
+    corpus = [frontend.tokenize(source) for source in sources] * copies
+    ntokens = sum(map(len, corpus))
+
+    for parser in parsers:
+        engine = make_parser(parser)
+        parser_frontend = Frontend(parser=parser)
+
+        def parse_corpus():
+            for tokens in corpus:
+                engine.parse(lexer=TokenList(tokens))
+
+        def parse_sources():
+            for source in sources * copies:
+                parser_frontend.parse(source)
+
+        tokens_time = best_time(parse_corpus)
+        source_time = best_time(parse_sources)
+        print(
+            f"parsers: {parser}: {ntokens} tokens: {tokens_time:.3f}s"
+            f"  from source: {source_time:.3f}s"
+        )
+
+    return check_parsers(sources)
+
+
+def check_parsers(sources):
+    # Compare the trees and the syntax error output of every parser with
+    # those of the LRParser
+    frontends = [Frontend(parser=parser) for parser in parsers]
+    for source in sources:
+        results = []
+        for frontend in frontends:
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                program = frontend.parse(source)
+            results.append((program and program.tree(), output.getvalue()))
+        for parser, result in zip(parsers, results):
+            if result != results[0]:
+                print(f"parsers: {parser} differs on {source!r}", file=sys.stderr)
+                return False
+    return True
+
+
+@benchmark
+def bench_spans(copies=500):
+    """Position tracking on the sample programs
+
+    Parses the corpus of bench_parsers with the LRParser without tracking,
+    with tracking="spans" and with full tracking.
+    """
+    frontend = Frontend()
+    corpus = [frontend.tokenize(source) for source in sample_sources()] * copies
+    parser = make_parser()
+    times = {}
+    for tracking in (False, "spans", True):
+
+        def parse_corpus():
+            for tokens in corpus:
+                parser.parse(lexer=TokenList(tokens), tracking=tracking)
+
+        times[tracking] = best_time(parse_corpus)
+    print(
+        f"spans: untracked: {times[False]:.3f}s"
+        f"  spans: {times['spans']:.3f}s ({times['spans'] / times[False] - 1:+.0%})"
+        f"  tracking: {times[True]:.3f}s ({times[True] / times[False] - 1:+.0%})"
+    )
+
+
+# Engines that run a syntax tree
+engines = ("tree", "python", "closure")
+
+
+def compile_engine(engine, program):
+    # Return the function running program in an environment on engine
+    if engine == "python":
+        code = program.transpile(compiler.BuiltInEnv.copy())
+        return functools.partial(run_python, compile(code, "<bithon>", "exec"))
+    if engine == "closure":
+        return closures.compile_program(program)
+    return program.execute
+
+
+def run_python(code, environment):
+    # The transpiled code calls the builtins by the names of their functions
+    names = {
+        function.__name__: environment[name]
+        for name, function in compiler.BuiltInEnv.items()
+    }
+    try:
+        exec(code, names)
+    except SystemExit:
+        pass  # ret outside of a function
+
+
+# Trial division prime counter, which stops at the first divisor.  The README
+# prime generator reads its bound with inp, which isn't a builtin.
+primes_source = """\
+set count 0
+set num 2
+lop num 1 upper
+    set composite false
+    set i 2
+    lop i 1 num
+        iff num mod i eql 0
+            set composite true
+            brk
+    iff not composite
+        set count count add 1
+prn "primes below" (upper) (count)
+"""
+
+
+@benchmark
+def bench_engines(upper=1500):
+    """Every engine on the prime counter, compiling included"""
+    program = Frontend().parse(f"set upper {upper}\n" + primes_source)
+    outputs = {}
+    for engine in engines:
+        output = []
+        environment = dict(compiler.BuiltInEnv, prn=lambda *args: output.append(args))
+        start = time.perf_counter()
+        compile_engine(engine, program)(environment)
+        elapsed = time.perf_counter() - start
+        outputs[engine] = output
+        print(f"engines: {engine}: upper {upper}: {elapsed:.3f}s  {output}")
+    ok = True
+    for engine in engines:
+        if outputs[engine] != outputs["tree"]:
+            print(f"engines: {engine} prints something else", file=sys.stderr)
+            ok = False
+    return ok
+
+
+# A function called in a loop, next to many global names
+calls_source = """\
+set total 0
+def step n
+    set k n mul 2
+    set total total add k
+set i 0
+lop i 1 calls
+    step (i)
+prn "calls" (calls)
+"""
+
+
+@benchmark
+def bench_calls(calls=20_000, sizes=(10, 2000)):
+    """Function calls with few and with many global names
+
+    The time of a call must not depend on the number of global names.
+    """
+    ok = True
+    for engine in engines:
+        times = []
+        for size in sizes:
+            source = "".join(f"set g{i} {i}\n" for i in range(size))
+            program = Frontend().parse(f"set calls {calls}\n" + source + calls_source)
+            environment = dict(compiler.BuiltInEnv, prn=lambda *args: None)
+            run = compile_engine(engine, program)
+            times.append(best_time(lambda: run(dict(environment))))
+        print(
+            f"calls: {engine}: {calls} calls: "
+            + "  ".join(f"{n} globals: {t:.3f}s" for n, t in zip(sizes, times))
+        )
+        if times[-1] > 2 * times[0]:
+            print(f"calls: {engine}: calls get slower with more globals", file=sys.stderr)
+            ok = False
+    return ok
+
+
+# A loop full of constant expressions
+constants_source = """\
+set total 0
+set i 0
+lop i 1 iterations
+    set total total add 2 pow 10 mul (3 add 4)
+    iff not false and 1 eql 1
+        set label "tab\\tseparated" add "\\n"
+prn "total" (total) (label)
+"""
+
+
+@benchmark
+def bench_optimize(iterations=50_000):
+    """Every engine on parsed and on optimized constant expressions"""
+    source = f"set iterations {iterations}\n" + constants_source
+    ok = True
+    for engine in engines:
+        outputs = []
+        times = []
+        for optimized in (False, True):
+            program = Frontend().parse(source)
+            if optimized:
+                optimize(program)
+            output = []
+            environment = dict(
+                compiler.BuiltInEnv, prn=lambda *args: output.append(args)
+            )
+            run = compile_engine(engine, program)
+            times.append(best_time(lambda: run(dict(environment))))
+            outputs.append(output)
+        print(
+            f"optimize: {engine}: {iterations} iterations: parsed: {times[0]:.3f}s"
+            f"  optimized: {times[1]:.3f}s"
+        )
+        if outputs[0] != outputs[1]:
+            message = "the optimized program prints something else"
+            print(f"optimize: {engine}: {message}", file=sys.stderr)
+            ok = False
+    return ok
+
+
+def random_program(rng, statements=4):
+    """Return a random Bithon program, which is not always valid.
+
+    The functions it defines take a depth as their parameter, and are called
+    from the top level, by themselves, by the functions nested in them and
+    by those around them.  Every call in a function passes a lower depth
+    than its own and a function returns at depth 0, so recursion ends.
+    Loops and function bodies hold ret, brk and cnt anywhere in them.
+    """
+    operators = ["add", "sub", "mul", "div", "mod", "pow", "eql"]
+    operators += ["and", "or", "xor", "nand", "nor", "xnor"]
+    functions = []  # Names of the functions defined so far
+    calls = []  # Calls of the top-level functions, which run first
+    names = ["x"]  # Variables in scope: globals, loop and parameters
+    scopes = []  # Parameters of the functions around the statement
+
+    def expression(depth=0):
+        choice = rng.random()
+        if depth > 3 or choice < 0.3:
+            return rng.choice(["1", "2.5", '"s"', "true"] + names)
+        if choice < 0.55:
+            op = rng.choice(operators)
+            return f"{expression(depth + 1)} {op} {expression(depth + 1)}"
+        if choice < 0.65:
+            return "not " + expression(depth + 1)
+        if choice < 0.72:
+            return f"({expression(depth + 1)})"
+        if choice < 0.85 and functions:
+            return f"({call()})"
+        args = [expression(depth + 1) for _ in range(rng.randint(0, 2))]
+        return " ".join([rng.choice(["f", "prn"])] + args)
+
+    def call():
+        # A function takes one parameter.  Arguments past it are left over,
+        # and one left out at the top level makes the depth None.
+        if scopes:
+            args = [f"({scopes[-1]} sub 1)"]
+        else:
+            args = [rng.choice(["1", "2"])] if rng.random() < 0.9 else []
+        if rng.random() < 0.1:
+            args.append("(x)")
+        return " ".join([rng.choice(functions)] + args)
+
+    def define(pad, indent, depth):
+        name = f"g{len(functions)}"
+        param = f"n{len(functions)}"
+        functions.append(name)  # Recursion
+        if not scopes:
+            # Top-level functions are defined before the program runs
+            calls.append(f"prn {name} 2\n")
+        inner = "    " * (indent + 1)
+        code = f"{pad}def {name} {param}\n"
+        leaf = rng.choice(["1", '"s"'] + names)
+        code += f"{inner}iff {param} eql 0\n{inner}    ret {leaf}\n"
+        scopes.append(param)
+        names.append(param)
+        code += block(indent, depth, loop=False)
+        names.pop()
+        scopes.pop()
+        return code
+
+    def block(indent, depth, loop):
+        return "".join(
+            statement(indent + 1, depth + 1, loop) for _ in range(rng.randint(1, 3))
+        )
+
+    def statement(indent, depth=0, loop=False):
+        pad = "    " * indent
+        choice = rng.random()
+        if depth > 2 or choice < 0.3:
+            if functions and rng.random() < 0.5:
+                return f"{pad}{rng.choice(['', 'prn '])}{call()}\n"
+            return f"{pad}{expression()}\n"
+        if choice < 0.4:
+            return f"{pad}set v {expression()}\n"
+        if choice < 0.5:
+            code = f"{pad}iff {expression()}\n" + block(indent, depth, loop)
+            if rng.random() < 0.5:
+                code += f"{pad}els\n" + block(indent, depth, loop)
+            return code
+        if choice < 0.62:
+            return define(pad, indent, depth)
+        if choice < 0.72:
+            # Mostly loops that run a few times
+            step = "1" if rng.random() < 0.7 else expression()
+            end = rng.choice(["3", expression()])
+            code = f"{pad}lop i {step} {end}\n"
+            names.append("i")
+            code += block(indent, depth, loop=True)
+            names.pop()
+            return code
+        # Mostly where they don't end the program or fail
+        if choice < 0.82 and (scopes or loop or rng.random() < 0.1):
+            return f"{pad}ret {expression()}\n"
+        if choice < 0.92 and (loop or rng.random() < 0.1):
+            return f"{pad}{rng.choice(['brk', 'cnt'])}\n"
+        return "\n"
+
+    code = "".join(statement(0) for _ in range(statements))
+    words = ("".join(calls) + code).split(" ")
+    if rng.random() < 0.3:
+        # Break it
+        extra = rng.choice(operators + ["(", ")", "els", "\n", "set"])
+        words.insert(rng.randrange(len(words)), extra)
+    return " ".join(words)
+
+
+@benchmark
+def bench_differential(n=2000):
+    """Every parser against the LRParser, and every engine and the optimizer
+    against the tree walker, on random programs
+
+    A program must print the same and fail with the same error on every
+    engine, parsed and optimized.
+    """
+    rng = random.Random(0)
+    sources = [random_program(rng) for _ in range(n)]
+    start = time.perf_counter()
+    ok = check_parsers(sources)
+    elapsed = time.perf_counter() - start
+    print(f"differential: {n} programs: {elapsed:.3f}s")
+    return check_engines(sources) and ok
+
+
+def check_engines(sources):
+    frontend = Frontend()
+    for source in sources:
+        with contextlib.redirect_stdout(io.StringIO()):
+            parsed = frontend.parse(source)
+            optimized = frontend.parse(source)
+        if parsed is None:
+            continue
+        optimize(optimized)
+        expected = run_quietly("tree", parsed)
+        if expected is None:
+            continue  # The engines recurse to different depths
+        for engine in engines:
+            for program, kind in ((parsed, "parsed"), (optimized, "optimized")):
+                if run_quietly(engine, program) != expected:
+                    print(f"{engine}: {kind} differs on {source!r}", file=sys.stderr)
+                    return False
+    return True
+
+
+def run_quietly(engine, program):
+    # What program prints and the type of the error it stops with
+    output = []
+    environment = dict(compiler.BuiltInEnv, prn=lambda *args: output.append(args))
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            compile_engine(engine, program)(environment)
+    except RecursionError:
+        return None
+    except Exception as e:
+        return output, type(e)
+    return output, None
+
+
+# Text random edits insert: tokens, indentation, line breaks, and characters
+# that start no token or an unterminated string
+_edit_pieces = ["x", "1", " ", "    ", "\n", "\n    ", '"', "$", "(", ")", "-"]
+_edit_pieces += ["add ", "set y ", "def h n\n", "iff x\n", "els\n", "ret 1"]
+
+
+def random_edit(rng, source):
+    # Return a random (start, end, text) edit of source
+    start = rng.randint(0, len(source))
+    end = min(len(source), start + rng.choice([0, 0, 1, 2, 5, 20]))
+    text = "".join(rng.choice(_edit_pieces) for _ in range(rng.randint(0, 3)))
+    return start, end, text
+
+
+def defs_source(n=300):
+    # A program of n small functions
+    return "".join(
+        f"def f{i} n\n    set y n mul {i}\n    iff y\n        ret y add 1\n"
+        for i in range(n)
+    )
+
+
+def lex_quietly(make_tokens):
+    # The tokens made by make_tokens() and what making them printed
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        tokens = token_tuples(make_tokens())
+    return tokens, output.getvalue()
+
+
+def parse_quietly(make_program):
+    # The tree of the program made by make_program() and what making it
+    # printed
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        program = make_program()
+    return program and program.tree(), output.getvalue()
+
+
+def full_lex(lexer, source):
+    # Generate the tokens of source, lexed from its start
+    IndentFilter(lexer).input(source)  # Resets the line number and indent stack
+    return iter(lexer.token, None)
+
+
+@benchmark
+def bench_incremental(programs=100, edits=20):
+    """Incremental lexing and parsing after random edits of random programs
+
+    After every edit the tokens, and what the lexer prints, must be those of
+    a full lex of the edited source, with both scanners.  The program, and
+    what the lexer and parser print, must be those of a full parse, also
+    after the program of the previous edit was optimized.  An edit in the
+    middle of a program of 300 functions is timed against a full lex and a
+    full parse.
+    """
+    rng = random.Random(0)
+    ok = True
+    for scanner in scanners:
+        lexer = make_lexer(scanner)
+        for _ in range(programs):
+            source = random_program(rng)
+            incremental = IncrementalLexer(source, scanner)
+            for _ in range(edits):
+                start, end, text = random_edit(rng, source)
+                source = source[:start] + text + source[end:]
+                incremental.edit(start, end, text)
+                tokens = lex_quietly(lambda: incremental.tokens(report=True))
+                if tokens != lex_quietly(lambda: full_lex(lexer, source)):
+                    print(
+                        f"incremental: {scanner}: lexing differs on {source!r}",
+                        file=sys.stderr,
+                    )
+                    ok = False
+                    break
+
+    frontend = Frontend()
+    for _ in range(programs):
+        source = random_program(rng)
+        with contextlib.redirect_stdout(io.StringIO()):
+            incremental = IncrementalParser(source)
+        for _ in range(edits):
+            start, end, text = random_edit(rng, source)
+            source = source[:start] + text + source[end:]
+            program = parse_quietly(lambda: incremental.edit(start, end, text))
+            if program != parse_quietly(lambda: frontend.parse(source)):
+                print(f"incremental: parsing differs on {source!r}", file=sys.stderr)
+                ok = False
+                break
+            # The program is a copy that can be changed
+            with contextlib.redirect_stdout(io.StringIO()):
+                program = incremental.program()
+            if program is not None:
+                optimize(program)
+
+    source = defs_source()
+    middle = source.index("def f150")
+    incremental = IncrementalLexer(source)
+    lexer = make_lexer()
+
+    def edit_lex():
+        for _ in range(100):
+            incremental.edit(middle, middle, "x")
+            incremental.edit(middle, middle + 1, "")
+
+    edit_time = best_time(edit_lex) / 200
+    full_time = best_time(lambda: list(full_lex(lexer, source)))
+    print(
+        f"incremental: lex: one character: {edit_time * 1000:.3f}ms"
+        f"  full: {full_time * 1000:.3f}ms"
+    )
+    if edit_time > full_time / 10:
+        print("incremental: lex: an edit takes as long as a full lex", file=sys.stderr)
+        ok = False
+
+    # A statement changed in a function in the middle
+    middle = source.index("mul 150") + len("mul ")
+    incremental = IncrementalParser(source)
+
+    def edit_parse():
+        for _ in range(50):
+            incremental.edit(middle, middle + 1, "2")
+            incremental.edit(middle, middle + 1, "1")
+
+    edit_time = best_time(edit_parse) / 100
+    full_time = best_time(lambda: frontend.parse(source))
+    print(
+        f"incremental: parse: one function: {edit_time * 1000:.3f}ms"
+        f"  full: {full_time * 1000:.3f}ms"
+    )
+    if edit_time > full_time / 2:
+        message = "an edit takes as long as a full parse"
+        print(f"incremental: parse: {message}", file=sys.stderr)
+        ok = False
+    return ok
+
+
+@benchmark
+def bench_parallel(sources=40, workers=4):
+    """Parallel parsing of programs joined from random programs
+
+    parse_parallel must give the program a sequential parse gives, and
+    print what it prints, also when a random edit put a syntax error in
+    one of the chunks.  A program of 3000 functions is timed both ways.
+    """
+    rng = random.Random(0)
+    frontend = Frontend()
+    ok = True
+    for i in range(sources):
+        source = "".join(random_program(rng) for _ in range(30))
+        if i % 2:
+            start, end, text = random_edit(rng, source)
+            source = source[:start] + text + source[end:]
+        program = parse_quietly(lambda: parse_parallel(source, workers))
+        if program != parse_quietly(lambda: frontend.parse(source)):
+            print(f"parallel: parsing differs on {source!r}", file=sys.stderr)
+            ok = False
+            break
+
+    source = defs_source(3000)
+    parallel_time = best_time(lambda: parse_parallel(source, workers))
+    sequential_time = best_time(lambda: frontend.parse(source))
+    print(
+        f"parallel: {workers} workers: {parallel_time:.3f}s"
+        f"  sequential: {sequential_time:.3f}s"
+    )
+    return ok
+
+
+@benchmark
+def bench_batch(files=400, workers=4):
+    """Batch compilation of random programs
+
+    Every file compiled by compile_batch must give the tree, the Python
+    code and the messages of a parse, optimization and transpilation in
+    this process, in the order of the files, and a file that isn't UTF-8
+    must fail on its own.  The batch is timed on 1 and on several workers.
+    """
+    rng = random.Random(0)
+    ok = True
+    with tempfile.TemporaryDirectory() as directory:
+        paths = []
+        for i in range(files):
+            path = os.path.join(directory, f"p{i}.bthn")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(random_program(rng))
+            paths.append(path)
+        broken = os.path.join(directory, "broken.bthn")
+        with open(broken, "wb") as f:
+            f.write(b"prn \xff\n")
+        paths.insert(files // 2, broken)
+
+        results = list(compile_batch(paths, workers))
+        if [result.path for result in results] != paths:
+            print("batch: the results are out of order", file=sys.stderr)
+            return False
+        for result in results:
+            if result.path == broken:
+                if result.ok or not result.diagnostics:
+                    print("batch: a file that isn't UTF-8 compiles", file=sys.stderr)
+                    ok = False
+                continue
+            compiled = (result.program and result.program.tree(), result.code)
+            if compiled + (result.diagnostics,) != compile_quietly(result.path):
+                print(f"batch: {result.path} compiles differently", file=sys.stderr)
+                ok = False
+                break
+
+        times = [
+            best_time(lambda: list(compile_batch(paths, n)), repeat=1)
+            for n in (1, workers)
+        ]
+        print(
+            f"batch: {len(paths)} files: 1 worker: {times[0]:.3f}s"
+            f"  {workers} workers: {times[1]:.3f}s"
+        )
+    return ok
+
+
+def compile_quietly(path):
+    # The tree and the Python code of the file at path, and the lines
+    # printed while compiling it
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        with open(path, encoding="utf-8") as f:
+            program = Frontend().parse(f.read())
+        code = None
+        if program is not None:
+            optimize(program)
+            code = program.transpile(compiler.BuiltInEnv.copy())
+    return program and program.tree(), code, output.getvalue().splitlines()
+
+
+class TokenList:
+    # Lexer interface over a list of tokens.  Full tracking reads the lexer
+    # position for empty rules.
+    lineno = lexpos = 0
+
+    def __init__(self, tokens):
+        self.token = functools.partial(next, iter(tokens), None)
+
+
+def main(argv=None):
+    argparser = argparse.ArgumentParser(description="Run the frontend benchmarks.")
+    argparser.add_argument("names", nargs="*", help=", ".join(benchmarks))
+    args = argparser.parse_args(argv)
+    for name in args.names:
+        if name not in benchmarks:
+            argparser.error(f"unknown benchmark {name!r}")
+    ok = True
+    for name in args.names or benchmarks:
+        ok = benchmarks[name]() is not False and ok
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
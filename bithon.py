@@ -0,0 +1,207 @@
+import argparse
+import contextlib
+import mmap
+import os
+import sys
+
+import compiler
+from frontend import get_frontend, parsers, scanners
+
+# The engines, the optimizer, the process pools and the generated frontends
+# are imported by the commands and options that use them, so a plain run
+# starts without them.
+
+
+# Ways to execute a program
+engines = ("python", "tree", "closure")
+
+
+@contextlib.contextmanager
+def open_source(path):
+    # The lexer reads the source through a sliding window, so large files are
+    # memory mapped instead of being read into a string up front.
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield ""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as source:
+            yield source
+
+
+def parse_source(code, args, optimized=False):
+    # Programs are optimized before they are run or transpiled
+    if args.jobs > 1:
+        from parallel import parse_parallel
+
+        program_ast = parse_parallel(code, args.jobs, args.scanner, args.parser)
+    else:
+        program_ast = get_frontend(args.scanner, args.parser).parse(code)
+    if program_ast is None:
+        raise SystemExit(1)
+    if optimized and args.optimize:
+        from optimize import optimize
+
+        optimize(program_ast)
+    return program_ast
+
+
+def transpile_source(code, args):
+    program_ast = parse_source(code, args, optimized=True)
+    return program_ast.transpile(compiler.BuiltInEnv.copy())
+
+
+def cmd_run(args):
+    engine = "tree" if args.interp else args.engine
+    with open_source(args.file) as code:
+        if engine == "python":
+            python_code = transpile_source(code, args)
+        else:
+            program_ast = parse_source(code, args, optimized=True)
+    if engine == "python":
+        exec(python_code, {"__name__": "__main__"})
+    elif engine == "closure":
+        import closures
+
+        closures.compile_program(program_ast)(compiler.BuiltInEnv.copy())
+    else:
+        program_ast.execute(compiler.BuiltInEnv.copy())
+    return 0
+
+
+def cmd_transpile(args):
+    with open_source(args.file) as code:
+        print(transpile_source(code, args))
+    return 0
+
+
+def cmd_ast(args):
+    with open_source(args.file) as code:
+        compiler.print_ast(parse_source(code, args).tree())
+    return 0
+
+
+def cmd_tokens(args):
+    with open_source(args.file) as code:
+        for tok in get_frontend(args.scanner).tokenize(code):
+            print(tok)
+    return 0
+
+
+def cmd_batch(args):
+    from batch import compile_batch, find_sources
+
+    paths = find_sources(args.sources)
+    if not paths:
+        print("bithon: no .bthn files found", file=sys.stderr)
+        return 1
+    base = os.path.commonpath([os.path.dirname(os.path.abspath(p)) for p in paths])
+    failed = 0
+    results = compile_batch(
+        paths, args.jobs, args.scanner, args.parser, optimized=args.optimize
+    )
+    for result in results:
+        for line in result.diagnostics:
+            print(f"{result.path}: {line}", file=sys.stderr)
+        if not result.ok:
+            failed += 1
+            continue
+        if args.output:
+            name = os.path.relpath(os.path.abspath(result.path), base)
+            target = os.path.join(args.output, os.path.splitext(name)[0])
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with open(target + ".py", "w", encoding="utf-8") as f:
+                f.write(result.code + "\n")
+            if args.ast:
+                with open(target + ".ast", "w", encoding="utf-8") as f:
+                    with contextlib.redirect_stdout(f):
+                        compiler.print_ast(result.program.tree())
+    print(f"bithon: {len(paths)} files, {failed} failed", file=sys.stderr)
+    return 1 if failed else 0
+
+
+def build_argparser():
+    argparser = argparse.ArgumentParser(
+        prog="bithon", description="Run and inspect Bithon programs."
+    )
+    argparser.add_argument(
+        "--scanner",
+        choices=scanners,
+        default="lex",
+        help="lexer to tokenize with (default: %(default)s)",
+    )
+    argparser.add_argument(
+        "--parser",
+        choices=parsers,
+        default="lr",
+        help="parser to parse with (default: %(default)s)",
+    )
+    argparser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="parse (or compile, for batch) in this many worker processes"
+        " (default: %(default)s)",
+    )
+    argparser.add_argument(
+        "--no-optimize",
+        dest="optimize",
+        action="store_false",
+        help="run and transpile programs as parsed, without folding constants",
+    )
+    commands = argparser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="execute a program")
+    run.add_argument("file")
+    run.add_argument(
+        "--engine",
+        choices=engines,
+        default="python",
+        help="execute the transpiled Python code, walk the AST, or run it"
+        " compiled to closures (default: %(default)s)",
+    )
+    run.add_argument(
+        "--interp",
+        action="store_true",
+        help="walk the AST, same as --engine tree",
+    )
+    run.set_defaults(func=cmd_run)
+
+    transpile = commands.add_parser("transpile", help="print the transpiled Python code")
+    transpile.add_argument("file")
+    transpile.set_defaults(func=cmd_transpile)
+
+    ast = commands.add_parser("ast", help="print the abstract syntax tree")
+    ast.add_argument("file")
+    ast.set_defaults(func=cmd_ast)
+
+    tokens = commands.add_parser("tokens", help="print the token stream")
+    tokens.add_argument("file")
+    tokens.set_defaults(func=cmd_tokens)
+
+    batch = commands.add_parser(
+        "batch", help="transpile every program in directories or glob patterns"
+    )
+    batch.add_argument("sources", nargs="+", metavar="source")
+    batch.add_argument(
+        "-o",
+        "--output",
+        help="write the transpiled code here, in the layout of the sources",
+    )
+    batch.add_argument(
+        "--ast",
+        action="store_true",
+        help="also write the abstract syntax trees to the output directory",
+    )
+    batch.set_defaults(func=cmd_batch)
+
+    return argparser
+
+
+def main(argv=None):
+    args = build_argparser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,4141 @@
+# bithonparse.py
+# This file is automatically generated by yacc.py. Do not edit.
+# pylint: disable=W,C,R
+
+from yacc import YaccSymbol
+from compiler import c_and, c_block, c_bool, c_break_statement, c_continue_statement, c_def_statement, c_div, c_env_call, c_equal, c_group, c_if_else_statement, c_if_statement, c_loop_statement, c_minus, c_mod, c_mul, c_nand, c_newline, c_nor, c_not, c_number, c_or, c_plus, c_power, c_program, c_return_statement, c_set_statement, c_string, c_xnor, c_xor, p_arg_append, p_statements_append
+
+_signature = '85f36675d5839eaedd0b26164d2736db7ba66dd5447f1e0b8d053e5fea6b96c4'
+
+_termids = {'$end': 2, 'AND': 3, 'BOOL': 4, 'BRK': 5, 'CNT': 6, 'DEDENT': 7, 'DEF': 8, 'DIV': 9, 'ELS': 10, 'EQUAL': 11, 'IDENT': 12, 'IFF': 13, 'INDENT': 14, 'LOP': 15, 'LPAREN': 16, 'MINUS': 17, 'MODULUS': 18, 'MUL': 19, 'NAND': 20, 'NEWLINE': 21, 'NOR': 22, 'NOT': 23, 'NUMBER': 24, 'OR': 25, 'PLUS': 26, 'POWER': 27, 'RET': 28, 'RPAREN': 29, 'SET': 30, 'STRING': 31, 'XNOR': 32, 'XOR': 33, 'error': 34}
+
+_goto_arg = (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 49, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 72, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0)
+_goto_block = (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 56, 58, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 78, 0, 0, 0, 0, 0, 0, 81, 0, 0)
+_goto_expression = (16, 0, 16, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 33, 0, 0, 50, 0, 0, 53, 0, 0, 0, 0, 0, 0, 54, 55, 0, 0, 0, 0, 0, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 50, 73, 0, 74, 75, 0, 0, 0, 0, 16, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 73, 0, 0, 79, 0, 16, 0, 0, 0, 0)
+_goto_function_call = (13, 0, 13, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 34, 0, 0, 34, 0, 0, 34, 0, 0, 0, 0, 0, 0, 34, 34, 0, 0, 0, 0, 0, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 0, 34, 34, 0, 0, 0, 0, 13, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 34, 0, 0, 34, 0, 13, 0, 0, 0, 0)
+_goto_statement = (3, 0, 30, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 30, 0, 0, 0, 0)
+_goto_statements = (2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 77, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0)
+_row0 = (0, 0, 0, 0, 27, 22, 23, 0, 17, 0, 0, 0, 18, 15, 0, 20, 28, 0, 0, 0, 0, 24, 0, 29, 25, 0, 0, 0, 21, 0, 19, 26, 0, 0, 0)
+_row1 = (0, 0, 82, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0)
+_row2 = (0, 0, 83, 0, 27, 22, 23, 0, 17, 0, 0, 0, 18, 15, 0, 20, 28, 0, 0, 0, 0, 24, 0, 29, 25, 0, 0, 0, 21, 0, 19, 26, 0, 0, 0)
+_row3 = (0, 0, 85, 0, 85, 85, 85, 85, 85, 0, 0, 0, 85, 85, 0, 85, 85, 0, 0, 0, 0, 85, 0, 85, 85, 0, 0, 0, 85, 0, 85, 85, 0, 0, 0)
+_row4 = (0, 0, 87, 0, 87, 87, 87, 87, 87, 0, 0, 0, 87, 87, 0, 87, 87, 0, 0, 0, 0, 87, 0, 87, 87, 0, 0, 0, 87, 0, 87, 87, 0, 0, 0)
+_row5 = (0, 0, 88, 0, 88, 88, 88, 88, 88, 0, 32, 0, 88, 88, 0, 88, 88, 0, 0, 0, 0, 88, 0, 88, 88, 0, 0, 0, 88, 0, 88, 88, 0, 0, 0)
+_row6 = (0, 0, 89, 0, 89, 89, 89, 89, 89, 0, 0, 0, 89, 89, 0, 89, 89, 0, 0, 0, 0, 89, 0, 89, 89, 0, 0, 0, 89, 0, 89, 89, 0, 0, 0)
+_row7 = (0, 0, 90, 0, 90, 90, 90, 90, 90, 0, 0, 0, 90, 90, 0, 90, 90, 0, 0, 0, 0, 90, 0, 90, 90, 0, 0, 0, 90, 0, 90, 90, 0, 0, 0)
+_row8 = (0, 0, 91, 0, 91, 91, 91, 91, 91, 0, 0, 0, 91, 91, 0, 91, 91, 0, 0, 0, 0, 91, 0, 91, 91, 0, 0, 0, 91, 0, 91, 91, 0, 0, 0)
+_row9 = (0, 0, 92, 0, 92, 92, 92, 92, 92, 0, 0, 0, 92, 92, 0, 92, 92, 0, 0, 0, 0, 92, 0, 92, 92, 0, 0, 0, 92, 0, 92, 92, 0, 0, 0)
+_row10 = (0, 0, 93, 0, 93, 93, 93, 93, 93, 0, 0, 0, 93, 93, 0, 93, 93, 0, 0, 0, 0, 93, 0, 93, 93, 0, 0, 0, 93, 0, 93, 93, 0, 0, 0)
+_row11 = (0, 0, 94, 0, 94, 94, 94, 94, 94, 0, 0, 0, 94, 94, 0, 94, 94, 0, 0, 0, 0, 94, 0, 94, 94, 0, 0, 0, 94, 0, 94, 94, 0, 0, 0)
+_row12 = (0, 0, 95, 0, 95, 95, 95, 95, 95, 0, 0, 0, 95, 95, 0, 95, 95, 0, 0, 0, 0, 95, 0, 95, 95, 0, 0, 0, 95, 0, 95, 95, 0, 0, 0)
+_row13 = (0, 0, 96, 112, 96, 96, 96, 96, 96, 112, 0, 112, 96, 96, 0, 96, 96, 112, 112, 112, 112, 96, 112, 96, 96, 112, 112, 112, 96, 0, 96, 96, 112, 112, 0)
+_row14 = (0, 0, 97, 0, 97, 97, 97, 97, 97, 0, 0, 0, 97, 97, 0, 97, 97, 0, 0, 0, 0, 97, 0, 97, 97, 0, 0, 0, 97, 0, 97, 97, 0, 0, 0)
+_row15 = (0, 0, 0, 0, 27, 0, 0, 0, 0, 0, 0, 0, 18, 0, 0, 0, 28, 0, 0, 0, 0, 0, 0, 29, 25, 0, 0, 0, 0, 0, 0, 26, 0, 0, 0)
+_row16 = (0, 0, 131, 41, 131, 131, 131, 131, 131, 37, 0, 47, 131, 131, 0, 131, 131, 39, 40, 36, 44, 131, 45, 131, 131, 42, 38, 35, 131, 0, 131, 131, 46, 43, 0)
+_row17 = (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 48, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0)
+_row18 = (0, 0, 107, 107, 27, 107, 107, 107, 107, 107, 0, 107, 18, 107, 107, 107, 28, 107, 107, 107, 107, 107, 107, 29, 25, 107, 107, 107, 107, 107, 107, 26, 107, 107, 0)
+_row19 = (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 51, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0)
+_row20 = (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 52, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0)
+_row21 = (0, 0, 0, 0, 27, 0, 0, 0, 0, 0, 0, 0, 18, 0, 0, 0, 28, 0, 0, 0, 0, 0, 0, 29, 25, 0, 0, 0, 0, 0, 0, 26, 0, 0, 0)
+_row22 = (0, 0, 129, 0, 129, 129, 129, 129, 129, 0, 0, 0, 129, 129, 0, 129, 129, 0, 0, 0, 0, 129, 0, 129, 129, 0, 0, 0, 129, 0, 129, 129, 0, 0, 0)
+_row23 = (0, 0, 130, 0, 130, 130, 130, 130, 130, 0, 0, 0, 130, 130, 0, 130, 130, 0, 0, 0, 0, 130, 0, 130, 130, 0, 0, 0, 130, 0, 130, 130, 0, 0, 0)
+_row24 = (0, 0, 98, 0, 98, 98, 98, 98, 98, 0, 0, 0, 98, 98, 0, 98, 98, 0, 0, 0, 0, 98, 0, 98, 98, 0, 0, 0, 98, 0, 98, 98, 0, 0, 0)
+_row25 = (0, 0, 109, 109, 109, 109, 109, 109, 109, 109, 0, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 0)
+_row26 = (0, 0, 110, 110, 110, 110, 110, 110, 110, 110, 0, 110, 110, 110, 110, 110, 110, 110, 110, 110, 110, 110, 110, 110, 110, 110, 110, 110, 110, 110, 110, 110, 110, 110, 0)
+_row27 = (0, 0, 111, 111, 111, 111, 111, 111, 111, 111, 0, 111, 111, 111, 111, 111, 111, 111, 111, 111, 111, 111, 111, 111, 111, 111, 111, 111, 111, 111, 111, 111, 111, 111, 0)
+_row28 = (0, 0, 0, 0, 27, 0, 0, 0, 0, 0, 0, 0, 18, 0, 0, 0, 28, 0, 0, 0, 0, 0, 0, 29, 25, 0, 0, 0, 0, 0, 0, 26, 0, 0, 0)
+_row29 = (0, 0, 0, 0, 27, 0, 0, 0, 0, 0, 0, 0, 18, 0, 0, 0, 28, 0, 0, 0, 0, 0, 0, 29, 25, 0, 0, 0, 0, 0, 0, 26, 0, 0, 0)
+_row30 = (0, 0, 86, 0, 86, 86, 86, 86, 86, 0, 0, 0, 86, 86, 0, 86, 86, 0, 0, 0, 0, 86, 0, 86, 86, 0, 0, 0, 86, 0, 86, 86, 0, 0, 0)
+_row31 = (0, 0, 101, 0, 101, 101, 101, 101, 101, 0, 0, 0, 101, 101, 0, 101, 101, 0, 0, 0, 0, 101, 0, 101, 101, 0, 0, 0, 101, 0, 101, 101, 0, 0, 0)
+_row32 = (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 57, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0)
+_row33 = (0, 0, 0, 41, 0, 0, 0, 0, 0, 37, 0, 47, 0, 0, 57, 0, 0, 39, 40, 36, 44, 0, 45, 0, 0, 42, 38, 35, 0, 0, 0, 0, 46, 43, 0)
+_row34 = (0, 0, 112, 112, 112, 112, 112, 112, 112, 112, 0, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 112, 0)
+_row35 = (0, 0, 0, 0, 27, 0, 0, 0, 0, 0, 0, 0, 18, 0, 0, 0, 28, 0, 0, 0, 0, 0, 0, 29, 25, 0, 0, 0, 0, 0, 0, 26, 0, 0, 0)
+_row36 = (0, 0, 0, 0, 27, 0, 0, 0, 0, 0, 0, 0, 18, 0, 0, 0, 28, 0, 0, 0, 0, 0, 0, 29, 25, 0, 0, 0, 0, 0, 0, 26, 0, 0, 0)
+_row37 = (0, 0, 0, 0, 27, 0, 0, 0, 0, 0, 0, 0, 18, 0, 0, 0, 28, 0, 0, 0, 0, 0, 0, 29, 25, 0, 0, 0, 0, 0, 0, 26, 0, 0, 0)
+_row38 = (0, 0, 0, 0, 27, 0, 0, 0, 0, 0, 0, 0, 18, 0, 0, 0, 28, 0, 0, 0, 0, 0, 0, 29, 25, 0, 0, 0, 0, 0, 0, 26, 0, 0, 0)
+_row39 = (0, 0, 0, 0, 27, 0, 0, 0, 0, 0, 0, 0, 18, 0, 0, 0, 28, 0, 0, 0, 0, 0, 0, 29, 25, 0, 0, 0, 0, 0, 0, 26, 0, 0, 0)
+_row40 = (0, 0, 0, 0, 27, 0, 0, 0, 0, 0, 0, 0, 18, 0, 0, 0, 28, 0, 0, 0, 0, 0, 0, 29, 25, 0, 0, 0, 0, 0, 0, 26, 0, 0, 0)
+_row41 = (0, 0, 0, 0, 27, 0, 0, 0, 0, 0, 0, 0, 18, 0, 0, 0, 28, 0, 0, 0, 0, 0, 0, 29, 25, 0, 0, 0, 0, 0, 0, 26, 0, 0, 0)
+_row42 = (0, 0, 0, 0, 27, 0, 0, 0, 0, 0, 0, 0, 18, 0, 0, 0, 28, 0, 0, 0, 0, 0, 0, 29, 25, 0, 0, 0, 0, 0, 0, 26, 0, 0, 0)
+_row43 = (0, 0, 0, 0, 27, 0, 0, 0, 0, 0, 0, 0, 18, 0, 0, 0, 28, 0, 0, 0, 0, 0, 0, 29, 25, 0, 0, 0, 0, 0, 0, 26, 0, 0, 0)
+_row44 = (0, 0, 0, 0, 27, 0, 0, 0, 0, 0, 0, 0, 18, 0, 0, 0, 28, 0, 0, 0, 0, 0, 0, 29, 25, 0, 0, 0, 0, 0, 0, 26, 0, 0, 0)
+_row45 = (0, 0, 0, 0, 27, 0, 0, 0, 0, 0, 0, 0, 18, 0, 0, 0, 28, 0, 0, 0, 0, 0, 0, 29, 25, 0, 0, 0, 0, 0, 0, 26, 0, 0, 0)
+_row46 = (0, 0, 0, 0, 27, 0, 0, 0, 0, 0, 0, 0, 18, 0, 0, 0, 28, 0, 0, 0, 0, 0, 0, 29, 25, 0, 0, 0, 0, 0, 0, 26, 0, 0, 0)
+_row47 = (0, 0, 0, 0, 27, 0, 0, 0, 0, 0, 0, 0, 18, 0, 0, 0, 28, 0, 0, 0, 0, 0, 0, 29, 25, 0, 0, 0, 0, 0, 0, 26, 0, 0, 0)
+_row48 = (0, 0, 0, 0, 27, 0, 0, 0, 0, 0, 0, 0, 18, 0, 107, 0, 28, 0, 0, 0, 0, 0, 0, 29, 25, 0, 0, 0, 0, 0, 0, 26, 0, 0, 0)
+_row49 = (0, 0, 99, 99, 27, 99, 99, 99, 99, 99, 0, 99, 18, 99, 99, 99, 28, 99, 99, 99, 99, 99, 99, 29, 25, 99, 99, 99, 99, 99, 99, 26, 99, 99, 0)
+_row50 = (0, 0, 105, 41, 105, 105, 105, 105, 105, 37, 0, 47, 105, 105, 105, 105, 105, 39, 40, 36, 44, 105, 45, 105, 105, 42, 38, 35, 105, 105, 105, 105, 46, 43, 0)
+_row51 = (0, 0, 0, 0, 27, 0, 0, 0, 0, 0, 0, 0, 18, 0, 0, 0, 28, 0, 0, 0, 0, 0, 0, 29, 25, 0, 0, 0, 0, 0, 0, 26, 0, 0, 0)
+_row52 = (0, 0, 0, 0, 27, 0, 0, 0, 0, 0, 0, 0, 18, 0, 0, 0, 28, 0, 0, 0, 0, 0, 0, 29, 25, 0, 0, 0, 0, 0, 0, 26, 0, 0, 0)
+_row53 = (0, 0, 128, 41, 128, 128, 128, 128, 128, 37, 0, 47, 128, 128, 0, 128, 128, 39, 40, 36, 44, 128, 45, 128, 128, 42, 38, 35, 128, 0, 128, 128, 46, 43, 0)
+_row54 = (0, 0, 0, 41, 0, 0, 0, 0, 0, 37, 0, 47, 0, 0, 0, 0, 0, 39, 40, 36, 44, 0, 45, 0, 0, 42, 38, 35, 0, 76, 0, 0, 46, 43, 0)
+_row55 = (0, 0, 120, 41, 120, 120, 120, 120, 120, 37, 0, 47, 120, 120, 120, 120, 120, 39, 40, 36, 44, 120, 45, 120, 120, 42, 38, 35, 120, 120, 120, 120, 46, 43, 0)
+_row56 = (0, 0, 102, 0, 102, 102, 102, 102, 102, 0, 0, 0, 102, 102, 0, 102, 102, 0, 0, 0, 0, 102, 0, 102, 102, 0, 0, 0, 102, 0, 102, 102, 0, 0, 0)
+_row57 = (0, 0, 0, 0, 27, 22, 23, 0, 17, 0, 0, 0, 18, 15, 0, 20, 28, 0, 0, 0, 0, 24, 0, 29, 25, 0, 0, 0, 21, 0, 19, 26, 0, 0, 0)
+_row58 = (0, 0, 100, 0, 100, 100, 100, 100, 100, 0, 100, 0, 100, 100, 0, 100, 100, 0, 0, 0, 0, 100, 0, 100, 100, 0, 0, 0, 100, 0, 100, 100, 0, 0, 0)
+_row59 = (0, 0, 114, 114, 114, 114, 114, 114, 114, 114, 0, 114, 114, 114, 114, 114, 114, 114, 114, 114, 114, 114, 114, 114, 114, 114, 114, 35, 114, 114, 114, 114, 114, 114, 0)
+_row60 = (0, 0, 115, 115, 115, 115, 115, 115, 115, 115, 0, 115, 115, 115, 115, 115, 115, 115, 115, 115, 115, 115, 115, 115, 115, 115, 115, 35, 115, 115, 115, 115, 115, 115, 0)
+_row61 = (0, 0, 116, 116, 116, 116, 116, 116, 116, 116, 0, 116, 116, 116, 116, 116, 116, 116, 116, 116, 116, 116, 116, 116, 116, 116, 116, 35, 116, 116, 116, 116, 116, 116, 0)
+_row62 = (0, 0, 117, 117, 117, 117, 117, 117, 117, 37, 0, 117, 117, 117, 117, 117, 117, 117, 40, 36, 117, 117, 117, 117, 117, 117, 117, 35, 117, 117, 117, 117, 117, 117, 0)
+_row63 = (0, 0, 118, 118, 118, 118, 118, 118, 118, 37, 0, 118, 118, 118, 118, 118, 118, 118, 40, 36, 118, 118, 118, 118, 118, 118, 118, 35, 118, 118, 118, 118, 118, 118, 0)
+_row64 = (0, 0, 119, 119, 119, 119, 119, 119, 119, 119, 0, 119, 119, 119, 119, 119, 119, 119, 119, 119, 119, 119, 119, 119, 119, 119, 119, 35, 119, 119, 119, 119, 119, 119, 0)
+_row65 = (0, 0, 121, 41, 121, 121, 121, 121, 121, 37, 0, 47, 121, 121, 121, 121, 121, 39, 40, 36, 44, 121, 45, 121, 121, 42, 38, 35, 121, 121, 121, 121, 46, 43, 0)
+_row66 = (0, 0, 122, 41, 122, 122, 122, 122, 122, 37, 0, 47, 122, 122, 122, 122, 122, 39, 40, 36, 44, 122, 45, 122, 122, 42, 38, 35, 122, 122, 122, 122, 46, 43, 0)
+_row67 = (0, 0, 123, 41, 123, 123, 123, 123, 123, 37, 0, 47, 123, 123, 123, 123, 123, 39, 40, 36, 44, 123, 45, 123, 123, 42, 38, 35, 123, 123, 123, 123, 46, 43, 0)
+_row68 = (0, 0, 124, 41, 124, 124, 124, 124, 124, 37, 0, 47, 124, 124, 124, 124, 124, 39, 40, 36, 44, 124, 45, 124, 124, 42, 38, 35, 124, 124, 124, 124, 46, 43, 0)
+_row69 = (0, 0, 125, 41, 125, 125, 125, 125, 125, 37, 0, 47, 125, 125, 125, 125, 125, 39, 40, 36, 44, 125, 45, 125, 125, 42, 38, 35, 125, 125, 125, 125, 46, 43, 0)
+_row70 = (0, 0, 126, 41, 126, 126, 126, 126, 126, 37, 0, 47, 126, 126, 126, 126, 126, 39, 40, 36, 44, 126, 45, 126, 126, 42, 38, 35, 126, 126, 126, 126, 46, 43, 0)
+_row71 = (0, 0, 127, 41, 127, 127, 127, 127, 127, 37, 0, 47, 127, 127, 127, 127, 127, 39, 40, 36, 44, 127, 45, 127, 127, 42, 38, 35, 127, 127, 127, 127, 46, 43, 0)
+_row72 = (0, 0, 0, 0, 27, 0, 0, 0, 0, 0, 0, 0, 18, 0, 57, 0, 28, 0, 0, 0, 0, 0, 0, 29, 25, 0, 0, 0, 0, 0, 0, 26, 0, 0, 0)
+_row73 = (0, 0, 106, 41, 106, 106, 106, 106, 106, 37, 0, 47, 106, 106, 106, 106, 106, 39, 40, 36, 44, 106, 45, 106, 106, 42, 38, 35, 106, 106, 106, 106, 46, 43, 0)
+_row74 = (0, 0, 104, 41, 104, 104, 104, 104, 104, 37, 0, 47, 104, 104, 0, 104, 104, 39, 40, 36, 44, 104, 45, 104, 104, 42, 38, 35, 104, 0, 104, 104, 46, 43, 0)
+_row75 = (0, 0, 0, 41, 27, 0, 0, 0, 0, 37, 0, 47, 18, 0, 0, 0, 28, 39, 40, 36, 44, 0, 45, 29, 25, 42, 38, 35, 0, 0, 0, 26, 46, 43, 0)
+_row76 = (0, 0, 113, 113, 113, 113, 113, 113, 113, 113, 0, 113, 113, 113, 113, 113, 113, 113, 113, 113, 113, 113, 113, 113, 113, 113, 113, 113, 113, 113, 113, 113, 113, 113, 0)
+_row77 = (0, 0, 0, 0, 27, 22, 23, 80, 17, 0, 0, 0, 18, 15, 0, 20, 28, 0, 0, 0, 0, 24, 0, 29, 25, 0, 0, 0, 21, 0, 19, 26, 0, 0, 0)
+_row78 = (0, 0, 103, 0, 103, 103, 103, 103, 103, 0, 0, 0, 103, 103, 0, 103, 103, 0, 0, 0, 0, 103, 0, 103, 103, 0, 0, 0, 103, 0, 103, 103, 0, 0, 0)
+_row79 = (0, 0, 0, 41, 0, 0, 0, 0, 0, 37, 0, 47, 0, 0, 57, 0, 0, 39, 40, 36, 44, 0, 45, 0, 0, 42, 38, 35, 0, 0, 0, 0, 46, 43, 0)
+_row80 = (0, 0, 84, 0, 84, 84, 84, 84, 84, 0, 84, 0, 84, 84, 0, 84, 84, 0, 0, 0, 0, 84, 0, 84, 84, 0, 0, 0, 84, 0, 84, 84, 0, 0, 0)
+_row81 = (0, 0, 108, 0, 108, 108, 108, 108, 108, 0, 0, 0, 108, 108, 0, 108, 108, 0, 0, 0, 0, 108, 0, 108, 108, 0, 0, 0, 108, 0, 108, 108, 0, 0, 0)
+
+
+class Parser:
+    def __init__(self, lrparser):
+        self.lrparser = lrparser  # Takes over at a syntax error
+
+    def clone(self):
+        return Parser(self.lrparser.clone())
+
+    def parse(self, input=None, lexer=None, debug=False, tracking=False):
+        if debug or tracking:
+            return self.lrparser.parse(input, lexer, debug, tracking)
+        if input is not None:
+            lexer.input(input)
+        get_token = lexer.token
+        statestack = [0]
+        valstack = [None]
+        state = 0
+        lookahead = None
+        while True:
+            if state < 41:
+                if state < 20:
+                    if state < 10:
+                        if state < 5:
+                            if state < 2:
+                                if state < 1:
+                                    if lookahead is None:
+                                        lookahead = get_token()
+                                        if lookahead is None:
+                                            lookahead = YaccSymbol()
+                                            lookahead.type = "$end"
+                                            lookahead.value = None
+                                        ltid = _termids.get(lookahead.type, 1)
+                                    t = _row0[ltid]
+                                    if t == 22:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row22[ltid] != 129:
+                                            state = 22
+                                            statestack.append(22)
+                                            continue
+                                        # break_statement -> BRK
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_break_statement()
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row10[ltid] != 93:
+                                            state = 10
+                                            statestack.append(10)
+                                            continue
+                                        # statement -> break_statement
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row3[ltid] != 85:
+                                            state = 3
+                                            statestack.append(3)
+                                            continue
+                                        # statements -> statement
+                                        v1 = valstack[-1]
+                                        valstack[-1] = [v1]
+                                        state = 2
+                                        statestack.append(2)
+                                        continue
+                                    if t == 23:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row23[ltid] != 130:
+                                            state = 23
+                                            statestack.append(23)
+                                            continue
+                                        # continue_statement -> CNT
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_continue_statement()
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row11[ltid] != 94:
+                                            state = 11
+                                            statestack.append(11)
+                                            continue
+                                        # statement -> continue_statement
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row3[ltid] != 85:
+                                            state = 3
+                                            statestack.append(3)
+                                            continue
+                                        # statements -> statement
+                                        v1 = valstack[-1]
+                                        valstack[-1] = [v1]
+                                        state = 2
+                                        statestack.append(2)
+                                        continue
+                                    if t == 24:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row24[ltid] != 98:
+                                            state = 24
+                                            statestack.append(24)
+                                            continue
+                                        # blankspace -> NEWLINE
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_newline()
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row14[ltid] != 97:
+                                            state = 14
+                                            statestack.append(14)
+                                            continue
+                                        # statement -> blankspace
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row3[ltid] != 85:
+                                            state = 3
+                                            statestack.append(3)
+                                            continue
+                                        # statements -> statement
+                                        v1 = valstack[-1]
+                                        valstack[-1] = [v1]
+                                        state = 2
+                                        statestack.append(2)
+                                        continue
+                                    if t == 25:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row25[ltid] != 109:
+                                            state = 25
+                                            statestack.append(25)
+                                            continue
+                                        # expression -> NUMBER
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_number(v1)
+                                        state = 16
+                                        statestack.append(16)
+                                        continue
+                                    if t == 26:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row26[ltid] != 110:
+                                            state = 26
+                                            statestack.append(26)
+                                            continue
+                                        # expression -> STRING
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_string(v1)
+                                        state = 16
+                                        statestack.append(16)
+                                        continue
+                                    if t == 27:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row27[ltid] != 111:
+                                            state = 27
+                                            statestack.append(27)
+                                            continue
+                                        # expression -> BOOL
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_bool(v1)
+                                        state = 16
+                                        statestack.append(16)
+                                        continue
+                                    if 0 < t < 82:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        state = t
+                                        statestack.append(t)
+                                        continue
+                                    return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                                else:
+                                    if lookahead is None:
+                                        lookahead = get_token()
+                                        if lookahead is None:
+                                            lookahead = YaccSymbol()
+                                            lookahead.type = "$end"
+                                            lookahead.value = None
+                                        ltid = _termids.get(lookahead.type, 1)
+                                    t = _row1[ltid]
+                                    if t == 82:
+                                        return valstack[-1]
+                                    return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                            else:
+                                if state < 3:
+                                    if lookahead is None:
+                                        lookahead = get_token()
+                                        if lookahead is None:
+                                            lookahead = YaccSymbol()
+                                            lookahead.type = "$end"
+                                            lookahead.value = None
+                                        ltid = _termids.get(lookahead.type, 1)
+                                    t = _row2[ltid]
+                                    if t == 22:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row22[ltid] != 129:
+                                            state = 22
+                                            statestack.append(22)
+                                            continue
+                                        # break_statement -> BRK
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_break_statement()
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row10[ltid] != 93:
+                                            state = 10
+                                            statestack.append(10)
+                                            continue
+                                        # statement -> break_statement
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row30[ltid] != 86:
+                                            state = 30
+                                            statestack.append(30)
+                                            continue
+                                        # statements -> statements statement
+                                        v1, v2 = valstack[-2:]
+                                        del valstack[-1:]
+                                        valstack[-1] = p_statements_append(v1, v2)
+                                        del statestack[-1:]
+                                        state = _goto_statements[statestack[-1]]
+                                        statestack.append(state)
+                                        continue
+                                    if t == 23:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row23[ltid] != 130:
+                                            state = 23
+                                            statestack.append(23)
+                                            continue
+                                        # continue_statement -> CNT
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_continue_statement()
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row11[ltid] != 94:
+                                            state = 11
+                                            statestack.append(11)
+                                            continue
+                                        # statement -> continue_statement
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row30[ltid] != 86:
+                                            state = 30
+                                            statestack.append(30)
+                                            continue
+                                        # statements -> statements statement
+                                        v1, v2 = valstack[-2:]
+                                        del valstack[-1:]
+                                        valstack[-1] = p_statements_append(v1, v2)
+                                        del statestack[-1:]
+                                        state = _goto_statements[statestack[-1]]
+                                        statestack.append(state)
+                                        continue
+                                    if t == 24:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row24[ltid] != 98:
+                                            state = 24
+                                            statestack.append(24)
+                                            continue
+                                        # blankspace -> NEWLINE
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_newline()
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row14[ltid] != 97:
+                                            state = 14
+                                            statestack.append(14)
+                                            continue
+                                        # statement -> blankspace
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row30[ltid] != 86:
+                                            state = 30
+                                            statestack.append(30)
+                                            continue
+                                        # statements -> statements statement
+                                        v1, v2 = valstack[-2:]
+                                        del valstack[-1:]
+                                        valstack[-1] = p_statements_append(v1, v2)
+                                        del statestack[-1:]
+                                        state = _goto_statements[statestack[-1]]
+                                        statestack.append(state)
+                                        continue
+                                    if t == 25:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row25[ltid] != 109:
+                                            state = 25
+                                            statestack.append(25)
+                                            continue
+                                        # expression -> NUMBER
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_number(v1)
+                                        state = 16
+                                        statestack.append(16)
+                                        continue
+                                    if t == 26:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row26[ltid] != 110:
+                                            state = 26
+                                            statestack.append(26)
+                                            continue
+                                        # expression -> STRING
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_string(v1)
+                                        state = 16
+                                        statestack.append(16)
+                                        continue
+                                    if t == 27:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row27[ltid] != 111:
+                                            state = 27
+                                            statestack.append(27)
+                                            continue
+                                        # expression -> BOOL
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_bool(v1)
+                                        state = 16
+                                        statestack.append(16)
+                                        continue
+                                    if 0 < t < 82:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        state = t
+                                        statestack.append(t)
+                                        continue
+                                    if t == 83:
+                                        # program -> statements
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_program(v1)
+                                        state = statestack[-1] = 1
+                                        continue
+                                    return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                                else:
+                                    if state < 4:
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        t = _row3[ltid]
+                                        if t == 85:
+                                            # statements -> statement
+                                            v1 = valstack[-1]
+                                            valstack[-1] = [v1]
+                                            state = _goto_statements[statestack[-2]]
+                                            statestack[-1] = state
+                                            continue
+                                        return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                                    else:
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        t = _row4[ltid]
+                                        if t == 87:
+                                            # statement -> if_else_statement
+                                            state = _goto_statement[statestack[-2]]
+                                            statestack[-1] = state
+                                            continue
+                                        return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                        else:
+                            if state < 7:
+                                if state < 6:
+                                    if lookahead is None:
+                                        lookahead = get_token()
+                                        if lookahead is None:
+                                            lookahead = YaccSymbol()
+                                            lookahead.type = "$end"
+                                            lookahead.value = None
+                                        ltid = _termids.get(lookahead.type, 1)
+                                    t = _row5[ltid]
+                                    if 0 < t < 82:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        state = t
+                                        statestack.append(t)
+                                        continue
+                                    if t == 88:
+                                        # statement -> if_statement
+                                        state = _goto_statement[statestack[-2]]
+                                        statestack[-1] = state
+                                        continue
+                                    return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                                else:
+                                    if lookahead is None:
+                                        lookahead = get_token()
+                                        if lookahead is None:
+                                            lookahead = YaccSymbol()
+                                            lookahead.type = "$end"
+                                            lookahead.value = None
+                                        ltid = _termids.get(lookahead.type, 1)
+                                    t = _row6[ltid]
+                                    if t == 89:
+                                        # statement -> def_statement
+                                        state = _goto_statement[statestack[-2]]
+                                        statestack[-1] = state
+                                        continue
+                                    return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                            else:
+                                if state < 8:
+                                    if lookahead is None:
+                                        lookahead = get_token()
+                                        if lookahead is None:
+                                            lookahead = YaccSymbol()
+                                            lookahead.type = "$end"
+                                            lookahead.value = None
+                                        ltid = _termids.get(lookahead.type, 1)
+                                    t = _row7[ltid]
+                                    if t == 90:
+                                        # statement -> set_statement
+                                        state = _goto_statement[statestack[-2]]
+                                        statestack[-1] = state
+                                        continue
+                                    return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                                else:
+                                    if state < 9:
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        t = _row8[ltid]
+                                        if t == 91:
+                                            # statement -> loop_statement
+                                            state = _goto_statement[statestack[-2]]
+                                            statestack[-1] = state
+                                            continue
+                                        return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                                    else:
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        t = _row9[ltid]
+                                        if t == 92:
+                                            # statement -> return_statement
+                                            state = _goto_statement[statestack[-2]]
+                                            statestack[-1] = state
+                                            continue
+                                        return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                    else:
+                        if state < 15:
+                            if state < 12:
+                                if state < 11:
+                                    if lookahead is None:
+                                        lookahead = get_token()
+                                        if lookahead is None:
+                                            lookahead = YaccSymbol()
+                                            lookahead.type = "$end"
+                                            lookahead.value = None
+                                        ltid = _termids.get(lookahead.type, 1)
+                                    t = _row10[ltid]
+                                    if t == 93:
+                                        # statement -> break_statement
+                                        state = _goto_statement[statestack[-2]]
+                                        statestack[-1] = state
+                                        continue
+                                    return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                                else:
+                                    if lookahead is None:
+                                        lookahead = get_token()
+                                        if lookahead is None:
+                                            lookahead = YaccSymbol()
+                                            lookahead.type = "$end"
+                                            lookahead.value = None
+                                        ltid = _termids.get(lookahead.type, 1)
+                                    t = _row11[ltid]
+                                    if t == 94:
+                                        # statement -> continue_statement
+                                        state = _goto_statement[statestack[-2]]
+                                        statestack[-1] = state
+                                        continue
+                                    return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                            else:
+                                if state < 13:
+                                    if lookahead is None:
+                                        lookahead = get_token()
+                                        if lookahead is None:
+                                            lookahead = YaccSymbol()
+                                            lookahead.type = "$end"
+                                            lookahead.value = None
+                                        ltid = _termids.get(lookahead.type, 1)
+                                    t = _row12[ltid]
+                                    if t == 95:
+                                        # statement -> expression_statement
+                                        state = _goto_statement[statestack[-2]]
+                                        statestack[-1] = state
+                                        continue
+                                    return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                                else:
+                                    if state < 14:
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        t = _row13[ltid]
+                                        if t == 96:
+                                            # statement -> function_call
+                                            state = _goto_statement[statestack[-2]]
+                                            statestack[-1] = state
+                                            continue
+                                        if t == 112:
+                                            # expression -> function_call
+                                            state = _goto_expression[statestack[-2]]
+                                            statestack[-1] = state
+                                            continue
+                                        return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                                    else:
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        t = _row14[ltid]
+                                        if t == 97:
+                                            # statement -> blankspace
+                                            state = _goto_statement[statestack[-2]]
+                                            statestack[-1] = state
+                                            continue
+                                        return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                        else:
+                            if state < 17:
+                                if state < 16:
+                                    if lookahead is None:
+                                        lookahead = get_token()
+                                        if lookahead is None:
+                                            lookahead = YaccSymbol()
+                                            lookahead.type = "$end"
+                                            lookahead.value = None
+                                        ltid = _termids.get(lookahead.type, 1)
+                                    t = _row15[ltid]
+                                    if t == 25:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row25[ltid] != 109:
+                                            state = 25
+                                            statestack.append(25)
+                                            continue
+                                        # expression -> NUMBER
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_number(v1)
+                                        state = 33
+                                        statestack.append(33)
+                                        continue
+                                    if t == 26:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row26[ltid] != 110:
+                                            state = 26
+                                            statestack.append(26)
+                                            continue
+                                        # expression -> STRING
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_string(v1)
+                                        state = 33
+                                        statestack.append(33)
+                                        continue
+                                    if t == 27:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row27[ltid] != 111:
+                                            state = 27
+                                            statestack.append(27)
+                                            continue
+                                        # expression -> BOOL
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_bool(v1)
+                                        state = 33
+                                        statestack.append(33)
+                                        continue
+                                    if 0 < t < 82:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        state = t
+                                        statestack.append(t)
+                                        continue
+                                    return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                                else:
+                                    if lookahead is None:
+                                        lookahead = get_token()
+                                        if lookahead is None:
+                                            lookahead = YaccSymbol()
+                                            lookahead.type = "$end"
+                                            lookahead.value = None
+                                        ltid = _termids.get(lookahead.type, 1)
+                                    t = _row16[ltid]
+                                    if 0 < t < 82:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        state = t
+                                        statestack.append(t)
+                                        continue
+                                    if t == 131:
+                                        # expression_statement -> expression
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row12[ltid] != 95:
+                                            state = statestack[-1] = 12
+                                            continue
+                                        # statement -> expression_statement
+                                        state = _goto_statement[statestack[-2]]
+                                        statestack[-1] = state
+                                        continue
+                                    return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                            else:
+                                if state < 18:
+                                    if lookahead is None:
+                                        lookahead = get_token()
+                                        if lookahead is None:
+                                            lookahead = YaccSymbol()
+                                            lookahead.type = "$end"
+                                            lookahead.value = None
+                                        ltid = _termids.get(lookahead.type, 1)
+                                    t = _row17[ltid]
+                                    if 0 < t < 82:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        state = t
+                                        statestack.append(t)
+                                        continue
+                                    return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                                else:
+                                    if state < 19:
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        t = _row18[ltid]
+                                        if t == 25:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            if lookahead is None:
+                                                lookahead = get_token()
+                                                if lookahead is None:
+                                                    lookahead = YaccSymbol()
+                                                    lookahead.type = "$end"
+                                                    lookahead.value = None
+                                                ltid = _termids.get(lookahead.type, 1)
+                                            if _row25[ltid] != 109:
+                                                state = 25
+                                                statestack.append(25)
+                                                continue
+                                            # expression -> NUMBER
+                                            v1 = valstack[-1]
+                                            valstack[-1] = c_number(v1)
+                                            state = 50
+                                            statestack.append(50)
+                                            continue
+                                        if t == 26:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            if lookahead is None:
+                                                lookahead = get_token()
+                                                if lookahead is None:
+                                                    lookahead = YaccSymbol()
+                                                    lookahead.type = "$end"
+                                                    lookahead.value = None
+                                                ltid = _termids.get(lookahead.type, 1)
+                                            if _row26[ltid] != 110:
+                                                state = 26
+                                                statestack.append(26)
+                                                continue
+                                            # expression -> STRING
+                                            v1 = valstack[-1]
+                                            valstack[-1] = c_string(v1)
+                                            state = 50
+                                            statestack.append(50)
+                                            continue
+                                        if t == 27:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            if lookahead is None:
+                                                lookahead = get_token()
+                                                if lookahead is None:
+                                                    lookahead = YaccSymbol()
+                                                    lookahead.type = "$end"
+                                                    lookahead.value = None
+                                                ltid = _termids.get(lookahead.type, 1)
+                                            if _row27[ltid] != 111:
+                                                state = 27
+                                                statestack.append(27)
+                                                continue
+                                            # expression -> BOOL
+                                            v1 = valstack[-1]
+                                            valstack[-1] = c_bool(v1)
+                                            state = 50
+                                            statestack.append(50)
+                                            continue
+                                        if 0 < t < 82:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            state = t
+                                            statestack.append(t)
+                                            continue
+                                        if t == 107:
+                                            # arg -> <empty>
+                                            valstack.append([])
+                                            state = 49
+                                            statestack.append(49)
+                                            continue
+                                        return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                                    else:
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        t = _row19[ltid]
+                                        if 0 < t < 82:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            state = t
+                                            statestack.append(t)
+                                            continue
+                                        return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                else:
+                    if state < 30:
+                        if state < 25:
+                            if state < 22:
+                                if state < 21:
+                                    if lookahead is None:
+                                        lookahead = get_token()
+                                        if lookahead is None:
+                                            lookahead = YaccSymbol()
+                                            lookahead.type = "$end"
+                                            lookahead.value = None
+                                        ltid = _termids.get(lookahead.type, 1)
+                                    t = _row20[ltid]
+                                    if 0 < t < 82:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        state = t
+                                        statestack.append(t)
+                                        continue
+                                    return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                                else:
+                                    if lookahead is None:
+                                        lookahead = get_token()
+                                        if lookahead is None:
+                                            lookahead = YaccSymbol()
+                                            lookahead.type = "$end"
+                                            lookahead.value = None
+                                        ltid = _termids.get(lookahead.type, 1)
+                                    t = _row21[ltid]
+                                    if t == 25:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row25[ltid] != 109:
+                                            state = 25
+                                            statestack.append(25)
+                                            continue
+                                        # expression -> NUMBER
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_number(v1)
+                                        state = 53
+                                        statestack.append(53)
+                                        continue
+                                    if t == 26:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row26[ltid] != 110:
+                                            state = 26
+                                            statestack.append(26)
+                                            continue
+                                        # expression -> STRING
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_string(v1)
+                                        state = 53
+                                        statestack.append(53)
+                                        continue
+                                    if t == 27:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row27[ltid] != 111:
+                                            state = 27
+                                            statestack.append(27)
+                                            continue
+                                        # expression -> BOOL
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_bool(v1)
+                                        state = 53
+                                        statestack.append(53)
+                                        continue
+                                    if 0 < t < 82:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        state = t
+                                        statestack.append(t)
+                                        continue
+                                    return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                            else:
+                                if state < 23:
+                                    if lookahead is None:
+                                        lookahead = get_token()
+                                        if lookahead is None:
+                                            lookahead = YaccSymbol()
+                                            lookahead.type = "$end"
+                                            lookahead.value = None
+                                        ltid = _termids.get(lookahead.type, 1)
+                                    t = _row22[ltid]
+                                    if t == 129:
+                                        # break_statement -> BRK
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_break_statement()
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row10[ltid] != 93:
+                                            state = statestack[-1] = 10
+                                            continue
+                                        # statement -> break_statement
+                                        state = _goto_statement[statestack[-2]]
+                                        statestack[-1] = state
+                                        continue
+                                    return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                                else:
+                                    if state < 24:
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        t = _row23[ltid]
+                                        if t == 130:
+                                            # continue_statement -> CNT
+                                            v1 = valstack[-1]
+                                            valstack[-1] = c_continue_statement()
+                                            if lookahead is None:
+                                                lookahead = get_token()
+                                                if lookahead is None:
+                                                    lookahead = YaccSymbol()
+                                                    lookahead.type = "$end"
+                                                    lookahead.value = None
+                                                ltid = _termids.get(lookahead.type, 1)
+                                            if _row11[ltid] != 94:
+                                                state = statestack[-1] = 11
+                                                continue
+                                            # statement -> continue_statement
+                                            state = _goto_statement[statestack[-2]]
+                                            statestack[-1] = state
+                                            continue
+                                        return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                                    else:
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        t = _row24[ltid]
+                                        if t == 98:
+                                            # blankspace -> NEWLINE
+                                            v1 = valstack[-1]
+                                            valstack[-1] = c_newline()
+                                            if lookahead is None:
+                                                lookahead = get_token()
+                                                if lookahead is None:
+                                                    lookahead = YaccSymbol()
+                                                    lookahead.type = "$end"
+                                                    lookahead.value = None
+                                                ltid = _termids.get(lookahead.type, 1)
+                                            if _row14[ltid] != 97:
+                                                state = statestack[-1] = 14
+                                                continue
+                                            # statement -> blankspace
+                                            state = _goto_statement[statestack[-2]]
+                                            statestack[-1] = state
+                                            continue
+                                        return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                        else:
+                            if state < 27:
+                                if state < 26:
+                                    if lookahead is None:
+                                        lookahead = get_token()
+                                        if lookahead is None:
+                                            lookahead = YaccSymbol()
+                                            lookahead.type = "$end"
+                                            lookahead.value = None
+                                        ltid = _termids.get(lookahead.type, 1)
+                                    t = _row25[ltid]
+                                    if t == 109:
+                                        # expression -> NUMBER
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_number(v1)
+                                        state = _goto_expression[statestack[-2]]
+                                        statestack[-1] = state
+                                        continue
+                                    return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                                else:
+                                    if lookahead is None:
+                                        lookahead = get_token()
+                                        if lookahead is None:
+                                            lookahead = YaccSymbol()
+                                            lookahead.type = "$end"
+                                            lookahead.value = None
+                                        ltid = _termids.get(lookahead.type, 1)
+                                    t = _row26[ltid]
+                                    if t == 110:
+                                        # expression -> STRING
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_string(v1)
+                                        state = _goto_expression[statestack[-2]]
+                                        statestack[-1] = state
+                                        continue
+                                    return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                            else:
+                                if state < 28:
+                                    if lookahead is None:
+                                        lookahead = get_token()
+                                        if lookahead is None:
+                                            lookahead = YaccSymbol()
+                                            lookahead.type = "$end"
+                                            lookahead.value = None
+                                        ltid = _termids.get(lookahead.type, 1)
+                                    t = _row27[ltid]
+                                    if t == 111:
+                                        # expression -> BOOL
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_bool(v1)
+                                        state = _goto_expression[statestack[-2]]
+                                        statestack[-1] = state
+                                        continue
+                                    return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                                else:
+                                    if state < 29:
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        t = _row28[ltid]
+                                        if t == 25:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            if lookahead is None:
+                                                lookahead = get_token()
+                                                if lookahead is None:
+                                                    lookahead = YaccSymbol()
+                                                    lookahead.type = "$end"
+                                                    lookahead.value = None
+                                                ltid = _termids.get(lookahead.type, 1)
+                                            if _row25[ltid] != 109:
+                                                state = 25
+                                                statestack.append(25)
+                                                continue
+                                            # expression -> NUMBER
+                                            v1 = valstack[-1]
+                                            valstack[-1] = c_number(v1)
+                                            state = 54
+                                            statestack.append(54)
+                                            continue
+                                        if t == 26:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            if lookahead is None:
+                                                lookahead = get_token()
+                                                if lookahead is None:
+                                                    lookahead = YaccSymbol()
+                                                    lookahead.type = "$end"
+                                                    lookahead.value = None
+                                                ltid = _termids.get(lookahead.type, 1)
+                                            if _row26[ltid] != 110:
+                                                state = 26
+                                                statestack.append(26)
+                                                continue
+                                            # expression -> STRING
+                                            v1 = valstack[-1]
+                                            valstack[-1] = c_string(v1)
+                                            state = 54
+                                            statestack.append(54)
+                                            continue
+                                        if t == 27:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            if lookahead is None:
+                                                lookahead = get_token()
+                                                if lookahead is None:
+                                                    lookahead = YaccSymbol()
+                                                    lookahead.type = "$end"
+                                                    lookahead.value = None
+                                                ltid = _termids.get(lookahead.type, 1)
+                                            if _row27[ltid] != 111:
+                                                state = 27
+                                                statestack.append(27)
+                                                continue
+                                            # expression -> BOOL
+                                            v1 = valstack[-1]
+                                            valstack[-1] = c_bool(v1)
+                                            state = 54
+                                            statestack.append(54)
+                                            continue
+                                        if 0 < t < 82:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            state = t
+                                            statestack.append(t)
+                                            continue
+                                        return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                                    else:
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        t = _row29[ltid]
+                                        if t == 25:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            if lookahead is None:
+                                                lookahead = get_token()
+                                                if lookahead is None:
+                                                    lookahead = YaccSymbol()
+                                                    lookahead.type = "$end"
+                                                    lookahead.value = None
+                                                ltid = _termids.get(lookahead.type, 1)
+                                            if _row25[ltid] != 109:
+                                                state = 25
+                                                statestack.append(25)
+                                                continue
+                                            # expression -> NUMBER
+                                            v1 = valstack[-1]
+                                            valstack[-1] = c_number(v1)
+                                            state = 55
+                                            statestack.append(55)
+                                            continue
+                                        if t == 26:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            if lookahead is None:
+                                                lookahead = get_token()
+                                                if lookahead is None:
+                                                    lookahead = YaccSymbol()
+                                                    lookahead.type = "$end"
+                                                    lookahead.value = None
+                                                ltid = _termids.get(lookahead.type, 1)
+                                            if _row26[ltid] != 110:
+                                                state = 26
+                                                statestack.append(26)
+                                                continue
+                                            # expression -> STRING
+                                            v1 = valstack[-1]
+                                            valstack[-1] = c_string(v1)
+                                            state = 55
+                                            statestack.append(55)
+                                            continue
+                                        if t == 27:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            if lookahead is None:
+                                                lookahead = get_token()
+                                                if lookahead is None:
+                                                    lookahead = YaccSymbol()
+                                                    lookahead.type = "$end"
+                                                    lookahead.value = None
+                                                ltid = _termids.get(lookahead.type, 1)
+                                            if _row27[ltid] != 111:
+                                                state = 27
+                                                statestack.append(27)
+                                                continue
+                                            # expression -> BOOL
+                                            v1 = valstack[-1]
+                                            valstack[-1] = c_bool(v1)
+                                            state = 55
+                                            statestack.append(55)
+                                            continue
+                                        if 0 < t < 82:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            state = t
+                                            statestack.append(t)
+                                            continue
+                                        return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                    else:
+                        if state < 35:
+                            if state < 32:
+                                if state < 31:
+                                    if lookahead is None:
+                                        lookahead = get_token()
+                                        if lookahead is None:
+                                            lookahead = YaccSymbol()
+                                            lookahead.type = "$end"
+                                            lookahead.value = None
+                                        ltid = _termids.get(lookahead.type, 1)
+                                    t = _row30[ltid]
+                                    if t == 86:
+                                        # statements -> statements statement
+                                        v1, v2 = valstack[-2:]
+                                        del valstack[-1:]
+                                        valstack[-1] = p_statements_append(v1, v2)
+                                        del statestack[-1:]
+                                        state = _goto_statements[statestack[-2]]
+                                        statestack[-1] = state
+                                        continue
+                                    return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                                else:
+                                    if lookahead is None:
+                                        lookahead = get_token()
+                                        if lookahead is None:
+                                            lookahead = YaccSymbol()
+                                            lookahead.type = "$end"
+                                            lookahead.value = None
+                                        ltid = _termids.get(lookahead.type, 1)
+                                    t = _row31[ltid]
+                                    if t == 101:
+                                        # if_else_statement -> if_statement else_statement
+                                        v1, v2 = valstack[-2:]
+                                        del valstack[-1:]
+                                        valstack[-1] = c_if_else_statement(v1, v2)
+                                        del statestack[-1:]
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row4[ltid] != 87:
+                                            state = statestack[-1] = 4
+                                            continue
+                                        # statement -> if_else_statement
+                                        state = _goto_statement[statestack[-2]]
+                                        statestack[-1] = state
+                                        continue
+                                    return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                            else:
+                                if state < 33:
+                                    if lookahead is None:
+                                        lookahead = get_token()
+                                        if lookahead is None:
+                                            lookahead = YaccSymbol()
+                                            lookahead.type = "$end"
+                                            lookahead.value = None
+                                        ltid = _termids.get(lookahead.type, 1)
+                                    t = _row32[ltid]
+                                    if 0 < t < 82:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        state = t
+                                        statestack.append(t)
+                                        continue
+                                    return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                                else:
+                                    if state < 34:
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        t = _row33[ltid]
+                                        if 0 < t < 82:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            state = t
+                                            statestack.append(t)
+                                            continue
+                                        return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                                    else:
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        t = _row34[ltid]
+                                        if t == 112:
+                                            # expression -> function_call
+                                            state = _goto_expression[statestack[-2]]
+                                            statestack[-1] = state
+                                            continue
+                                        return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                        else:
+                            if state < 38:
+                                if state < 36:
+                                    if lookahead is None:
+                                        lookahead = get_token()
+                                        if lookahead is None:
+                                            lookahead = YaccSymbol()
+                                            lookahead.type = "$end"
+                                            lookahead.value = None
+                                        ltid = _termids.get(lookahead.type, 1)
+                                    t = _row35[ltid]
+                                    if t == 25:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row25[ltid] != 109:
+                                            state = 25
+                                            statestack.append(25)
+                                            continue
+                                        # expression -> NUMBER
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_number(v1)
+                                        state = 59
+                                        statestack.append(59)
+                                        continue
+                                    if t == 26:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row26[ltid] != 110:
+                                            state = 26
+                                            statestack.append(26)
+                                            continue
+                                        # expression -> STRING
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_string(v1)
+                                        state = 59
+                                        statestack.append(59)
+                                        continue
+                                    if t == 27:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row27[ltid] != 111:
+                                            state = 27
+                                            statestack.append(27)
+                                            continue
+                                        # expression -> BOOL
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_bool(v1)
+                                        state = 59
+                                        statestack.append(59)
+                                        continue
+                                    if 0 < t < 82:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        state = t
+                                        statestack.append(t)
+                                        continue
+                                    return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                                else:
+                                    if state < 37:
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        t = _row36[ltid]
+                                        if t == 25:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            if lookahead is None:
+                                                lookahead = get_token()
+                                                if lookahead is None:
+                                                    lookahead = YaccSymbol()
+                                                    lookahead.type = "$end"
+                                                    lookahead.value = None
+                                                ltid = _termids.get(lookahead.type, 1)
+                                            if _row25[ltid] != 109:
+                                                state = 25
+                                                statestack.append(25)
+                                                continue
+                                            # expression -> NUMBER
+                                            v1 = valstack[-1]
+                                            valstack[-1] = c_number(v1)
+                                            state = 60
+                                            statestack.append(60)
+                                            continue
+                                        if t == 26:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            if lookahead is None:
+                                                lookahead = get_token()
+                                                if lookahead is None:
+                                                    lookahead = YaccSymbol()
+                                                    lookahead.type = "$end"
+                                                    lookahead.value = None
+                                                ltid = _termids.get(lookahead.type, 1)
+                                            if _row26[ltid] != 110:
+                                                state = 26
+                                                statestack.append(26)
+                                                continue
+                                            # expression -> STRING
+                                            v1 = valstack[-1]
+                                            valstack[-1] = c_string(v1)
+                                            state = 60
+                                            statestack.append(60)
+                                            continue
+                                        if t == 27:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            if lookahead is None:
+                                                lookahead = get_token()
+                                                if lookahead is None:
+                                                    lookahead = YaccSymbol()
+                                                    lookahead.type = "$end"
+                                                    lookahead.value = None
+                                                ltid = _termids.get(lookahead.type, 1)
+                                            if _row27[ltid] != 111:
+                                                state = 27
+                                                statestack.append(27)
+                                                continue
+                                            # expression -> BOOL
+                                            v1 = valstack[-1]
+                                            valstack[-1] = c_bool(v1)
+                                            state = 60
+                                            statestack.append(60)
+                                            continue
+                                        if 0 < t < 82:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            state = t
+                                            statestack.append(t)
+                                            continue
+                                        return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                                    else:
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        t = _row37[ltid]
+                                        if t == 25:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            if lookahead is None:
+                                                lookahead = get_token()
+                                                if lookahead is None:
+                                                    lookahead = YaccSymbol()
+                                                    lookahead.type = "$end"
+                                                    lookahead.value = None
+                                                ltid = _termids.get(lookahead.type, 1)
+                                            if _row25[ltid] != 109:
+                                                state = 25
+                                                statestack.append(25)
+                                                continue
+                                            # expression -> NUMBER
+                                            v1 = valstack[-1]
+                                            valstack[-1] = c_number(v1)
+                                            state = 61
+                                            statestack.append(61)
+                                            continue
+                                        if t == 26:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            if lookahead is None:
+                                                lookahead = get_token()
+                                                if lookahead is None:
+                                                    lookahead = YaccSymbol()
+                                                    lookahead.type = "$end"
+                                                    lookahead.value = None
+                                                ltid = _termids.get(lookahead.type, 1)
+                                            if _row26[ltid] != 110:
+                                                state = 26
+                                                statestack.append(26)
+                                                continue
+                                            # expression -> STRING
+                                            v1 = valstack[-1]
+                                            valstack[-1] = c_string(v1)
+                                            state = 61
+                                            statestack.append(61)
+                                            continue
+                                        if t == 27:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            if lookahead is None:
+                                                lookahead = get_token()
+                                                if lookahead is None:
+                                                    lookahead = YaccSymbol()
+                                                    lookahead.type = "$end"
+                                                    lookahead.value = None
+                                                ltid = _termids.get(lookahead.type, 1)
+                                            if _row27[ltid] != 111:
+                                                state = 27
+                                                statestack.append(27)
+                                                continue
+                                            # expression -> BOOL
+                                            v1 = valstack[-1]
+                                            valstack[-1] = c_bool(v1)
+                                            state = 61
+                                            statestack.append(61)
+                                            continue
+                                        if 0 < t < 82:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            state = t
+                                            statestack.append(t)
+                                            continue
+                                        return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                            else:
+                                if state < 39:
+                                    if lookahead is None:
+                                        lookahead = get_token()
+                                        if lookahead is None:
+                                            lookahead = YaccSymbol()
+                                            lookahead.type = "$end"
+                                            lookahead.value = None
+                                        ltid = _termids.get(lookahead.type, 1)
+                                    t = _row38[ltid]
+                                    if t == 25:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row25[ltid] != 109:
+                                            state = 25
+                                            statestack.append(25)
+                                            continue
+                                        # expression -> NUMBER
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_number(v1)
+                                        state = 62
+                                        statestack.append(62)
+                                        continue
+                                    if t == 26:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row26[ltid] != 110:
+                                            state = 26
+                                            statestack.append(26)
+                                            continue
+                                        # expression -> STRING
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_string(v1)
+                                        state = 62
+                                        statestack.append(62)
+                                        continue
+                                    if t == 27:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row27[ltid] != 111:
+                                            state = 27
+                                            statestack.append(27)
+                                            continue
+                                        # expression -> BOOL
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_bool(v1)
+                                        state = 62
+                                        statestack.append(62)
+                                        continue
+                                    if 0 < t < 82:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        state = t
+                                        statestack.append(t)
+                                        continue
+                                    return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                                else:
+                                    if state < 40:
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        t = _row39[ltid]
+                                        if t == 25:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            if lookahead is None:
+                                                lookahead = get_token()
+                                                if lookahead is None:
+                                                    lookahead = YaccSymbol()
+                                                    lookahead.type = "$end"
+                                                    lookahead.value = None
+                                                ltid = _termids.get(lookahead.type, 1)
+                                            if _row25[ltid] != 109:
+                                                state = 25
+                                                statestack.append(25)
+                                                continue
+                                            # expression -> NUMBER
+                                            v1 = valstack[-1]
+                                            valstack[-1] = c_number(v1)
+                                            state = 63
+                                            statestack.append(63)
+                                            continue
+                                        if t == 26:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            if lookahead is None:
+                                                lookahead = get_token()
+                                                if lookahead is None:
+                                                    lookahead = YaccSymbol()
+                                                    lookahead.type = "$end"
+                                                    lookahead.value = None
+                                                ltid = _termids.get(lookahead.type, 1)
+                                            if _row26[ltid] != 110:
+                                                state = 26
+                                                statestack.append(26)
+                                                continue
+                                            # expression -> STRING
+                                            v1 = valstack[-1]
+                                            valstack[-1] = c_string(v1)
+                                            state = 63
+                                            statestack.append(63)
+                                            continue
+                                        if t == 27:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            if lookahead is None:
+                                                lookahead = get_token()
+                                                if lookahead is None:
+                                                    lookahead = YaccSymbol()
+                                                    lookahead.type = "$end"
+                                                    lookahead.value = None
+                                                ltid = _termids.get(lookahead.type, 1)
+                                            if _row27[ltid] != 111:
+                                                state = 27
+                                                statestack.append(27)
+                                                continue
+                                            # expression -> BOOL
+                                            v1 = valstack[-1]
+                                            valstack[-1] = c_bool(v1)
+                                            state = 63
+                                            statestack.append(63)
+                                            continue
+                                        if 0 < t < 82:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            state = t
+                                            statestack.append(t)
+                                            continue
+                                        return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                                    else:
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        t = _row40[ltid]
+                                        if t == 25:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            if lookahead is None:
+                                                lookahead = get_token()
+                                                if lookahead is None:
+                                                    lookahead = YaccSymbol()
+                                                    lookahead.type = "$end"
+                                                    lookahead.value = None
+                                                ltid = _termids.get(lookahead.type, 1)
+                                            if _row25[ltid] != 109:
+                                                state = 25
+                                                statestack.append(25)
+                                                continue
+                                            # expression -> NUMBER
+                                            v1 = valstack[-1]
+                                            valstack[-1] = c_number(v1)
+                                            state = 64
+                                            statestack.append(64)
+                                            continue
+                                        if t == 26:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            if lookahead is None:
+                                                lookahead = get_token()
+                                                if lookahead is None:
+                                                    lookahead = YaccSymbol()
+                                                    lookahead.type = "$end"
+                                                    lookahead.value = None
+                                                ltid = _termids.get(lookahead.type, 1)
+                                            if _row26[ltid] != 110:
+                                                state = 26
+                                                statestack.append(26)
+                                                continue
+                                            # expression -> STRING
+                                            v1 = valstack[-1]
+                                            valstack[-1] = c_string(v1)
+                                            state = 64
+                                            statestack.append(64)
+                                            continue
+                                        if t == 27:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            if lookahead is None:
+                                                lookahead = get_token()
+                                                if lookahead is None:
+                                                    lookahead = YaccSymbol()
+                                                    lookahead.type = "$end"
+                                                    lookahead.value = None
+                                                ltid = _termids.get(lookahead.type, 1)
+                                            if _row27[ltid] != 111:
+                                                state = 27
+                                                statestack.append(27)
+                                                continue
+                                            # expression -> BOOL
+                                            v1 = valstack[-1]
+                                            valstack[-1] = c_bool(v1)
+                                            state = 64
+                                            statestack.append(64)
+                                            continue
+                                        if 0 < t < 82:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            state = t
+                                            statestack.append(t)
+                                            continue
+                                        return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+            else:
+                if state < 61:
+                    if state < 51:
+                        if state < 46:
+                            if state < 43:
+                                if state < 42:
+                                    if lookahead is None:
+                                        lookahead = get_token()
+                                        if lookahead is None:
+                                            lookahead = YaccSymbol()
+                                            lookahead.type = "$end"
+                                            lookahead.value = None
+                                        ltid = _termids.get(lookahead.type, 1)
+                                    t = _row41[ltid]
+                                    if t == 25:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row25[ltid] != 109:
+                                            state = 25
+                                            statestack.append(25)
+                                            continue
+                                        # expression -> NUMBER
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_number(v1)
+                                        state = 65
+                                        statestack.append(65)
+                                        continue
+                                    if t == 26:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row26[ltid] != 110:
+                                            state = 26
+                                            statestack.append(26)
+                                            continue
+                                        # expression -> STRING
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_string(v1)
+                                        state = 65
+                                        statestack.append(65)
+                                        continue
+                                    if t == 27:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row27[ltid] != 111:
+                                            state = 27
+                                            statestack.append(27)
+                                            continue
+                                        # expression -> BOOL
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_bool(v1)
+                                        state = 65
+                                        statestack.append(65)
+                                        continue
+                                    if 0 < t < 82:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        state = t
+                                        statestack.append(t)
+                                        continue
+                                    return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                                else:
+                                    if lookahead is None:
+                                        lookahead = get_token()
+                                        if lookahead is None:
+                                            lookahead = YaccSymbol()
+                                            lookahead.type = "$end"
+                                            lookahead.value = None
+                                        ltid = _termids.get(lookahead.type, 1)
+                                    t = _row42[ltid]
+                                    if t == 25:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row25[ltid] != 109:
+                                            state = 25
+                                            statestack.append(25)
+                                            continue
+                                        # expression -> NUMBER
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_number(v1)
+                                        state = 66
+                                        statestack.append(66)
+                                        continue
+                                    if t == 26:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row26[ltid] != 110:
+                                            state = 26
+                                            statestack.append(26)
+                                            continue
+                                        # expression -> STRING
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_string(v1)
+                                        state = 66
+                                        statestack.append(66)
+                                        continue
+                                    if t == 27:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row27[ltid] != 111:
+                                            state = 27
+                                            statestack.append(27)
+                                            continue
+                                        # expression -> BOOL
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_bool(v1)
+                                        state = 66
+                                        statestack.append(66)
+                                        continue
+                                    if 0 < t < 82:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        state = t
+                                        statestack.append(t)
+                                        continue
+                                    return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                            else:
+                                if state < 44:
+                                    if lookahead is None:
+                                        lookahead = get_token()
+                                        if lookahead is None:
+                                            lookahead = YaccSymbol()
+                                            lookahead.type = "$end"
+                                            lookahead.value = None
+                                        ltid = _termids.get(lookahead.type, 1)
+                                    t = _row43[ltid]
+                                    if t == 25:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row25[ltid] != 109:
+                                            state = 25
+                                            statestack.append(25)
+                                            continue
+                                        # expression -> NUMBER
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_number(v1)
+                                        state = 67
+                                        statestack.append(67)
+                                        continue
+                                    if t == 26:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row26[ltid] != 110:
+                                            state = 26
+                                            statestack.append(26)
+                                            continue
+                                        # expression -> STRING
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_string(v1)
+                                        state = 67
+                                        statestack.append(67)
+                                        continue
+                                    if t == 27:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row27[ltid] != 111:
+                                            state = 27
+                                            statestack.append(27)
+                                            continue
+                                        # expression -> BOOL
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_bool(v1)
+                                        state = 67
+                                        statestack.append(67)
+                                        continue
+                                    if 0 < t < 82:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        state = t
+                                        statestack.append(t)
+                                        continue
+                                    return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                                else:
+                                    if state < 45:
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        t = _row44[ltid]
+                                        if t == 25:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            if lookahead is None:
+                                                lookahead = get_token()
+                                                if lookahead is None:
+                                                    lookahead = YaccSymbol()
+                                                    lookahead.type = "$end"
+                                                    lookahead.value = None
+                                                ltid = _termids.get(lookahead.type, 1)
+                                            if _row25[ltid] != 109:
+                                                state = 25
+                                                statestack.append(25)
+                                                continue
+                                            # expression -> NUMBER
+                                            v1 = valstack[-1]
+                                            valstack[-1] = c_number(v1)
+                                            state = 68
+                                            statestack.append(68)
+                                            continue
+                                        if t == 26:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            if lookahead is None:
+                                                lookahead = get_token()
+                                                if lookahead is None:
+                                                    lookahead = YaccSymbol()
+                                                    lookahead.type = "$end"
+                                                    lookahead.value = None
+                                                ltid = _termids.get(lookahead.type, 1)
+                                            if _row26[ltid] != 110:
+                                                state = 26
+                                                statestack.append(26)
+                                                continue
+                                            # expression -> STRING
+                                            v1 = valstack[-1]
+                                            valstack[-1] = c_string(v1)
+                                            state = 68
+                                            statestack.append(68)
+                                            continue
+                                        if t == 27:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            if lookahead is None:
+                                                lookahead = get_token()
+                                                if lookahead is None:
+                                                    lookahead = YaccSymbol()
+                                                    lookahead.type = "$end"
+                                                    lookahead.value = None
+                                                ltid = _termids.get(lookahead.type, 1)
+                                            if _row27[ltid] != 111:
+                                                state = 27
+                                                statestack.append(27)
+                                                continue
+                                            # expression -> BOOL
+                                            v1 = valstack[-1]
+                                            valstack[-1] = c_bool(v1)
+                                            state = 68
+                                            statestack.append(68)
+                                            continue
+                                        if 0 < t < 82:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            state = t
+                                            statestack.append(t)
+                                            continue
+                                        return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                                    else:
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        t = _row45[ltid]
+                                        if t == 25:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            if lookahead is None:
+                                                lookahead = get_token()
+                                                if lookahead is None:
+                                                    lookahead = YaccSymbol()
+                                                    lookahead.type = "$end"
+                                                    lookahead.value = None
+                                                ltid = _termids.get(lookahead.type, 1)
+                                            if _row25[ltid] != 109:
+                                                state = 25
+                                                statestack.append(25)
+                                                continue
+                                            # expression -> NUMBER
+                                            v1 = valstack[-1]
+                                            valstack[-1] = c_number(v1)
+                                            state = 69
+                                            statestack.append(69)
+                                            continue
+                                        if t == 26:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            if lookahead is None:
+                                                lookahead = get_token()
+                                                if lookahead is None:
+                                                    lookahead = YaccSymbol()
+                                                    lookahead.type = "$end"
+                                                    lookahead.value = None
+                                                ltid = _termids.get(lookahead.type, 1)
+                                            if _row26[ltid] != 110:
+                                                state = 26
+                                                statestack.append(26)
+                                                continue
+                                            # expression -> STRING
+                                            v1 = valstack[-1]
+                                            valstack[-1] = c_string(v1)
+                                            state = 69
+                                            statestack.append(69)
+                                            continue
+                                        if t == 27:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            if lookahead is None:
+                                                lookahead = get_token()
+                                                if lookahead is None:
+                                                    lookahead = YaccSymbol()
+                                                    lookahead.type = "$end"
+                                                    lookahead.value = None
+                                                ltid = _termids.get(lookahead.type, 1)
+                                            if _row27[ltid] != 111:
+                                                state = 27
+                                                statestack.append(27)
+                                                continue
+                                            # expression -> BOOL
+                                            v1 = valstack[-1]
+                                            valstack[-1] = c_bool(v1)
+                                            state = 69
+                                            statestack.append(69)
+                                            continue
+                                        if 0 < t < 82:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            state = t
+                                            statestack.append(t)
+                                            continue
+                                        return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                        else:
+                            if state < 48:
+                                if state < 47:
+                                    if lookahead is None:
+                                        lookahead = get_token()
+                                        if lookahead is None:
+                                            lookahead = YaccSymbol()
+                                            lookahead.type = "$end"
+                                            lookahead.value = None
+                                        ltid = _termids.get(lookahead.type, 1)
+                                    t = _row46[ltid]
+                                    if t == 25:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row25[ltid] != 109:
+                                            state = 25
+                                            statestack.append(25)
+                                            continue
+                                        # expression -> NUMBER
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_number(v1)
+                                        state = 70
+                                        statestack.append(70)
+                                        continue
+                                    if t == 26:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row26[ltid] != 110:
+                                            state = 26
+                                            statestack.append(26)
+                                            continue
+                                        # expression -> STRING
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_string(v1)
+                                        state = 70
+                                        statestack.append(70)
+                                        continue
+                                    if t == 27:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row27[ltid] != 111:
+                                            state = 27
+                                            statestack.append(27)
+                                            continue
+                                        # expression -> BOOL
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_bool(v1)
+                                        state = 70
+                                        statestack.append(70)
+                                        continue
+                                    if 0 < t < 82:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        state = t
+                                        statestack.append(t)
+                                        continue
+                                    return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                                else:
+                                    if lookahead is None:
+                                        lookahead = get_token()
+                                        if lookahead is None:
+                                            lookahead = YaccSymbol()
+                                            lookahead.type = "$end"
+                                            lookahead.value = None
+                                        ltid = _termids.get(lookahead.type, 1)
+                                    t = _row47[ltid]
+                                    if t == 25:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row25[ltid] != 109:
+                                            state = 25
+                                            statestack.append(25)
+                                            continue
+                                        # expression -> NUMBER
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_number(v1)
+                                        state = 71
+                                        statestack.append(71)
+                                        continue
+                                    if t == 26:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row26[ltid] != 110:
+                                            state = 26
+                                            statestack.append(26)
+                                            continue
+                                        # expression -> STRING
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_string(v1)
+                                        state = 71
+                                        statestack.append(71)
+                                        continue
+                                    if t == 27:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row27[ltid] != 111:
+                                            state = 27
+                                            statestack.append(27)
+                                            continue
+                                        # expression -> BOOL
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_bool(v1)
+                                        state = 71
+                                        statestack.append(71)
+                                        continue
+                                    if 0 < t < 82:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        state = t
+                                        statestack.append(t)
+                                        continue
+                                    return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                            else:
+                                if state < 49:
+                                    if lookahead is None:
+                                        lookahead = get_token()
+                                        if lookahead is None:
+                                            lookahead = YaccSymbol()
+                                            lookahead.type = "$end"
+                                            lookahead.value = None
+                                        ltid = _termids.get(lookahead.type, 1)
+                                    t = _row48[ltid]
+                                    if t == 25:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row25[ltid] != 109:
+                                            state = 25
+                                            statestack.append(25)
+                                            continue
+                                        # expression -> NUMBER
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_number(v1)
+                                        state = 50
+                                        statestack.append(50)
+                                        continue
+                                    if t == 26:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row26[ltid] != 110:
+                                            state = 26
+                                            statestack.append(26)
+                                            continue
+                                        # expression -> STRING
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_string(v1)
+                                        state = 50
+                                        statestack.append(50)
+                                        continue
+                                    if t == 27:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row27[ltid] != 111:
+                                            state = 27
+                                            statestack.append(27)
+                                            continue
+                                        # expression -> BOOL
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_bool(v1)
+                                        state = 50
+                                        statestack.append(50)
+                                        continue
+                                    if 0 < t < 82:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        state = t
+                                        statestack.append(t)
+                                        continue
+                                    if t == 107:
+                                        # arg -> <empty>
+                                        valstack.append([])
+                                        state = 72
+                                        statestack.append(72)
+                                        continue
+                                    return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                                else:
+                                    if state < 50:
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        t = _row49[ltid]
+                                        if t == 25:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            if lookahead is None:
+                                                lookahead = get_token()
+                                                if lookahead is None:
+                                                    lookahead = YaccSymbol()
+                                                    lookahead.type = "$end"
+                                                    lookahead.value = None
+                                                ltid = _termids.get(lookahead.type, 1)
+                                            if _row25[ltid] != 109:
+                                                state = 25
+                                                statestack.append(25)
+                                                continue
+                                            # expression -> NUMBER
+                                            v1 = valstack[-1]
+                                            valstack[-1] = c_number(v1)
+                                            state = 73
+                                            statestack.append(73)
+                                            continue
+                                        if t == 26:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            if lookahead is None:
+                                                lookahead = get_token()
+                                                if lookahead is None:
+                                                    lookahead = YaccSymbol()
+                                                    lookahead.type = "$end"
+                                                    lookahead.value = None
+                                                ltid = _termids.get(lookahead.type, 1)
+                                            if _row26[ltid] != 110:
+                                                state = 26
+                                                statestack.append(26)
+                                                continue
+                                            # expression -> STRING
+                                            v1 = valstack[-1]
+                                            valstack[-1] = c_string(v1)
+                                            state = 73
+                                            statestack.append(73)
+                                            continue
+                                        if t == 27:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            if lookahead is None:
+                                                lookahead = get_token()
+                                                if lookahead is None:
+                                                    lookahead = YaccSymbol()
+                                                    lookahead.type = "$end"
+                                                    lookahead.value = None
+                                                ltid = _termids.get(lookahead.type, 1)
+                                            if _row27[ltid] != 111:
+                                                state = 27
+                                                statestack.append(27)
+                                                continue
+                                            # expression -> BOOL
+                                            v1 = valstack[-1]
+                                            valstack[-1] = c_bool(v1)
+                                            state = 73
+                                            statestack.append(73)
+                                            continue
+                                        if 0 < t < 82:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            state = t
+                                            statestack.append(t)
+                                            continue
+                                        if t == 99:
+                                            # function_call -> IDENT arg
+                                            v1, v2 = valstack[-2:]
+                                            del valstack[-1:]
+                                            valstack[-1] = c_env_call(v1, v2)
+                                            del statestack[-1:]
+                                            state = _goto_function_call[statestack[-2]]
+                                            statestack[-1] = state
+                                            continue
+                                        return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                                    else:
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        t = _row50[ltid]
+                                        if 0 < t < 82:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            state = t
+                                            statestack.append(t)
+                                            continue
+                                        if t == 105:
+                                            # arg -> expression
+                                            v1 = valstack[-1]
+                                            valstack[-1] = [v1]
+                                            state = _goto_arg[statestack[-2]]
+                                            statestack[-1] = state
+                                            continue
+                                        return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                    else:
+                        if state < 56:
+                            if state < 53:
+                                if state < 52:
+                                    if lookahead is None:
+                                        lookahead = get_token()
+                                        if lookahead is None:
+                                            lookahead = YaccSymbol()
+                                            lookahead.type = "$end"
+                                            lookahead.value = None
+                                        ltid = _termids.get(lookahead.type, 1)
+                                    t = _row51[ltid]
+                                    if t == 25:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row25[ltid] != 109:
+                                            state = 25
+                                            statestack.append(25)
+                                            continue
+                                        # expression -> NUMBER
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_number(v1)
+                                        state = 74
+                                        statestack.append(74)
+                                        continue
+                                    if t == 26:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row26[ltid] != 110:
+                                            state = 26
+                                            statestack.append(26)
+                                            continue
+                                        # expression -> STRING
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_string(v1)
+                                        state = 74
+                                        statestack.append(74)
+                                        continue
+                                    if t == 27:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row27[ltid] != 111:
+                                            state = 27
+                                            statestack.append(27)
+                                            continue
+                                        # expression -> BOOL
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_bool(v1)
+                                        state = 74
+                                        statestack.append(74)
+                                        continue
+                                    if 0 < t < 82:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        state = t
+                                        statestack.append(t)
+                                        continue
+                                    return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                                else:
+                                    if lookahead is None:
+                                        lookahead = get_token()
+                                        if lookahead is None:
+                                            lookahead = YaccSymbol()
+                                            lookahead.type = "$end"
+                                            lookahead.value = None
+                                        ltid = _termids.get(lookahead.type, 1)
+                                    t = _row52[ltid]
+                                    if t == 25:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row25[ltid] != 109:
+                                            state = 25
+                                            statestack.append(25)
+                                            continue
+                                        # expression -> NUMBER
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_number(v1)
+                                        state = 75
+                                        statestack.append(75)
+                                        continue
+                                    if t == 26:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row26[ltid] != 110:
+                                            state = 26
+                                            statestack.append(26)
+                                            continue
+                                        # expression -> STRING
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_string(v1)
+                                        state = 75
+                                        statestack.append(75)
+                                        continue
+                                    if t == 27:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row27[ltid] != 111:
+                                            state = 27
+                                            statestack.append(27)
+                                            continue
+                                        # expression -> BOOL
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_bool(v1)
+                                        state = 75
+                                        statestack.append(75)
+                                        continue
+                                    if 0 < t < 82:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        state = t
+                                        statestack.append(t)
+                                        continue
+                                    return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                            else:
+                                if state < 54:
+                                    if lookahead is None:
+                                        lookahead = get_token()
+                                        if lookahead is None:
+                                            lookahead = YaccSymbol()
+                                            lookahead.type = "$end"
+                                            lookahead.value = None
+                                        ltid = _termids.get(lookahead.type, 1)
+                                    t = _row53[ltid]
+                                    if 0 < t < 82:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        state = t
+                                        statestack.append(t)
+                                        continue
+                                    if t == 128:
+                                        # return_statement -> RET expression
+                                        v1, v2 = valstack[-2:]
+                                        del valstack[-1:]
+                                        valstack[-1] = c_return_statement(v2)
+                                        del statestack[-1:]
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row9[ltid] != 92:
+                                            state = statestack[-1] = 9
+                                            continue
+                                        # statement -> return_statement
+                                        state = _goto_statement[statestack[-2]]
+                                        statestack[-1] = state
+                                        continue
+                                    return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                                else:
+                                    if state < 55:
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        t = _row54[ltid]
+                                        if t == 76:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            if lookahead is None:
+                                                lookahead = get_token()
+                                                if lookahead is None:
+                                                    lookahead = YaccSymbol()
+                                                    lookahead.type = "$end"
+                                                    lookahead.value = None
+                                                ltid = _termids.get(lookahead.type, 1)
+                                            if _row76[ltid] != 113:
+                                                state = 76
+                                                statestack.append(76)
+                                                continue
+                                            # expression -> LPAREN expression RPAREN
+                                            v1, v2, v3 = valstack[-3:]
+                                            del valstack[-2:]
+                                            valstack[-1] = c_group(v2)
+                                            del statestack[-2:]
+                                            state = _goto_expression[statestack[-1]]
+                                            statestack.append(state)
+                                            continue
+                                        if 0 < t < 82:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            state = t
+                                            statestack.append(t)
+                                            continue
+                                        return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                                    else:
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        t = _row55[ltid]
+                                        if 0 < t < 82:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            state = t
+                                            statestack.append(t)
+                                            continue
+                                        if t == 120:
+                                            # expression -> NOT expression
+                                            v1, v2 = valstack[-2:]
+                                            del valstack[-1:]
+                                            valstack[-1] = c_not(v2)
+                                            del statestack[-1:]
+                                            state = _goto_expression[statestack[-2]]
+                                            statestack[-1] = state
+                                            continue
+                                        return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                        else:
+                            if state < 58:
+                                if state < 57:
+                                    if lookahead is None:
+                                        lookahead = get_token()
+                                        if lookahead is None:
+                                            lookahead = YaccSymbol()
+                                            lookahead.type = "$end"
+                                            lookahead.value = None
+                                        ltid = _termids.get(lookahead.type, 1)
+                                    t = _row56[ltid]
+                                    if t == 102:
+                                        # else_statement -> ELS block
+                                        v1, v2 = valstack[-2:]
+                                        del valstack[-1:]
+                                        valstack[-1] = v2
+                                        del statestack[-1:]
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row31[ltid] != 101:
+                                            state = statestack[-1] = 31
+                                            continue
+                                        # if_else_statement -> if_statement else_statement
+                                        v1, v2 = valstack[-2:]
+                                        del valstack[-1:]
+                                        valstack[-1] = c_if_else_statement(v1, v2)
+                                        del statestack[-1:]
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row4[ltid] != 87:
+                                            state = statestack[-1] = 4
+                                            continue
+                                        # statement -> if_else_statement
+                                        state = _goto_statement[statestack[-2]]
+                                        statestack[-1] = state
+                                        continue
+                                    return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                                else:
+                                    if lookahead is None:
+                                        lookahead = get_token()
+                                        if lookahead is None:
+                                            lookahead = YaccSymbol()
+                                            lookahead.type = "$end"
+                                            lookahead.value = None
+                                        ltid = _termids.get(lookahead.type, 1)
+                                    t = _row57[ltid]
+                                    if t == 22:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row22[ltid] != 129:
+                                            state = 22
+                                            statestack.append(22)
+                                            continue
+                                        # break_statement -> BRK
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_break_statement()
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row10[ltid] != 93:
+                                            state = 10
+                                            statestack.append(10)
+                                            continue
+                                        # statement -> break_statement
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row3[ltid] != 85:
+                                            state = 3
+                                            statestack.append(3)
+                                            continue
+                                        # statements -> statement
+                                        v1 = valstack[-1]
+                                        valstack[-1] = [v1]
+                                        state = 77
+                                        statestack.append(77)
+                                        continue
+                                    if t == 23:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row23[ltid] != 130:
+                                            state = 23
+                                            statestack.append(23)
+                                            continue
+                                        # continue_statement -> CNT
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_continue_statement()
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row11[ltid] != 94:
+                                            state = 11
+                                            statestack.append(11)
+                                            continue
+                                        # statement -> continue_statement
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row3[ltid] != 85:
+                                            state = 3
+                                            statestack.append(3)
+                                            continue
+                                        # statements -> statement
+                                        v1 = valstack[-1]
+                                        valstack[-1] = [v1]
+                                        state = 77
+                                        statestack.append(77)
+                                        continue
+                                    if t == 24:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row24[ltid] != 98:
+                                            state = 24
+                                            statestack.append(24)
+                                            continue
+                                        # blankspace -> NEWLINE
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_newline()
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row14[ltid] != 97:
+                                            state = 14
+                                            statestack.append(14)
+                                            continue
+                                        # statement -> blankspace
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row3[ltid] != 85:
+                                            state = 3
+                                            statestack.append(3)
+                                            continue
+                                        # statements -> statement
+                                        v1 = valstack[-1]
+                                        valstack[-1] = [v1]
+                                        state = 77
+                                        statestack.append(77)
+                                        continue
+                                    if t == 25:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row25[ltid] != 109:
+                                            state = 25
+                                            statestack.append(25)
+                                            continue
+                                        # expression -> NUMBER
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_number(v1)
+                                        state = 16
+                                        statestack.append(16)
+                                        continue
+                                    if t == 26:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row26[ltid] != 110:
+                                            state = 26
+                                            statestack.append(26)
+                                            continue
+                                        # expression -> STRING
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_string(v1)
+                                        state = 16
+                                        statestack.append(16)
+                                        continue
+                                    if t == 27:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row27[ltid] != 111:
+                                            state = 27
+                                            statestack.append(27)
+                                            continue
+                                        # expression -> BOOL
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_bool(v1)
+                                        state = 16
+                                        statestack.append(16)
+                                        continue
+                                    if 0 < t < 82:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        state = t
+                                        statestack.append(t)
+                                        continue
+                                    return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                            else:
+                                if state < 59:
+                                    if lookahead is None:
+                                        lookahead = get_token()
+                                        if lookahead is None:
+                                            lookahead = YaccSymbol()
+                                            lookahead.type = "$end"
+                                            lookahead.value = None
+                                        ltid = _termids.get(lookahead.type, 1)
+                                    t = _row58[ltid]
+                                    if t == 100:
+                                        # if_statement -> IFF expression block
+                                        v1, v2, v3 = valstack[-3:]
+                                        del valstack[-2:]
+                                        valstack[-1] = c_if_statement(v2, v3)
+                                        del statestack[-2:]
+                                        state = statestack[-1] = 5
+                                        continue
+                                    return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                                else:
+                                    if state < 60:
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        t = _row59[ltid]
+                                        if 0 < t < 82:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            state = t
+                                            statestack.append(t)
+                                            continue
+                                        if t == 114:
+                                            # expression -> expression POWER expression
+                                            v1, v2, v3 = valstack[-3:]
+                                            del valstack[-2:]
+                                            valstack[-1] = c_power(v1, v3)
+                                            del statestack[-2:]
+                                            state = _goto_expression[statestack[-2]]
+                                            statestack[-1] = state
+                                            continue
+                                        return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                                    else:
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        t = _row60[ltid]
+                                        if 0 < t < 82:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            state = t
+                                            statestack.append(t)
+                                            continue
+                                        if t == 115:
+                                            # expression -> expression MUL expression
+                                            v1, v2, v3 = valstack[-3:]
+                                            del valstack[-2:]
+                                            valstack[-1] = c_mul(v1, v3)
+                                            del statestack[-2:]
+                                            state = _goto_expression[statestack[-2]]
+                                            statestack[-1] = state
+                                            continue
+                                        return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                else:
+                    if state < 71:
+                        if state < 66:
+                            if state < 63:
+                                if state < 62:
+                                    if lookahead is None:
+                                        lookahead = get_token()
+                                        if lookahead is None:
+                                            lookahead = YaccSymbol()
+                                            lookahead.type = "$end"
+                                            lookahead.value = None
+                                        ltid = _termids.get(lookahead.type, 1)
+                                    t = _row61[ltid]
+                                    if 0 < t < 82:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        state = t
+                                        statestack.append(t)
+                                        continue
+                                    if t == 116:
+                                        # expression -> expression DIV expression
+                                        v1, v2, v3 = valstack[-3:]
+                                        del valstack[-2:]
+                                        valstack[-1] = c_div(v1, v3)
+                                        del statestack[-2:]
+                                        state = _goto_expression[statestack[-2]]
+                                        statestack[-1] = state
+                                        continue
+                                    return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                                else:
+                                    if lookahead is None:
+                                        lookahead = get_token()
+                                        if lookahead is None:
+                                            lookahead = YaccSymbol()
+                                            lookahead.type = "$end"
+                                            lookahead.value = None
+                                        ltid = _termids.get(lookahead.type, 1)
+                                    t = _row62[ltid]
+                                    if 0 < t < 82:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        state = t
+                                        statestack.append(t)
+                                        continue
+                                    if t == 117:
+                                        # expression -> expression PLUS expression
+                                        v1, v2, v3 = valstack[-3:]
+                                        del valstack[-2:]
+                                        valstack[-1] = c_plus(v1, v3)
+                                        del statestack[-2:]
+                                        state = _goto_expression[statestack[-2]]
+                                        statestack[-1] = state
+                                        continue
+                                    return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                            else:
+                                if state < 64:
+                                    if lookahead is None:
+                                        lookahead = get_token()
+                                        if lookahead is None:
+                                            lookahead = YaccSymbol()
+                                            lookahead.type = "$end"
+                                            lookahead.value = None
+                                        ltid = _termids.get(lookahead.type, 1)
+                                    t = _row63[ltid]
+                                    if 0 < t < 82:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        state = t
+                                        statestack.append(t)
+                                        continue
+                                    if t == 118:
+                                        # expression -> expression MINUS expression
+                                        v1, v2, v3 = valstack[-3:]
+                                        del valstack[-2:]
+                                        valstack[-1] = c_minus(v1, v3)
+                                        del statestack[-2:]
+                                        state = _goto_expression[statestack[-2]]
+                                        statestack[-1] = state
+                                        continue
+                                    return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                                else:
+                                    if state < 65:
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        t = _row64[ltid]
+                                        if 0 < t < 82:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            state = t
+                                            statestack.append(t)
+                                            continue
+                                        if t == 119:
+                                            # expression -> expression MODULUS expression
+                                            v1, v2, v3 = valstack[-3:]
+                                            del valstack[-2:]
+                                            valstack[-1] = c_mod(v1, v3)
+                                            del statestack[-2:]
+                                            state = _goto_expression[statestack[-2]]
+                                            statestack[-1] = state
+                                            continue
+                                        return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                                    else:
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        t = _row65[ltid]
+                                        if 0 < t < 82:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            state = t
+                                            statestack.append(t)
+                                            continue
+                                        if t == 121:
+                                            # expression -> expression AND expression
+                                            v1, v2, v3 = valstack[-3:]
+                                            del valstack[-2:]
+                                            valstack[-1] = c_and(v1, v3)
+                                            del statestack[-2:]
+                                            state = _goto_expression[statestack[-2]]
+                                            statestack[-1] = state
+                                            continue
+                                        return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                        else:
+                            if state < 68:
+                                if state < 67:
+                                    if lookahead is None:
+                                        lookahead = get_token()
+                                        if lookahead is None:
+                                            lookahead = YaccSymbol()
+                                            lookahead.type = "$end"
+                                            lookahead.value = None
+                                        ltid = _termids.get(lookahead.type, 1)
+                                    t = _row66[ltid]
+                                    if 0 < t < 82:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        state = t
+                                        statestack.append(t)
+                                        continue
+                                    if t == 122:
+                                        # expression -> expression OR expression
+                                        v1, v2, v3 = valstack[-3:]
+                                        del valstack[-2:]
+                                        valstack[-1] = c_or(v1, v3)
+                                        del statestack[-2:]
+                                        state = _goto_expression[statestack[-2]]
+                                        statestack[-1] = state
+                                        continue
+                                    return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                                else:
+                                    if lookahead is None:
+                                        lookahead = get_token()
+                                        if lookahead is None:
+                                            lookahead = YaccSymbol()
+                                            lookahead.type = "$end"
+                                            lookahead.value = None
+                                        ltid = _termids.get(lookahead.type, 1)
+                                    t = _row67[ltid]
+                                    if 0 < t < 82:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        state = t
+                                        statestack.append(t)
+                                        continue
+                                    if t == 123:
+                                        # expression -> expression XOR expression
+                                        v1, v2, v3 = valstack[-3:]
+                                        del valstack[-2:]
+                                        valstack[-1] = c_xor(v1, v3)
+                                        del statestack[-2:]
+                                        state = _goto_expression[statestack[-2]]
+                                        statestack[-1] = state
+                                        continue
+                                    return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                            else:
+                                if state < 69:
+                                    if lookahead is None:
+                                        lookahead = get_token()
+                                        if lookahead is None:
+                                            lookahead = YaccSymbol()
+                                            lookahead.type = "$end"
+                                            lookahead.value = None
+                                        ltid = _termids.get(lookahead.type, 1)
+                                    t = _row68[ltid]
+                                    if 0 < t < 82:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        state = t
+                                        statestack.append(t)
+                                        continue
+                                    if t == 124:
+                                        # expression -> expression NAND expression
+                                        v1, v2, v3 = valstack[-3:]
+                                        del valstack[-2:]
+                                        valstack[-1] = c_nand(v1, v3)
+                                        del statestack[-2:]
+                                        state = _goto_expression[statestack[-2]]
+                                        statestack[-1] = state
+                                        continue
+                                    return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                                else:
+                                    if state < 70:
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        t = _row69[ltid]
+                                        if 0 < t < 82:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            state = t
+                                            statestack.append(t)
+                                            continue
+                                        if t == 125:
+                                            # expression -> expression NOR expression
+                                            v1, v2, v3 = valstack[-3:]
+                                            del valstack[-2:]
+                                            valstack[-1] = c_nor(v1, v3)
+                                            del statestack[-2:]
+                                            state = _goto_expression[statestack[-2]]
+                                            statestack[-1] = state
+                                            continue
+                                        return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                                    else:
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        t = _row70[ltid]
+                                        if 0 < t < 82:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            state = t
+                                            statestack.append(t)
+                                            continue
+                                        if t == 126:
+                                            # expression -> expression XNOR expression
+                                            v1, v2, v3 = valstack[-3:]
+                                            del valstack[-2:]
+                                            valstack[-1] = c_xnor(v1, v3)
+                                            del statestack[-2:]
+                                            state = _goto_expression[statestack[-2]]
+                                            statestack[-1] = state
+                                            continue
+                                        return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                    else:
+                        if state < 76:
+                            if state < 73:
+                                if state < 72:
+                                    if lookahead is None:
+                                        lookahead = get_token()
+                                        if lookahead is None:
+                                            lookahead = YaccSymbol()
+                                            lookahead.type = "$end"
+                                            lookahead.value = None
+                                        ltid = _termids.get(lookahead.type, 1)
+                                    t = _row71[ltid]
+                                    if 0 < t < 82:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        state = t
+                                        statestack.append(t)
+                                        continue
+                                    if t == 127:
+                                        # expression -> expression EQUAL expression
+                                        v1, v2, v3 = valstack[-3:]
+                                        del valstack[-2:]
+                                        valstack[-1] = c_equal(v1, v3)
+                                        del statestack[-2:]
+                                        state = _goto_expression[statestack[-2]]
+                                        statestack[-1] = state
+                                        continue
+                                    return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                                else:
+                                    if lookahead is None:
+                                        lookahead = get_token()
+                                        if lookahead is None:
+                                            lookahead = YaccSymbol()
+                                            lookahead.type = "$end"
+                                            lookahead.value = None
+                                        ltid = _termids.get(lookahead.type, 1)
+                                    t = _row72[ltid]
+                                    if t == 25:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row25[ltid] != 109:
+                                            state = 25
+                                            statestack.append(25)
+                                            continue
+                                        # expression -> NUMBER
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_number(v1)
+                                        state = 73
+                                        statestack.append(73)
+                                        continue
+                                    if t == 26:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row26[ltid] != 110:
+                                            state = 26
+                                            statestack.append(26)
+                                            continue
+                                        # expression -> STRING
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_string(v1)
+                                        state = 73
+                                        statestack.append(73)
+                                        continue
+                                    if t == 27:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        if _row27[ltid] != 111:
+                                            state = 27
+                                            statestack.append(27)
+                                            continue
+                                        # expression -> BOOL
+                                        v1 = valstack[-1]
+                                        valstack[-1] = c_bool(v1)
+                                        state = 73
+                                        statestack.append(73)
+                                        continue
+                                    if 0 < t < 82:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        state = t
+                                        statestack.append(t)
+                                        continue
+                                    return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                            else:
+                                if state < 74:
+                                    if lookahead is None:
+                                        lookahead = get_token()
+                                        if lookahead is None:
+                                            lookahead = YaccSymbol()
+                                            lookahead.type = "$end"
+                                            lookahead.value = None
+                                        ltid = _termids.get(lookahead.type, 1)
+                                    t = _row73[ltid]
+                                    if 0 < t < 82:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        state = t
+                                        statestack.append(t)
+                                        continue
+                                    if t == 106:
+                                        # arg -> arg expression
+                                        v1, v2 = valstack[-2:]
+                                        del valstack[-1:]
+                                        valstack[-1] = p_arg_append(v1, v2)
+                                        del statestack[-1:]
+                                        state = _goto_arg[statestack[-2]]
+                                        statestack[-1] = state
+                                        continue
+                                    return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                                else:
+                                    if state < 75:
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        t = _row74[ltid]
+                                        if 0 < t < 82:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            state = t
+                                            statestack.append(t)
+                                            continue
+                                        if t == 104:
+                                            # set_statement -> SET IDENT expression
+                                            v1, v2, v3 = valstack[-3:]
+                                            del valstack[-2:]
+                                            valstack[-1] = c_set_statement(v2, v3)
+                                            del statestack[-2:]
+                                            if lookahead is None:
+                                                lookahead = get_token()
+                                                if lookahead is None:
+                                                    lookahead = YaccSymbol()
+                                                    lookahead.type = "$end"
+                                                    lookahead.value = None
+                                                ltid = _termids.get(lookahead.type, 1)
+                                            if _row7[ltid] != 90:
+                                                state = statestack[-1] = 7
+                                                continue
+                                            # statement -> set_statement
+                                            state = _goto_statement[statestack[-2]]
+                                            statestack[-1] = state
+                                            continue
+                                        return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                                    else:
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        t = _row75[ltid]
+                                        if t == 25:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            if lookahead is None:
+                                                lookahead = get_token()
+                                                if lookahead is None:
+                                                    lookahead = YaccSymbol()
+                                                    lookahead.type = "$end"
+                                                    lookahead.value = None
+                                                ltid = _termids.get(lookahead.type, 1)
+                                            if _row25[ltid] != 109:
+                                                state = 25
+                                                statestack.append(25)
+                                                continue
+                                            # expression -> NUMBER
+                                            v1 = valstack[-1]
+                                            valstack[-1] = c_number(v1)
+                                            state = 79
+                                            statestack.append(79)
+                                            continue
+                                        if t == 26:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            if lookahead is None:
+                                                lookahead = get_token()
+                                                if lookahead is None:
+                                                    lookahead = YaccSymbol()
+                                                    lookahead.type = "$end"
+                                                    lookahead.value = None
+                                                ltid = _termids.get(lookahead.type, 1)
+                                            if _row26[ltid] != 110:
+                                                state = 26
+                                                statestack.append(26)
+                                                continue
+                                            # expression -> STRING
+                                            v1 = valstack[-1]
+                                            valstack[-1] = c_string(v1)
+                                            state = 79
+                                            statestack.append(79)
+                                            continue
+                                        if t == 27:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            if lookahead is None:
+                                                lookahead = get_token()
+                                                if lookahead is None:
+                                                    lookahead = YaccSymbol()
+                                                    lookahead.type = "$end"
+                                                    lookahead.value = None
+                                                ltid = _termids.get(lookahead.type, 1)
+                                            if _row27[ltid] != 111:
+                                                state = 27
+                                                statestack.append(27)
+                                                continue
+                                            # expression -> BOOL
+                                            v1 = valstack[-1]
+                                            valstack[-1] = c_bool(v1)
+                                            state = 79
+                                            statestack.append(79)
+                                            continue
+                                        if 0 < t < 82:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            state = t
+                                            statestack.append(t)
+                                            continue
+                                        return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                        else:
+                            if state < 79:
+                                if state < 77:
+                                    if lookahead is None:
+                                        lookahead = get_token()
+                                        if lookahead is None:
+                                            lookahead = YaccSymbol()
+                                            lookahead.type = "$end"
+                                            lookahead.value = None
+                                        ltid = _termids.get(lookahead.type, 1)
+                                    t = _row76[ltid]
+                                    if t == 113:
+                                        # expression -> LPAREN expression RPAREN
+                                        v1, v2, v3 = valstack[-3:]
+                                        del valstack[-2:]
+                                        valstack[-1] = c_group(v2)
+                                        del statestack[-2:]
+                                        state = _goto_expression[statestack[-2]]
+                                        statestack[-1] = state
+                                        continue
+                                    return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                                else:
+                                    if state < 78:
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        t = _row77[ltid]
+                                        if t == 22:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            if lookahead is None:
+                                                lookahead = get_token()
+                                                if lookahead is None:
+                                                    lookahead = YaccSymbol()
+                                                    lookahead.type = "$end"
+                                                    lookahead.value = None
+                                                ltid = _termids.get(lookahead.type, 1)
+                                            if _row22[ltid] != 129:
+                                                state = 22
+                                                statestack.append(22)
+                                                continue
+                                            # break_statement -> BRK
+                                            v1 = valstack[-1]
+                                            valstack[-1] = c_break_statement()
+                                            if lookahead is None:
+                                                lookahead = get_token()
+                                                if lookahead is None:
+                                                    lookahead = YaccSymbol()
+                                                    lookahead.type = "$end"
+                                                    lookahead.value = None
+                                                ltid = _termids.get(lookahead.type, 1)
+                                            if _row10[ltid] != 93:
+                                                state = 10
+                                                statestack.append(10)
+                                                continue
+                                            # statement -> break_statement
+                                            if lookahead is None:
+                                                lookahead = get_token()
+                                                if lookahead is None:
+                                                    lookahead = YaccSymbol()
+                                                    lookahead.type = "$end"
+                                                    lookahead.value = None
+                                                ltid = _termids.get(lookahead.type, 1)
+                                            if _row30[ltid] != 86:
+                                                state = 30
+                                                statestack.append(30)
+                                                continue
+                                            # statements -> statements statement
+                                            v1, v2 = valstack[-2:]
+                                            del valstack[-1:]
+                                            valstack[-1] = p_statements_append(v1, v2)
+                                            del statestack[-1:]
+                                            state = _goto_statements[statestack[-1]]
+                                            statestack.append(state)
+                                            continue
+                                        if t == 23:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            if lookahead is None:
+                                                lookahead = get_token()
+                                                if lookahead is None:
+                                                    lookahead = YaccSymbol()
+                                                    lookahead.type = "$end"
+                                                    lookahead.value = None
+                                                ltid = _termids.get(lookahead.type, 1)
+                                            if _row23[ltid] != 130:
+                                                state = 23
+                                                statestack.append(23)
+                                                continue
+                                            # continue_statement -> CNT
+                                            v1 = valstack[-1]
+                                            valstack[-1] = c_continue_statement()
+                                            if lookahead is None:
+                                                lookahead = get_token()
+                                                if lookahead is None:
+                                                    lookahead = YaccSymbol()
+                                                    lookahead.type = "$end"
+                                                    lookahead.value = None
+                                                ltid = _termids.get(lookahead.type, 1)
+                                            if _row11[ltid] != 94:
+                                                state = 11
+                                                statestack.append(11)
+                                                continue
+                                            # statement -> continue_statement
+                                            if lookahead is None:
+                                                lookahead = get_token()
+                                                if lookahead is None:
+                                                    lookahead = YaccSymbol()
+                                                    lookahead.type = "$end"
+                                                    lookahead.value = None
+                                                ltid = _termids.get(lookahead.type, 1)
+                                            if _row30[ltid] != 86:
+                                                state = 30
+                                                statestack.append(30)
+                                                continue
+                                            # statements -> statements statement
+                                            v1, v2 = valstack[-2:]
+                                            del valstack[-1:]
+                                            valstack[-1] = p_statements_append(v1, v2)
+                                            del statestack[-1:]
+                                            state = _goto_statements[statestack[-1]]
+                                            statestack.append(state)
+                                            continue
+                                        if t == 24:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            if lookahead is None:
+                                                lookahead = get_token()
+                                                if lookahead is None:
+                                                    lookahead = YaccSymbol()
+                                                    lookahead.type = "$end"
+                                                    lookahead.value = None
+                                                ltid = _termids.get(lookahead.type, 1)
+                                            if _row24[ltid] != 98:
+                                                state = 24
+                                                statestack.append(24)
+                                                continue
+                                            # blankspace -> NEWLINE
+                                            v1 = valstack[-1]
+                                            valstack[-1] = c_newline()
+                                            if lookahead is None:
+                                                lookahead = get_token()
+                                                if lookahead is None:
+                                                    lookahead = YaccSymbol()
+                                                    lookahead.type = "$end"
+                                                    lookahead.value = None
+                                                ltid = _termids.get(lookahead.type, 1)
+                                            if _row14[ltid] != 97:
+                                                state = 14
+                                                statestack.append(14)
+                                                continue
+                                            # statement -> blankspace
+                                            if lookahead is None:
+                                                lookahead = get_token()
+                                                if lookahead is None:
+                                                    lookahead = YaccSymbol()
+                                                    lookahead.type = "$end"
+                                                    lookahead.value = None
+                                                ltid = _termids.get(lookahead.type, 1)
+                                            if _row30[ltid] != 86:
+                                                state = 30
+                                                statestack.append(30)
+                                                continue
+                                            # statements -> statements statement
+                                            v1, v2 = valstack[-2:]
+                                            del valstack[-1:]
+                                            valstack[-1] = p_statements_append(v1, v2)
+                                            del statestack[-1:]
+                                            state = _goto_statements[statestack[-1]]
+                                            statestack.append(state)
+                                            continue
+                                        if t == 25:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            if lookahead is None:
+                                                lookahead = get_token()
+                                                if lookahead is None:
+                                                    lookahead = YaccSymbol()
+                                                    lookahead.type = "$end"
+                                                    lookahead.value = None
+                                                ltid = _termids.get(lookahead.type, 1)
+                                            if _row25[ltid] != 109:
+                                                state = 25
+                                                statestack.append(25)
+                                                continue
+                                            # expression -> NUMBER
+                                            v1 = valstack[-1]
+                                            valstack[-1] = c_number(v1)
+                                            state = 16
+                                            statestack.append(16)
+                                            continue
+                                        if t == 26:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            if lookahead is None:
+                                                lookahead = get_token()
+                                                if lookahead is None:
+                                                    lookahead = YaccSymbol()
+                                                    lookahead.type = "$end"
+                                                    lookahead.value = None
+                                                ltid = _termids.get(lookahead.type, 1)
+                                            if _row26[ltid] != 110:
+                                                state = 26
+                                                statestack.append(26)
+                                                continue
+                                            # expression -> STRING
+                                            v1 = valstack[-1]
+                                            valstack[-1] = c_string(v1)
+                                            state = 16
+                                            statestack.append(16)
+                                            continue
+                                        if t == 27:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            if lookahead is None:
+                                                lookahead = get_token()
+                                                if lookahead is None:
+                                                    lookahead = YaccSymbol()
+                                                    lookahead.type = "$end"
+                                                    lookahead.value = None
+                                                ltid = _termids.get(lookahead.type, 1)
+                                            if _row27[ltid] != 111:
+                                                state = 27
+                                                statestack.append(27)
+                                                continue
+                                            # expression -> BOOL
+                                            v1 = valstack[-1]
+                                            valstack[-1] = c_bool(v1)
+                                            state = 16
+                                            statestack.append(16)
+                                            continue
+                                        if t == 80:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            if lookahead is None:
+                                                lookahead = get_token()
+                                                if lookahead is None:
+                                                    lookahead = YaccSymbol()
+                                                    lookahead.type = "$end"
+                                                    lookahead.value = None
+                                                ltid = _termids.get(lookahead.type, 1)
+                                            if _row80[ltid] != 84:
+                                                state = 80
+                                                statestack.append(80)
+                                                continue
+                                            # block -> INDENT statements DEDENT
+                                            v1, v2, v3 = valstack[-3:]
+                                            del valstack[-2:]
+                                            valstack[-1] = c_block(v2)
+                                            del statestack[-2:]
+                                            state = _goto_block[statestack[-1]]
+                                            statestack.append(state)
+                                            continue
+                                        if 0 < t < 82:
+                                            valstack.append(lookahead.value)
+                                            lookahead = None
+                                            state = t
+                                            statestack.append(t)
+                                            continue
+                                        return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                                    else:
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        t = _row78[ltid]
+                                        if t == 103:
+                                            # def_statement -> DEF IDENT arg block
+                                            v1, v2, v3, v4 = valstack[-4:]
+                                            del valstack[-3:]
+                                            valstack[-1] = c_def_statement(v2, v3, v4)
+                                            del statestack[-3:]
+                                            if lookahead is None:
+                                                lookahead = get_token()
+                                                if lookahead is None:
+                                                    lookahead = YaccSymbol()
+                                                    lookahead.type = "$end"
+                                                    lookahead.value = None
+                                                ltid = _termids.get(lookahead.type, 1)
+                                            if _row6[ltid] != 89:
+                                                state = statestack[-1] = 6
+                                                continue
+                                            # statement -> def_statement
+                                            state = _goto_statement[statestack[-2]]
+                                            statestack[-1] = state
+                                            continue
+                                        return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                            else:
+                                if state < 80:
+                                    if lookahead is None:
+                                        lookahead = get_token()
+                                        if lookahead is None:
+                                            lookahead = YaccSymbol()
+                                            lookahead.type = "$end"
+                                            lookahead.value = None
+                                        ltid = _termids.get(lookahead.type, 1)
+                                    t = _row79[ltid]
+                                    if 0 < t < 82:
+                                        valstack.append(lookahead.value)
+                                        lookahead = None
+                                        state = t
+                                        statestack.append(t)
+                                        continue
+                                    return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                                else:
+                                    if state < 81:
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        t = _row80[ltid]
+                                        if t == 84:
+                                            # block -> INDENT statements DEDENT
+                                            v1, v2, v3 = valstack[-3:]
+                                            del valstack[-2:]
+                                            valstack[-1] = c_block(v2)
+                                            del statestack[-2:]
+                                            state = _goto_block[statestack[-2]]
+                                            statestack[-1] = state
+                                            continue
+                                        return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
+                                    else:
+                                        if lookahead is None:
+                                            lookahead = get_token()
+                                            if lookahead is None:
+                                                lookahead = YaccSymbol()
+                                                lookahead.type = "$end"
+                                                lookahead.value = None
+                                            ltid = _termids.get(lookahead.type, 1)
+                                        t = _row81[ltid]
+                                        if t == 108:
+                                            # loop_statement -> LOP IDENT expression expression block
+                                            v1, v2, v3, v4, v5 = valstack[-5:]
+                                            del valstack[-4:]
+                                            valstack[-1] = c_loop_statement(v2, v3, v4, v5)
+                                            del statestack[-4:]
+                                            if lookahead is None:
+                                                lookahead = get_token()
+                                                if lookahead is None:
+                                                    lookahead = YaccSymbol()
+                                                    lookahead.type = "$end"
+                                                    lookahead.value = None
+                                                ltid = _termids.get(lookahead.type, 1)
+                                            if _row8[ltid] != 91:
+                                                state = statestack[-1] = 8
+                                                continue
+                                            # statement -> loop_statement
+                                            state = _goto_statement[statestack[-2]]
+                                            statestack[-1] = state
+                                            continue
+                                        return self.lrparser.parseopt_values(lexer=lexer, stacks=(statestack, valstack, lookahead))
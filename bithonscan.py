@@ -0,0 +1,230 @@
+# bithonscan.py. This file is automatically generated by scangen.py from the
+# rules in lexer.py. Don't edit!
+import codecs
+import copy
+import io
+import re
+
+from lex import LexError, LexToken, TokenColumns
+from lexer import t_error
+
+_lexerhash = 'a20b4016cd94f1aacf993fe6701fbc7208d330c3d3d8f0ca404aad59e9f64715'
+
+_match = re.compile('(?P<t_NEWLINE>\\n)|(?P<k_KEYWORD>\\b(?:false|nand|true|xnor|add|and|brk|cnt|def|div|els|eql|iff|lop|mod|mul|nor|not|orr|pow|ret|set|sub|xor|or)\\b)|(?P<t_IDENT>\\b[a-zA-Z_][a-zA-Z0-9_]*\\b)|(?P<t_STRING>"[^"\\\\]*(?:\\\\.[^"\\\\]*)*")|(?P<t_NUMBER>\\b\\d+(\\.\\d+)?\\b)|(?P<t_POWER>\\*\\*)|(?P<t_LPAREN>\\()|(?P<t_RPAREN>\\))|(?P<t_PLUS>\\+)|(?P<t_MUL>\\*)|(?P<t_MINUS>-)|(?P<t_DIV>/)|(?P<t_MODULUS>%)|(?P<t_EQUAL>=)', 64).match
+
+# Token type of each group of the master regex
+_types = (None, 'NEWLINE', None, 'IDENT', 'STRING', 'NUMBER', None, 'POWER', 'LPAREN', 'RPAREN', 'PLUS', 'MUL', 'MINUS', 'DIV', 'MODULUS', 'EQUAL')
+
+# Every token type, in the order TokenColumns type ids use
+_typenames = ('AND', 'BOOL', 'BRK', 'CNT', 'DEDENT', 'DEF', 'DIV', 'ELS', 'EQUAL', 'IDENT', 'IFF', 'INDENT', 'LOP', 'LPAREN', 'MINUS', 'MODULUS', 'MUL', 'NAND', 'NEWLINE', 'NOR', 'NOT', 'NUMBER', 'OR', 'PLUS', 'POWER', 'RET', 'RPAREN', 'SET', 'STRING', 'XNOR', 'XOR')
+
+# Reserved word -> token type
+_reserved = {'iff': 'IFF', 'els': 'ELS', 'def': 'DEF', 'lop': 'LOP', 'ret': 'RET', 'brk': 'BRK', 'cnt': 'CNT', 'false': 'BOOL', 'true': 'BOOL', 'not': 'NOT', 'pow': 'POWER', 'mul': 'MUL', 'add': 'PLUS', 'sub': 'MINUS', 'div': 'DIV', 'mod': 'MODULUS', 'eql': 'EQUAL', 'and': 'AND', 'or': 'OR', 'orr': 'OR', 'xor': 'XOR', 'nand': 'NAND', 'nor': 'NOR', 'xnor': 'XNOR', 'set': 'SET'}
+
+_typeids = tuple(None if t is None else _typenames.index(t) for t in _types)
+_reservedids = {word: _typenames.index(t) for word, t in _reserved.items()}
+_NEWLINE = 1
+_KEYWORD = 2
+_NEWLINE_ID = _typenames.index("NEWLINE")
+_INDENT_ID = _typenames.index("INDENT")
+_DEDENT_ID = _typenames.index("DEDENT")
+
+
+class Scanner:
+    def __init__(self):
+        self.lexdata = ""
+        self.lexpos = 0
+        self.lexlen = 0
+        self.lineno = 1
+        self.lextokens_all = set(_typenames)
+        self.indents = [0]
+        self.indents_count = 0
+        self.indentwidth = 4
+
+    def clone(self):
+        return copy.copy(self)
+
+    def input(self, s):
+        # Stream input is read in one go
+        if not isinstance(s, str):
+            if hasattr(s, "read"):
+                s = s.read()
+            if not isinstance(s, str):
+                decoder = io.IncrementalNewlineDecoder(
+                    codecs.getincrementaldecoder("utf-8")(), translate=True
+                )
+                s = decoder.decode(s[:], final=True)
+        self.lexdata = s
+        self.lexpos = 0
+        self.lexlen = len(s)
+
+    def skip(self, n):
+        self.lexpos += n
+
+    def _error(self, lexpos):
+        tok = LexToken()
+        tok.value = self.lexdata[lexpos:]
+        tok.lineno = self.lineno
+        tok.type = "error"
+        tok.lexer = self
+        tok.lexpos = lexpos
+        self.lexpos = lexpos
+        newtok = t_error(tok)
+        if lexpos == self.lexpos:
+            # Error method didn't change text position at all. This is an error.
+            raise LexError(
+                f"Scanning error. Illegal character {self.lexdata[lexpos]!r}",
+                self.lexdata[lexpos:],
+            )
+        return newtok
+
+    def token(self):
+        lexdata = self.lexdata
+        lexpos = self.lexpos
+        lexlen = self.lexlen
+        while lexpos < lexlen:
+            if lexdata[lexpos] in ' ':
+                lexpos += 1
+                continue
+
+            m = _match(lexdata, lexpos)
+            if m is None:
+                newtok = self._error(lexpos)
+                lexpos = self.lexpos
+                if newtok:
+                    return newtok
+                continue
+
+            i = m.lastindex
+            end = m.end()
+            tok = LexToken()
+            tok.lineno = self.lineno
+            tok.lexpos = lexpos
+            if i == _NEWLINE:
+                self.lineno += end - lexpos
+                p = end
+                while p < lexlen and lexdata[p] in " \t":
+                    p += 1
+                count = self.indents_count = (p - end) // self.indentwidth
+                indents = self.indents
+                if count > indents[-1]:  # It is an indent
+                    tok.type = "INDENT"
+                    tok.value = count - indents[-1]
+                    indents.append(count)
+                elif count < indents[-1]:  # It is a dedent
+                    tok.type = "DEDENT"
+                    tok.value = indents[-1] - count
+                    while count < indents[-1]:
+                        indents.pop()
+                    if count > indents[-1]:
+                        indents.append(count)
+                else:
+                    tok.type = "NEWLINE"
+                    tok.value = lexdata[lexpos:end]
+                self.lexpos = p
+                return tok
+
+            tok.value = value = lexdata[lexpos:end]
+            tok.type = _reserved[value] if i == _KEYWORD else _types[i]
+            self.lexpos = end
+            return tok
+
+        self.lexpos = lexpos
+        if self.indents[-1] > 0:  # Close every block still open
+            tok = LexToken()
+            tok.type = "DEDENT"
+            tok.value = self.indents[-1]
+            tok.lineno = self.lineno
+            tok.lexpos = lexpos
+            self.indents = [0]
+            self.indents_count = 0
+            return tok
+        return None
+
+    def tokenize_all(self, data=None):
+        if data is not None:
+            self.input(data)
+        columns = TokenColumns(self.lexdata, _typenames)
+        values = columns.values
+        types_append = columns.types.append
+        lexpos_append = columns.lexpos.append
+        ends_append = columns.ends.append
+        lineno_append = columns.lineno.append
+
+        lexdata = self.lexdata
+        lexpos = self.lexpos
+        lexlen = self.lexlen
+        lineno = self.lineno
+        indents = self.indents
+        indentwidth = self.indentwidth
+        while lexpos < lexlen:
+            if lexdata[lexpos] in ' ':
+                lexpos += 1
+                continue
+
+            m = _match(lexdata, lexpos)
+            if m is None:
+                self.lineno = lineno
+                newtok = self._error(lexpos)
+                lexpos = self.lexpos
+                if newtok:
+                    types_append(columns.typeid(newtok.type))
+                    lexpos_append(newtok.lexpos)
+                    ends_append(newtok.lexpos + len(newtok.value))
+                    lineno_append(newtok.lineno)
+                    values[len(columns.types) - 1] = newtok.value
+                continue
+
+            i = m.lastindex
+            end = m.end()
+            lexpos_append(lexpos)
+            ends_append(end)
+            lineno_append(lineno)
+            if i == _NEWLINE:
+                lineno += end - lexpos
+                p = end
+                while p < lexlen and lexdata[p] in " \t":
+                    p += 1
+                count = (p - end) // indentwidth
+                if count > indents[-1]:  # It is an indent
+                    types_append(_INDENT_ID)
+                    values[len(columns.types) - 1] = count - indents[-1]
+                    indents.append(count)
+                elif count < indents[-1]:  # It is a dedent
+                    types_append(_DEDENT_ID)
+                    values[len(columns.types) - 1] = indents[-1] - count
+                    while count < indents[-1]:
+                        indents.pop()
+                    if count > indents[-1]:
+                        indents.append(count)
+                else:
+                    types_append(_NEWLINE_ID)
+                self.indents_count = count
+                lexpos = p
+                continue
+
+            types_append(
+                _reservedids[lexdata[lexpos:end]] if i == _KEYWORD else _typeids[i]
+            )
+            lexpos = end
+
+        self.lexpos = lexpos
+        self.lineno = lineno
+        if indents[-1] > 0:  # Close every block still open
+            types_append(_DEDENT_ID)
+            lexpos_append(lexpos)
+            ends_append(lexpos)
+            lineno_append(lineno)
+            values[len(columns.types) - 1] = indents[-1]
+            self.indents = [0]
+            self.indents_count = 0
+        return columns
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        t = self.token()
+        if t is None:
+            raise StopIteration
+        return t
@@ -0,0 +1,460 @@
+from compiler import (
+    c_and,
+    c_block,
+    c_bool,
+    c_break_statement,
+    c_constant,
+    c_continue_statement,
+    c_def_statement,
+    c_div,
+    c_env_call,
+    c_equal,
+    c_group,
+    c_if_else_statement,
+    c_if_statement,
+    c_loop_statement,
+    c_minus,
+    c_mod,
+    c_mul,
+    c_nand,
+    c_newline,
+    c_nor,
+    c_not,
+    c_number,
+    c_or,
+    c_plus,
+    c_power,
+    c_program,
+    c_return_statement,
+    c_set_statement,
+    c_string,
+    c_xnor,
+    c_xor,
+    BreakSignal,
+    ContinueSignal,
+    LoopSignal,
+    ReturnSignal,
+    Scope,
+)
+
+# Closure compilation of the syntax tree.
+#
+# compile_program() turns every node of a c_program into a Python closure,
+# once, and returns a function that runs the program in an environment.
+# A closure holds the closures of the children of its node directly, so
+# running the program makes one call per node and no method lookups.  The
+# results are the same as those of c_program.execute(), and ret, brk and
+# cnt raise the same control flow signals.
+#
+# At the top level the environment is the global dict.  A function call
+# runs in a frame: a list holding the global dict, the frame of the call
+# the function was defined in (None at the top level) and then a slot for
+# each local name of the function, in the order of compiler.Scope.names.
+# Names are resolved when the function is compiled, so a closure reads a
+# local name straight from its slot and a global one from the global dict.
+#
+# Nodes of kinds not known here are run by their own execute() method,
+# which takes a dict, so only at the top level.
+
+_first_slot = 2  # Index of the first local slot in a frame
+
+
+def compile_program(program):
+    """Return a function running program in the environment passed to it."""
+    # Function definitions run first, as in c_program.execute()
+    defs = _statements(
+        (s for s in program.statements if isinstance(s, c_def_statement)), None
+    )
+    rest = _statements(
+        (s for s in program.statements if not isinstance(s, c_def_statement)), None
+    )
+
+    def run(environment):
+        try:
+            for statement in defs:
+                statement(environment)
+            for statement in rest:
+                statement(environment)
+        except ReturnSignal:
+            pass  # ret outside of a function ends the program
+        except LoopSignal as signal:
+            raise signal.misplaced() from None
+
+    return run
+
+
+def compile_node(node, scope=None):
+    """Return the closure for node, taking the environment.
+
+    scope is the _FunctionScope of the function holding node, None at the
+    top level.
+    """
+    compiler = _compilers.get(type(node))
+    if compiler is not None:
+        return compiler(node, scope)
+    if scope is not None:
+        raise TypeError(f"cannot compile {type(node).__name__} in a function")
+    return node.execute
+
+
+class _FunctionScope:
+    # A function being compiled, inside the one it is defined in (None at
+    # the top level)
+    def __init__(self, scope, parent):
+        self.slots = {name: i for i, name in enumerate(scope.names, _first_slot)}
+        self.parent = parent
+
+
+def _access(scope, name):
+    """Return the Python expression for name in a closure, in scope.
+
+    The expression is None for a global name, which is not the same
+    expression at the top level and in a function.
+    """
+    path = "environment"
+    while scope is not None:
+        slot = scope.slots.get(name)
+        if slot is not None:
+            return f"{path}[{slot}]"
+        path += "[1]"
+        scope = scope.parent
+    return None
+
+
+_factories = {}  # Source of a closure -> factory
+
+
+def _closure(source, **values):
+    """Return the closure defined as "run" by source, a function body
+    indented by 4 spaces, with values for its free names."""
+    names = ", ".join(sorted(values))
+    factory = _factories.get((names, source))
+    if factory is None:
+        namespace = {}
+        exec(f"def factory({names}):\n{source}    return run\n", namespace)
+        factory = _factories[names, source] = namespace["factory"]
+    return factory(**values)
+
+
+def _statements(statements, scope):
+    # Closures of a list of statements, leaving out the blank lines
+    return tuple(
+        compile_node(s, scope) for s in statements if type(s) is not c_newline
+    )
+
+
+def _compile_block(node, scope):
+    # What a block closure returns means nothing, so a block of one
+    # statement is that statement
+    statements = _statements(node.statements, scope)
+    if len(statements) == 1:
+        return statements[0]
+
+    def block(environment):
+        for statement in statements:
+            statement(environment)
+
+    return block
+
+
+def _compile_constant(node, scope):
+    value = node.value
+    return lambda environment: value
+
+
+def _compile_string(node, scope):
+    try:
+        value = node.value[1:-1].encode().decode("unicode_escape")
+    except UnicodeDecodeError:
+        # Only fail if the string is evaluated
+        return node.execute
+    return lambda environment: value
+
+
+def _compile_env_call(node, scope):
+    # The name is a call if it holds a callable when evaluated, and a
+    # variable otherwise.  An unknown global name is set to None first at
+    # the top level.  In a function it is left alone, as the name used to
+    # be set in a copy of the environment only.
+    access = _access(scope, node.name)
+    if access is not None:
+        load = f"        value = {access}\n"
+    elif scope is not None:
+        load = "        value = environment[0].get(name)\n"
+    else:
+        load = (
+            "        try:\n"
+            "            value = environment[name]\n"
+            "        except KeyError:\n"
+            "            environment[name] = None\n"
+            "            return None\n"
+        )
+    arguments = tuple(compile_node(a, scope) for a in node.arguments)
+    if not arguments:
+        call = "value()"
+    elif len(arguments) == 1:
+        call = "value(arguments(environment))"
+        (arguments,) = arguments
+    else:
+        call = "value(*[argument(environment) for argument in arguments])"
+    return _closure(
+        "    def run(environment):\n"
+        + load
+        + "        if callable(value):\n"
+        f"            return {call}\n"
+        "        return value\n",
+        name=node.name,
+        arguments=arguments,
+    )
+
+
+def _compile_group(node, scope):
+    return compile_node(node.expression, scope)
+
+
+def _compile_not(node, scope):
+    expression = compile_node(node.expression, scope)
+    return lambda environment: not expression(environment)
+
+
+# Binary operators as Python expressions of their left and right operands
+_binary_expressions = {
+    c_plus: "{left} + {right}",
+    c_minus: "{left} - {right}",
+    c_mul: "{left} * {right}",
+    c_div: "{left} / {right}",
+    c_mod: "{left} % {right}",
+    c_power: "pow({left}, {right})",
+    c_equal: "{left} == {right}",
+    c_and: "{left} and {right}",
+    c_or: "{left} or {right}",
+    c_xor: "{left} ^ {right}",
+    c_nand: "not ({left} and {right})",
+    c_nor: "not ({left} or {right})",
+    c_xnor: "not ({left} ^ {right})",
+}
+
+# Constant operands are captured as values instead of closures
+_constants = (c_number, c_bool, c_constant)
+
+
+def _compile_binary(node, scope):
+    left_constant = type(node.left) in _constants
+    right_constant = type(node.right) in _constants
+    expression = _binary_expressions[type(node)].format(
+        left="left" if left_constant else "left(environment)",
+        right="right" if right_constant else "right(environment)",
+    )
+    return _closure(
+        f"    def run(environment):\n        return {expression}\n",
+        left=node.left.value if left_constant else compile_node(node.left, scope),
+        right=node.right.value if right_constant else compile_node(node.right, scope),
+    )
+
+
+def _compile_if(node, scope):
+    condition = compile_node(node.expression, scope)
+    block = _compile_block(node.block, scope)
+
+    def if_statement(environment):
+        if condition(environment):
+            block(environment)
+            return True
+        return False
+
+    return if_statement
+
+
+def _compile_if_else(node, scope):
+    condition = compile_node(node.if_statement.expression, scope)
+    block = _compile_block(node.if_statement.block, scope)
+    else_block = _compile_block(node.else_block, scope)
+
+    def if_else_statement(environment):
+        if condition(environment):
+            block(environment)
+        else:
+            else_block(environment)
+
+    return if_else_statement
+
+
+def _compile_loop(node, scope):
+    access = _access(scope, node.variable_name)
+    if access is None:
+        # At the top level
+        load = (
+            "        try:\n"
+            "            start = environment[name]\n"
+            "        except KeyError:\n"
+            "            start = environment[name] = None\n"
+        )
+        access = "environment[name]"
+    else:
+        load = f"        start = {access}\n"
+    return _closure(
+        "    def run(environment):\n"
+        + load
+        + "        for i in range(int(start or 0), end(environment),"
+        " increment(environment)):\n"
+        f"            {access} = i\n"
+        "            try:\n"
+        "                block(environment)\n"
+        "            except BreakSignal:\n"
+        "                break\n"
+        "            except ContinueSignal:\n"
+        "                pass\n",
+        BreakSignal=BreakSignal,
+        ContinueSignal=ContinueSignal,
+        name=node.variable_name,
+        increment=compile_node(node.increment, scope),
+        end=compile_node(node.end, scope),
+        block=_compile_block(node.block, scope),
+    )
+
+
+def _load(scope, name):
+    # Closure reading name in scope, in a function
+    access = _access(scope, name) or "environment[0].get(name)"
+    return _closure(f"    def run(environment):\n        return {access}\n", name=name)
+
+
+def _store(scope, name):
+    # Python target for assigning name: a slot in a function, where every
+    # name assigned is local, and the global dict at the top level
+    return _access(scope, name) or "environment[name]"
+
+
+def _compile_def(node, scope):
+    try:
+        function_scope = Scope(node)
+    except AttributeError:
+        # A parameter that isn't a name fails when the function is called
+        def func(*args):
+            Scope(node)
+
+        return _closure(
+            f"    def run(environment):\n        {_store(scope, node.name)} = func\n",
+            name=node.name,
+            func=func,
+        )
+    inner = _FunctionScope(function_scope, scope)
+    body = [s for s in node.block.statements if type(s) is not c_newline]
+    if body and type(body[-1]) is c_return_statement:
+        # A ret at the end of the body returns without raising a signal
+        block = _compile_block(c_block(body[:-1]), inner) if body[:-1] else None
+        result = compile_node(body[-1].expression, inner)
+    else:
+        block = _compile_block(node.block, inner)
+        result = None
+    names = function_scope.names
+    parameters = function_scope.parameters
+    nparameters = len(parameters)
+    if len(set(parameters)) == nparameters:
+        others = names[nparameters:]
+    else:
+        nparameters = None  # Parameters given twice take the last argument
+
+    if scope is None:
+        # The names start out with their global values
+        def make_frame(environment, args):
+            get = environment.get
+            if len(args) == nparameters:
+                return [environment, None, *args, *map(get, others)]
+            frame = [environment, None, *map(get, names)]
+            for param, arg in zip(parameters, args):
+                frame[inner.slots[param]] = arg
+            return frame
+
+    else:
+        # Or with their values in the frame the function was defined in
+        loads = [_load(scope, name) for name in names]
+
+        def make_frame(environment, args):
+            frame = [environment[0], environment]
+            frame.extend([load(environment) for load in loads])
+            for param, arg in zip(parameters, args):
+                frame[inner.slots[param]] = arg
+            return frame
+
+    def define(environment):
+        def func(*args):
+            frame = make_frame(environment, args)
+            try:
+                if block is not None:
+                    block(frame)
+                if result is not None:
+                    return result(frame)
+            except ReturnSignal as signal:
+                return signal.value
+            except LoopSignal as signal:
+                raise signal.misplaced() from None
+
+        return func
+
+    return _closure(
+        "    def run(environment):\n"
+        f"        {_store(scope, node.name)} = define(environment)\n",
+        name=node.name,
+        define=define,
+    )
+
+
+def _compile_return(node, scope):
+    expression = compile_node(node.expression, scope)
+
+    def return_statement(environment):
+        raise ReturnSignal(expression(environment))
+
+    return return_statement
+
+
+def _compile_break(node, scope):
+    def break_statement(environment):
+        raise BreakSignal()
+
+    return break_statement
+
+
+def _compile_continue(node, scope):
+    def continue_statement(environment):
+        raise ContinueSignal()
+
+    return continue_statement
+
+
+def _compile_set(node, scope):
+    return _closure(
+        "    def run(environment):\n"
+        f"        {_store(scope, node.variable)} = expression(environment)\n",
+        name=node.variable,
+        expression=compile_node(node.expression, scope),
+    )
+
+
+def _compile_newline(node, scope):
+    return lambda environment: None
+
+
+_compilers = {
+    c_block: _compile_block,
+    c_number: _compile_constant,
+    c_bool: _compile_constant,
+    c_constant: _compile_constant,
+    c_string: _compile_string,
+    c_env_call: _compile_env_call,
+    c_group: _compile_group,
+    c_not: _compile_not,
+    c_if_statement: _compile_if,
+    c_if_else_statement: _compile_if_else,
+    c_loop_statement: _compile_loop,
+    c_def_statement: _compile_def,
+    c_return_statement: _compile_return,
+    c_break_statement: _compile_break,
+    c_continue_statement: _compile_continue,
+    c_set_statement: _compile_set,
+    c_newline: _compile_newline,
+    c_program: lambda node, scope: compile_program(node),
+}
+for kind in _binary_expressions:
+    _compilers[kind] = _compile_binary
@@ -1,31 +1,71 @@
+import builtins
+import contextlib
+import keyword
+
 import yacc
 from lexer import tokens
 from lexer import lexer
 
-print(yacc)
-
 tokens = tokens
 
-genQueue = []
 
+class c_node:
+    # Base class of the syntax tree nodes.  A parse with tracking="spans"
+    # sets span to (lineno, lexpos, endlineno, endlexpos): the line number
+    # and offset of the first and of the last token of the node.
+    span = None
+
+
+# Control flow signals.  ret, brk and cnt raise them, and the function call
+# or the loop they leave catches them, so every block and loop in between
+# stops right away.
+
+
+class ReturnSignal(Exception):
+    def __init__(self, value):
+        self.value = value
+
+
+class LoopSignal(Exception):
+    keyword = None
+
+    def misplaced(self):
+        # The error for a signal that left every loop
+        return Exception(f"{self.keyword} outside of a lop")
+
+
+class BreakSignal(LoopSignal):
+    keyword = "brk"
+
+
+class ContinueSignal(LoopSignal):
+    keyword = "cnt"
 
-class c_program:
+
+class c_program(c_node):
     def __init__(self, statements):
         self.statements = statements
 
     def execute(self, environment):
-        # First pass: process only function definitions
-        for statement in self.statements:
-            if isinstance(statement, c_def_statement):
-                statement.execute(environment)
-
-        # Second pass: process the rest of the code
-        for statement in self.statements:
-            if not isinstance(statement, c_def_statement):
-                statement.execute(environment)
+        try:
+            # First pass: process only function definitions
+            for statement in self.statements:
+                if isinstance(statement, c_def_statement):
+                    statement.execute(environment)
+
+            # Second pass: process the rest of the code
+            for statement in self.statements:
+                if not isinstance(statement, c_def_statement):
+                    statement.execute(environment)
+        except ReturnSignal:
+            pass  # ret outside of a function ends the program
+        except LoopSignal as signal:
+            raise signal.misplaced() from None
 
     def transpile(self, environment, indentation=0):
-        code = []
+        # The nodes are given a TranspileScope in place of the environment
+        environment = TranspileScope(self, environment)
+        code = [environment.declaration()]
         # First pass: process only function definitions
         for statement in self.statements:
             if isinstance(statement, c_def_statement):
@@ -36,7 +76,7 @@ class c_program:
             if not isinstance(statement, c_def_statement):
                 code.append(statement.transpile(environment, indentation))
 
-        return "\n".join(code)
+        return "\n".join(line for line in code if line)
 
     def tree(self):
         tree = [c_program]
@@ -51,7 +91,7 @@ class c_program:
         return tree
 
 
-class c_newline:
+class c_newline(c_node):
     def __init__(self):
         pass
 
@@ -65,61 +105,49 @@ class c_newline:
         return [None]
 
 
-class c_env_call:
-    global genQueue
-
+class c_env_call(c_node):
     def __init__(self, name, arguments):
         self.name = name
         self.arguments = arguments
 
     def execute(self, environment):
-        if self.name not in environment:
-            environment[self.name] = None
-        func = environment[self.name]
+        try:
+            func = environment[self.name]
+        except KeyError:
+            func = environment[self.name] = None
         if callable(func):
             return c_function_call(self.name, self.arguments).execute(environment)
 
         return c_varible_call(self.name).execute(environment)
 
     def transpile(self, environment, indentation):
-        if self.name not in environment:
-            print(self.name, environment)
-            environment[self.name] = None
-            genQueue.append(f"{self.name} = None")
-        func = environment[self.name]
-        if callable(func):
-            return c_function_call(self.name, self.arguments).transpile(
-                environment, indentation
-            )
-
-        return c_varible_call(self.name).transpile(environment, indentation)
+        arguments = [arg.transpile(environment, indentation) for arg in self.arguments]
+        return environment.value(self.name, arguments)
 
     def tree(self):
         args = [arg.tree() for arg in self.arguments]
         return [c_env_call, self.name, args]
 
 
-class c_varible_call:
+class c_varible_call(c_node):
     def __init__(self, name):
         self.name = name
 
     def execute(self, environment):
-        if self.name not in environment:
+        try:
+            return environment[self.name]
+        except KeyError:
             environment[self.name] = None
-        return environment[self.name]
+            return None
 
     def transpile(self, environment, indentation):
-        if self.name not in environment:
-            print(self.name, environment)
-            environment[self.name] = None
-            genQueue.append(f"{self.name} = None")
-        return self.name
+        return environment.name(self.name)
 
     def tree(self):
         return [c_varible_call, self.name]
 
 
-class c_function_call:
+class c_function_call(c_node):
     def __init__(self, name, arguments):
         self.name = name
         self.arguments = arguments
@@ -133,10 +161,10 @@ class c_function_call:
 
     def transpile(self, environment, indentation):
         args = [arg.transpile(environment, indentation) for arg in self.arguments]
-        return f"{environment[self.name].__name__}({', '.join(args)})"
+        return f"{environment.name(self.name)}({', '.join(args)})"
 
 
-class c_string:
+class c_string(c_node):
     def __init__(self, value):
         self.value = value
 
@@ -146,13 +174,17 @@ class c_string:
         return self.value[1:-1].encode().decode("unicode_escape")
 
     def transpile(self, environment, indentation):
-        return self.value
+        try:
+            return repr(self.execute(environment))
+        except UnicodeDecodeError:
+            # Only fail if the string is evaluated
+            return f"{self.value[1:-1]!r}.encode().decode('unicode_escape')"
 
     def tree(self):
         return [c_string, self.value]
 
 
-class c_number:
+class c_number(c_node):
     def __init__(self, value):
         if "." in value:
             self.value = float(value)
@@ -169,7 +201,7 @@ class c_number:
         return [c_number, self.value]
 
 
-class c_bool:
+class c_bool(c_node):
     def __init__(self, value):
         self.value = value.lower() == "true"
 
@@ -183,15 +215,34 @@ class c_bool:
         return [c_bool, self.value]
 
 
-class c_block:
+class c_constant(c_node):
+    # A value known before the program runs, made by optimize.py.  source
+    # is the literal the value was written as, if it was one.
+    def __init__(self, value, source=None):
+        self.value = value
+        self.source = source
+
+    def execute(self, environment):
+        return self.value
+
+    def transpile(self, environment, indentation):
+        if self.source is not None:
+            return self.source
+        if type(self.value) in (int, float) and self.value < 0:
+            return f"({self.value!r})"
+        return repr(self.value)
+
+    def tree(self):
+        return [c_constant, self.value]
+
+
+class c_block(c_node):
     def __init__(self, statements):
         self.statements = statements
 
     def execute(self, environment):
         for statement in self.statements:
-            out = statement.execute(environment)
-            if out is tuple and out[0] == "return":
-                return out[1]
+            statement.execute(environment)
 
     def transpile(self, environment, indentation):
         indentation += 1
@@ -199,15 +250,15 @@ class c_block:
         indent_str = "\t" * indentation
 
         code = []
-        genQueueOldLen = len(genQueue)
         for statement in self.statements:
             # Pass the current indentation level to each statement's transpile method
             code.append(statement.transpile(environment, indentation))
 
+        # Blank lines write nothing, and a Python block needs a statement
+        code = [line for line in code if line] or ["pass"]
+
         # Prefix each line of code with the indentation string
-        return indent_str + ("\n" + indent_str).join(
-            genQueue[genQueueOldLen - 1 :] + code
-        )
+        return indent_str + ("\n" + indent_str).join(code)
 
     def tree(self):
         tree = []
@@ -216,7 +267,7 @@ class c_block:
         return [c_block, tree]
 
 
-class c_group:
+class c_group(c_node):
     def __init__(self, expression):
         self.expression = expression
 
@@ -230,7 +281,7 @@ class c_group:
         return [c_group, self.expression.tree()]
 
 
-class c_not:
+class c_not(c_node):
     def __init__(self, expression):
         self.expression = expression
 
@@ -238,13 +289,13 @@ class c_not:
         return not self.expression.execute(environment)
 
     def transpile(self, environment, indentation):
-        return f"not {self.expression.transpile(environment, indentation)}"
+        return "not " + transpile_operand(self.expression, environment, indentation, 3)
 
     def tree(self):
         return [c_not, self.expression.tree()]
 
 
-class c_and:
+class c_and(c_node):
     def __init__(self, left, right):
         self.left = left
         self.right = right
@@ -253,13 +304,13 @@ class c_and:
         return self.left.execute(environment) and self.right.execute(environment)
 
     def transpile(self, environment, indentation):
-        return f"{self.left.transpile(environment, indentation)} and {self.right.transpile(environment, indentation)}"
+        return transpile_binary(self, environment, indentation)
 
     def tree(self):
         return [c_and, self.left.tree(), self.right.tree()]
 
 
-class c_or:
+class c_or(c_node):
     def __init__(self, left, right):
         self.left = left
         self.right = right
@@ -268,13 +319,13 @@ class c_or:
         return self.left.execute(environment) or self.right.execute(environment)
 
     def transpile(self, environment, indentation):
-        return f"{self.left.transpile(environment, indentation)} or {self.right.transpile(environment, indentation)}"
+        return transpile_binary(self, environment, indentation)
 
     def tree(self):
         return [c_or, self.left.tree(), self.right.tree()]
 
 
-class c_xor:
+class c_xor(c_node):
     def __init__(self, left, right):
         self.left = left
         self.right = right
@@ -283,13 +334,13 @@ class c_xor:
         return self.left.execute(environment) ^ self.right.execute(environment)
 
     def transpile(self, environment, indentation):
-        return f"{self.left.transpile(environment, indentation)} ^ {self.right.transpile(environment, indentation)}"
+        return transpile_binary(self, environment, indentation)
 
     def tree(self):
         return [c_xor, self.left.tree(), self.right.tree()]
 
 
-class c_nand:
+class c_nand(c_node):
     def __init__(self, left, right):
         self.left = left
         self.right = right
@@ -298,13 +349,13 @@ class c_nand:
         return not (self.left.execute(environment) and self.right.execute(environment))
 
     def transpile(self, environment, indentation):
-        return f"not ({self.left.transpile(environment, indentation)} and {self.right.transpile(environment, indentation)})"
+        return f"not ({transpile_binary(self, environment, indentation)})"
 
     def tree(self):
         return [c_nand, self.left.tree(), self.right.tree()]
 
 
-class c_nor:
+class c_nor(c_node):
     def __init__(self, left, right):
         self.left = left
         self.right = right
@@ -313,13 +364,13 @@ class c_nor:
         return not (self.left.execute(environment) or self.right.execute(environment))
 
     def transpile(self, environment, indentation):
-        return f"not ({self.left.transpile(environment, indentation)} or {self.right.transpile(environment, indentation)})"
+        return f"not ({transpile_binary(self, environment, indentation)})"
 
     def tree(self):
         return [c_nor, self.left.tree(), self.right.tree()]
 
 
-class c_xnor:
+class c_xnor(c_node):
     def __init__(self, left, right):
         self.left = left
         self.right = right
@@ -328,13 +379,13 @@ class c_xnor:
         return not (self.left.execute(environment) ^ self.right.execute(environment))
 
     def transpile(self, environment, indentation):
-        return f"not ({self.left.transpile(environment, indentation)} ^ {self.right.transpile(environment, indentation)})"
+        return f"not ({transpile_binary(self, environment, indentation)})"
 
     def tree(self):
         return [c_xnor, self.left.tree(), self.right.tree()]
 
 
-class c_equal:
+class c_equal(c_node):
     def __init__(self, left, right):
         self.left = left
         self.right = right
@@ -343,13 +394,13 @@ class c_equal:
         return self.left.execute(environment) == self.right.execute(environment)
 
     def transpile(self, environment, indentation):
-        return f"{self.left.transpile(environment, indentation)} == {self.right.transpile(environment, indentation)}"
+        return transpile_binary(self, environment, indentation)
 
     def tree(self):
         return [c_equal, self.left.tree(), self.right.tree()]
 
 
-class c_plus:
+class c_plus(c_node):
     def __init__(self, left, right):
         self.left = left
         self.right = right
@@ -358,13 +409,13 @@ class c_plus:
         return self.left.execute(environment) + self.right.execute(environment)
 
     def transpile(self, environment, indentation):
-        return f"{self.left.transpile(environment, indentation)} + {self.right.transpile(environment, indentation)}"
+        return transpile_binary(self, environment, indentation)
 
     def tree(self):
         return [c_plus, self.left.tree(), self.right.tree()]
 
 
-class c_minus:
+class c_minus(c_node):
     def __init__(self, left, right):
         self.left = left
         self.right = right
@@ -373,13 +424,13 @@ class c_minus:
         return self.left.execute(environment) - self.right.execute(environment)
 
     def transpile(self, environment, indentation):
-        return f"{self.left.transpile(environment, indentation)} - {self.right.transpile(environment, indentation)}"
+        return transpile_binary(self, environment, indentation)
 
     def tree(self):
         return [c_minus, self.left.tree(), self.right.tree()]
 
 
-class c_power:
+class c_power(c_node):
     def __init__(self, left, right):
         self.left = left
         self.right = right
@@ -388,13 +439,13 @@ class c_power:
         return pow(self.left.execute(environment), self.right.execute(environment))
 
     def transpile(self, environment, indentation):
-        return f"{self.left.transpile(environment, indentation)} ** {self.right.transpile(environment, indentation)}"
+        return transpile_binary(self, environment, indentation)
 
     def tree(self):
         return [c_power, self.left.tree(), self.right.tree()]
 
 
-class c_mul:
+class c_mul(c_node):
     def __init__(self, left, right):
         self.left = left
         self.right = right
@@ -403,13 +454,13 @@ class c_mul:
         return self.left.execute(environment) * self.right.execute(environment)
 
     def transpile(self, environment, indentation):
-        return f"{self.left.transpile(environment, indentation)} * {self.right.transpile(environment, indentation)}"
+        return transpile_binary(self, environment, indentation)
 
     def tree(self):
         return [c_mul, self.left.tree(), self.right.tree()]
 
 
-class c_div:
+class c_div(c_node):
     def __init__(self, left, right):
         self.left = left
         self.right = right
@@ -418,13 +469,13 @@ class c_div:
         return self.left.execute(environment) / self.right.execute(environment)
 
     def transpile(self, environment, indentation):
-        return f"{self.left.transpile(environment, indentation)} / {self.right.transpile(environment, indentation)}"
+        return transpile_binary(self, environment, indentation)
 
     def tree(self):
         return [c_div, self.left.tree(), self.right.tree()]
 
 
-class c_mod:
+class c_mod(c_node):
     def __init__(self, left, right):
         self.left = left
         self.right = right
@@ -433,13 +484,13 @@ class c_mod:
         return self.left.execute(environment) % self.right.execute(environment)
 
     def transpile(self, environment, indentation):
-        return f"{self.left.transpile(environment, indentation)} % {self.right.transpile(environment, indentation)}"
+        return transpile_binary(self, environment, indentation)
 
     def tree(self):
         return [c_mod, self.left.tree(), self.right.tree()]
 
 
-class c_if_statement:
+class c_if_statement(c_node):
     def __init__(self, expression, block):
         self.expression = expression
         self.block = block
@@ -457,7 +508,7 @@ class c_if_statement:
         return [c_if_statement, self.expression.tree(), self.block.tree()]
 
 
-class c_if_else_statement:
+class c_if_else_statement(c_node):
     def __init__(self, if_statement, else_block):
         self.if_statement = if_statement
         self.else_block = else_block
@@ -477,7 +528,7 @@ class c_if_else_statement:
         return [c_if_else_statement, self.if_statement.tree(), self.else_block.tree()]
 
 
-class c_loop_statement:
+class c_loop_statement(c_node):
     # this acts like a for loop
     def __init__(self, variable, increment, end, block):
         self.variable = c_varible_call(variable)
@@ -493,10 +544,21 @@ class c_loop_statement:
             self.increment.execute(environment),
         ):
             environment[self.variable_name] = i
-            self.block.execute(environment)
+            try:
+                self.block.execute(environment)
+            except BreakSignal:
+                break
+            except ContinueSignal:
+                pass
 
     def transpile(self, environment, indentation):
-        return f"for {self.variable.transpile(environment, indentation)} in range(int({self.variable.transpile(environment, indentation)} or 0), {self.end.transpile(environment, indentation)}, {self.increment.transpile(environment, indentation)}):\n{self.block.transpile(environment, indentation)}"
+        variable = self.variable.transpile(environment, indentation)
+        end = self.end.transpile(environment, indentation)
+        increment = self.increment.transpile(environment, indentation)
+        with environment.loop():
+            block = self.block.transpile(environment, indentation)
+        start = f"int({variable} or 0)"
+        return f"for {variable} in range({start}, {end}, {increment}):\n{block}"
 
     def tree(self):
         return [
@@ -508,51 +570,153 @@ class c_loop_statement:
         ]
 
 
-class c_def_statement:
+# Function scopes.
+#
+# Calls used to run in a copy of the whole environment they were defined in,
+# so their cost grew with the number of names a program defines.  A call now
+# runs in a Frame that only holds what the call sets and finds every other
+# name in the environment around it.  The call can't change that
+# environment, so this gives the same results as the copy did.
+#
+# Scope is the resolver: a function's local names are its parameters and
+# the names it assigns with set, lop or def.  The closures engine in
+# closures.py gives each of them a slot in its frames.
+
+
+def assigned_names(statements):
+    """Generate the names statements assign, not looking into functions."""
+    for statement in statements:
+        kind = type(statement)
+        if kind is c_set_statement:
+            yield statement.variable
+        elif kind is c_loop_statement:
+            yield statement.variable_name
+            yield from assigned_names(statement.block.statements)
+        elif kind is c_def_statement:
+            yield statement.name
+        elif kind is c_if_statement:
+            yield from assigned_names(statement.block.statements)
+        elif kind is c_if_else_statement:
+            yield from assigned_names([statement.if_statement])
+            yield from assigned_names(statement.else_block.statements)
+        elif kind is c_block:
+            yield from assigned_names(statement.statements)
+
+
+class Scope:
+    __slots__ = ("parameters", "names")
+
+    def __init__(self, def_statement):
+        self.parameters = tuple(param.name for param in def_statement.parameters)
+        names = dict.fromkeys(self.parameters)
+        names.update(dict.fromkeys(assigned_names(def_statement.block.statements)))
+        self.names = tuple(names)  # Parameters first
+
+
+class Frame(dict):
+    """Environment of one function call, in front of the environment the
+    function was defined in.  It holds the names set during the call and
+    finds the others in the parent, which the call never changes."""
+
+    __slots__ = ("parent",)
+
+    def __missing__(self, name):
+        return self.parent[name]
+
+    def __contains__(self, name):
+        return dict.__contains__(self, name) or name in self.parent
+
+    def get(self, name, default=None):
+        if dict.__contains__(self, name):
+            return dict.__getitem__(self, name)
+        return self.parent.get(name, default)
+
+
+class c_def_statement(c_node):
     def __init__(self, name, parameters, block):
         self.name = name
         self.parameters = parameters
         self.block = block
+        self.scope = None  # Worked out on the first call
 
     def execute(self, environment):
         def func(*args):
-            new_environment = environment.copy()
-            for param, arg in zip(self.parameters, args):
-                new_environment[param.name] = arg
-            return self.block.execute(new_environment)
+            if self.scope is None:
+                self.scope = Scope(self)
+            frame = Frame(zip(self.scope.parameters, args))
+            frame.parent = environment
+            try:
+                self.block.execute(frame)
+            except ReturnSignal as signal:
+                return signal.value
+            except LoopSignal as signal:
+                raise signal.misplaced() from None
 
         environment[self.name] = func
 
     def transpile(self, environment, indentation):
-        environment[self.name] = type(self.name, (), {})
-        param_names = [param.name for param in self.parameters]
-        # Add all the parameters to the environment
-        for param in param_names:
-            environment[param] = None
-        param_names_str = ", ".join(param_names)
-        body = self.block.transpile(environment, indentation)
-        return f"def {self.name}({param_names_str}):\n{body}"
+        name = environment.name(self.name)
+        indent_str = "\t" * (indentation + 1)
+        try:
+            scope = Scope(self)
+        except AttributeError as e:
+            # A parameter that isn't a name fails when the function is called
+            return f"def {name}(*args):\n{indent_str}raise AttributeError({str(e)!r})"
+        with environment.function(scope, self.block) as (args, prologue):
+            body = self.block.transpile(environment, indentation)
+        prologue = "".join(f"{indent_str}{line}\n" for line in prologue)
+        return f"def {name}(*{args}):\n{prologue}{body}"
 
     def tree(self):
         param_names = [param.tree() for param in self.parameters]
         return [c_def_statement, param_names, self.block.tree()]
 
 
-class c_return_statement:
+class c_return_statement(c_node):
     def __init__(self, expression):
         self.expression = expression
 
     def execute(self, environment):
-        return ("return", self.expression.execute(environment))
+        raise ReturnSignal(self.expression.execute(environment))
 
     def transpile(self, environment, indentation=0):
-        return "return " + self.expression.transpile(environment, indentation)
+        expression = self.expression.transpile(environment, indentation)
+        if environment.frames:
+            return "return " + expression
+        # ret outside of a function ends the program
+        return f"{expression}\n" + ("\t" * indentation) + "raise SystemExit"
 
     def tree(self):
         return [c_return_statement, self.expression.tree()]
 
 
-class c_set_statement:
+class c_break_statement(c_node):
+    def execute(self, environment):
+        raise BreakSignal()
+
+    def transpile(self, environment, indentation=0):
+        if environment.loops:
+            return "break"
+        return 'raise Exception("brk outside of a lop")'
+
+    def tree(self):
+        return [c_break_statement]
+
+
+class c_continue_statement(c_node):
+    def execute(self, environment):
+        raise ContinueSignal()
+
+    def transpile(self, environment, indentation=0):
+        if environment.loops:
+            return "continue"
+        return 'raise Exception("cnt outside of a lop")'
+
+    def tree(self):
+        return [c_continue_statement]
+
+
+class c_set_statement(c_node):
     def __init__(self, variable, expression):
         self.variable = variable
         self.expression = expression
@@ -561,15 +725,252 @@ class c_set_statement:
         environment[self.variable] = self.expression.execute(environment)
 
     def transpile(self, environment, indentation):
-        environment[self.variable] = None
-        return (
-            f"{self.variable} = {self.expression.transpile(environment, indentation)}"
-        )
+        variable = environment.name(self.variable)
+        return f"{variable} = {self.expression.transpile(environment, indentation)}"
 
     def tree(self):
         return [c_set_statement, self.variable, self.expression.tree()]
 
 
+# Transpiling.
+#
+# transpile() writes a program as Python code that runs the way
+# c_program.execute() does.  c_program.transpile() passes a TranspileScope
+# down the tree in place of the environment.  It knows the Python name of
+# every name, the functions and lops the node being written is in, and
+# which names may hold a function.
+#
+#   - Every name starts out as None, as reading a name that isn't set
+#     gives None.
+#   - A function takes its arguments as a tuple, as extra ones are left out
+#     and missing ones read the name around the function, as in a Frame.
+#     It starts by setting its local names, those of its Scope, to their
+#     values around it.  Nothing can change those while it runs.
+#   - A name read with or without arguments is only called if it holds a
+#     function then.  Names that no def sets and that aren't builtins never
+#     do, and a name that only the one def at the top level sets always
+#     does.
+#   - Names that are Python keywords or builtins, and local names that
+#     would hide the name they start out as, get other Python names.
+
+
+class TranspileScope:
+    def __init__(self, program, environment):
+        # Builtin name -> Python name of the function it holds
+        self.builtins = {
+            name: value.__name__
+            for name, value in environment.items()
+            if callable(value)
+        }
+        names = set()
+        defined = {}  # Name -> number of defs setting it
+        assigned = set()  # Names set otherwise, or parameters
+        for node in _walk(program):
+            kind = type(node)
+            if kind is c_env_call or kind is c_varible_call:
+                names.add(node.name)
+            elif kind is c_set_statement:
+                assigned.add(node.variable)
+            elif kind is c_loop_statement:
+                assigned.add(node.variable_name)
+            elif kind is c_def_statement:
+                defined[node.name] = defined.get(node.name, 0) + 1
+                for parameter in node.parameters:
+                    if type(parameter) is c_env_call:
+                        assigned.add(parameter.name)
+        names.update(defined, assigned)
+        top = {s.name for s in program.statements if type(s) is c_def_statement}
+        # Names that always hold the same function
+        self.functions = {
+            name
+            for name in names
+            if name not in assigned
+            and (
+                name in top
+                and defined[name] == 1
+                or name in self.builtins
+                and name not in defined
+            )
+        }
+        # Names that may hold a function
+        self.callables = set(defined).union(self.builtins)
+
+        self.used = {name for name in names if _python_name(name)}
+        self.used.update(self.builtins.values())
+        self.globals = {}  # Name -> Python name at the top level
+        for name in sorted(names):
+            if name in self.builtins:
+                self.globals[name] = self.builtins[name]
+            elif _python_name(name):
+                self.globals[name] = name
+            else:
+                self.globals[name] = self.fresh(name)
+        self.args = self.fresh("args")  # Arguments of a function
+        self.frames = []  # Name -> Python name, of every function we are in
+        self.loops = 0  # Number of lops we are in, in the function
+
+    def declaration(self):
+        """Return the statement setting every name to None."""
+        names = [
+            self.globals[name]
+            for name in sorted(self.globals)
+            if name not in self.builtins
+        ]
+        return " = ".join(names + ["None"]) if names else ""
+
+    def fresh(self, name):
+        """Return a Python name like name, that no other name has."""
+        while name in self.used or not _python_name(name):
+            name += "_"
+        self.used.add(name)
+        return name
+
+    def name(self, name):
+        """Return the Python name of name where we are."""
+        for frame in reversed(self.frames):
+            if name in frame:
+                return frame[name]
+        return self.globals[name]
+
+    def value(self, name, arguments):
+        """Return the Python expression for reading name with arguments, the
+        code of the expressions passed if it holds a function."""
+        python_name = self.name(name)
+        call = f"{python_name}({', '.join(arguments)})"
+        if name in self.functions:
+            return call
+        if name in self.callables:
+            return f"({call} if callable({python_name}) else {python_name})"
+        return python_name
+
+    @contextlib.contextmanager
+    def function(self, scope, block):
+        """Go into the function of Scope scope with the c_block block.
+        Yields the Python name of its arguments and the statements setting
+        its local names."""
+        frame = {}
+        for name in scope.names:
+            if name in self.builtins or any(name in f for f in self.frames):
+                frame[name] = self.fresh(self.globals[name])
+            else:
+                frame[name] = self.globals[name]
+
+        def outer(name):
+            python_name = self.name(name)
+            if python_name == frame[name]:
+                return f"globals()[{python_name!r}]"
+            return python_name
+
+        # Local names that are only set don't need to start out as anything
+        read = {
+            node.name
+            for node in _walk(block)
+            if type(node) is c_env_call or type(node) is c_varible_call
+        }
+        args = self.args
+        prologue = []
+        for i, name in enumerate(scope.parameters):
+            # A parameter given twice takes the last argument
+            missing = frame[name] if name in scope.parameters[:i] else outer(name)
+            prologue.append(
+                f"{frame[name]} = {args}[{i}] if len({args}) > {i} else {missing}"
+            )
+        for name in scope.names:
+            if name not in scope.parameters and name in read:
+                prologue.append(f"{frame[name]} = {outer(name)}")
+
+        loops = self.loops
+        self.frames.append(frame)
+        self.loops = 0
+        try:
+            yield args, prologue
+        finally:
+            self.frames.pop()
+            self.loops = loops
+
+    @contextlib.contextmanager
+    def loop(self):
+        """Go into a lop."""
+        self.loops += 1
+        try:
+            yield
+        finally:
+            self.loops -= 1
+
+
+def _python_name(name):
+    # Whether name can be used as it is in Python
+    return not (
+        keyword.iskeyword(name)
+        or hasattr(builtins, name)
+        or name.startswith("__")
+        and name.endswith("__")
+    )
+
+
+def _walk(node):
+    # Generate node and the nodes under it
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        yield node
+        for value in vars(node).values():
+            if isinstance(value, c_node):
+                stack.append(value)
+            elif type(value) is list:
+                stack.extend(v for v in value if isinstance(v, c_node))
+
+
+# Python operator and its precedence, from lowest to highest, each operator
+# node is written with
+_python_operators = {
+    c_or: ("or", 1),
+    c_nor: ("or", 1),
+    c_and: ("and", 2),
+    c_nand: ("and", 2),
+    c_equal: ("==", 4),
+    c_xor: ("^", 5),
+    c_xnor: ("^", 5),
+    c_plus: ("+", 6),
+    c_minus: ("-", 6),
+    c_mul: ("*", 7),
+    c_div: ("/", 7),
+    c_mod: ("%", 7),
+    c_power: ("**", 8),
+}
+
+# Precedence of the Python code of each node that isn't a single term.
+# not, nand, nor and xnor are written with not.
+_python_precedence = {
+    kind: operator[1] for kind, operator in _python_operators.items()
+}
+_python_precedence.update({c_not: 3, c_nand: 3, c_nor: 3, c_xnor: 3})
+
+# Operators that don't group from the left: == chains and ** groups from
+# the right
+_python_ungrouped = {4, 8}
+
+
+def transpile_operand(node, environment, indentation, precedence, right=False):
+    """Return the Python code of node as an operand of an operator of
+    precedence, in parentheses if Python would group it otherwise."""
+    code = node.transpile(environment, indentation)
+    own = _python_precedence.get(type(node))
+    grouped = right or precedence in _python_ungrouped
+    if own is not None and (own < precedence or own == precedence and grouped):
+        return f"({code})"
+    return code
+
+
+def transpile_binary(node, environment, indentation):
+    """Return the Python code of the operator node without the not of nand,
+    nor and xnor."""
+    operator, precedence = _python_operators[type(node)]
+    left = transpile_operand(node.left, environment, indentation, precedence)
+    right = transpile_operand(node.right, environment, indentation, precedence, True)
+    return f"{left} {operator} {right}"
+
+
 precedence = (
     ("left", "PLUS", "MINUS"),
     ("left", "MUL", "DIV", "MODULUS"),
@@ -578,194 +979,258 @@ precedence = (
 )
 
 
-def p_program(p):
+# The rule functions use the positional protocol: each is called with the
+# values of the right hand side of its rule and returns the value of the left
+# hand side.  Rules of different lengths get a function each.
+
+
+@yacc.positional
+def p_program(statements):
     """program : statements"""
-    p[0] = c_program(p[1])
+    return c_program(statements)
 
 
-def p_block(p):
+@yacc.positional
+def p_block(indent, statements, dedent):
     """block : INDENT statements DEDENT"""
-    p[0] = c_block(p[2])
+    return c_block(statements)
 
 
-def p_statements(p):
-    """statements : statement
-    | statements statement"""
-    if len(p) == 2:
-        p[0] = [p[1]]
-    else:
-        p[0] = p[1] + [p[2]]
+@yacc.positional
+def p_statements(statement):
+    """statements : statement"""
+    return [statement]
+
 
+@yacc.positional
+def p_statements_append(statements, statement):
+    """statements : statements statement"""
+    # The list is only referenced from the parser stack, so it can grow in
+    # place instead of being copied on every reduction
+    statements.append(statement)
+    return statements
 
-def p_statement(p):
+
+@yacc.positional
+def p_statement(statement):
     """statement : if_else_statement
     | if_statement
     | def_statement
     | set_statement
     | loop_statement
     | return_statement
+    | break_statement
+    | continue_statement
     | expression_statement
     | function_call
     | blankspace"""
-    p[0] = p[1]
+    return statement
 
 
-def p_newline(p):
+@yacc.positional
+def p_newline(newline):
     """blankspace : NEWLINE"""
-    p[0] = c_newline()
+    return c_newline()
 
 
-def p_function_call(p):
+@yacc.positional
+def p_function_call(name, arg):
     """function_call : IDENT arg"""
-    p[0] = c_env_call(p[1], p[2])
+    return c_env_call(name, arg)
 
 
-def p_if_statement(p):
+@yacc.positional
+def p_if_statement(iff, condition, block):
     """if_statement : IFF expression block"""
-    p[0] = c_if_statement(p[2], p[3])
+    return c_if_statement(condition, block)
 
 
-def p_if_else_statement(p):
+@yacc.positional
+def p_if_else_statement(if_statement, else_statement):
     """if_else_statement : if_statement else_statement"""
-    p[0] = c_if_else_statement(p[1], p[2])
+    return c_if_else_statement(if_statement, else_statement)
 
 
-def p_else_statement(p):
+@yacc.positional
+def p_else_statement(els, block):
     """else_statement : ELS block"""
-    p[0] = p[2]
+    return block
 
 
-def p_def_statement(p):
+@yacc.positional
+def p_def_statement(def_, name, arg, block):
     """def_statement : DEF IDENT arg block"""
-    p[0] = c_def_statement(p[2], p[3], p[4])
+    return c_def_statement(name, arg, block)
 
 
-def p_set_statement(p):
+@yacc.positional
+def p_set_statement(set_, name, expression):
     """set_statement : SET IDENT expression"""
-    p[0] = c_set_statement(p[2], p[3])
+    return c_set_statement(name, expression)
 
 
-def p_arg(p):
-    """arg : expression
-    | arg expression
-    |"""
-    if len(p) == 2:
-        p[0] = [p[1]]
-    elif len(p) == 3:
-        p[0] = p[1] + [p[2]]
-    else:
-        p[0] = []
+@yacc.positional
+def p_arg(expression):
+    """arg : expression"""
+    return [expression]
+
 
+@yacc.positional
+def p_arg_append(arg, expression):
+    """arg : arg expression"""
+    arg.append(expression)
+    return arg
 
-def p_loop_statement(p):
+
+@yacc.positional
+def p_arg_empty():
+    """arg :"""
+    return []
+
+
+@yacc.positional
+def p_loop_statement(lop, name, increment, end, block):
     """loop_statement : LOP IDENT expression expression block"""
-    p[0] = c_loop_statement(p[2], p[3], p[4], p[5])
+    return c_loop_statement(name, increment, end, block)
 
 
-def p_expression_number(p):
+@yacc.positional
+def p_expression_number(number):
     "expression : NUMBER"
-    p[0] = c_number(p[1])
+    return c_number(number)
 
 
-def p_expression_string(p):
+@yacc.positional
+def p_expression_string(string):
     "expression : STRING"
-    p[0] = c_string(p[1])
+    return c_string(string)
 
 
-def p_expression_bool(p):
+@yacc.positional
+def p_expression_bool(value):
     "expression : BOOL"
-    p[0] = c_bool(p[1])
+    return c_bool(value)
 
 
-def p_expression_function_call(p):
+@yacc.positional
+def p_expression_function_call(function_call):
     "expression : function_call"
-    p[0] = p[1]
+    return function_call
 
 
-def p_expression_group(p):
+@yacc.positional
+def p_expression_group(lparen, expression, rparen):
     "expression : LPAREN expression RPAREN"
-    p[0] = c_group(p[2])
+    return c_group(expression)
 
 
-def p_expression_power(p):
+@yacc.positional
+def p_expression_power(left, op, right):
     "expression : expression POWER expression"
-    p[0] = c_power(p[1], p[3])
+    return c_power(left, right)
 
 
-def p_expression_mul(p):
+@yacc.positional
+def p_expression_mul(left, op, right):
     "expression : expression MUL expression"
-    p[0] = c_mul(p[1], p[3])
+    return c_mul(left, right)
 
 
-def p_expression_div(p):
+@yacc.positional
+def p_expression_div(left, op, right):
     "expression : expression DIV expression"
-    p[0] = c_div(p[1], p[3])
+    return c_div(left, right)
 
 
-def p_expression_plus(p):
+@yacc.positional
+def p_expression_plus(left, op, right):
     "expression : expression PLUS expression"
-    p[0] = c_plus(p[1], p[3])
+    return c_plus(left, right)
 
 
-def p_expression_minus(p):
+@yacc.positional
+def p_expression_minus(left, op, right):
     "expression : expression MINUS expression"
-    p[0] = c_minus(p[1], p[3])
+    return c_minus(left, right)
 
 
-def p_expression_modulus(p):
+@yacc.positional
+def p_expression_modulus(left, op, right):
     "expression : expression MODULUS expression"
-    p[0] = c_mod(p[1], p[3])
+    return c_mod(left, right)
 
 
-def p_expression_not(p):
+@yacc.positional
+def p_expression_not(op, expression):
     "expression : NOT expression"
-    p[0] = c_not(p[2])
+    return c_not(expression)
 
 
-def p_expression_and(p):
+@yacc.positional
+def p_expression_and(left, op, right):
     "expression : expression AND expression"
-    p[0] = c_and(p[1], p[3])
+    return c_and(left, right)
 
 
-def p_expression_or(p):
+@yacc.positional
+def p_expression_or(left, op, right):
     "expression : expression OR expression"
-    p[0] = c_or(p[1], p[3])
+    return c_or(left, right)
 
 
-def p_expression_xor(p):
+@yacc.positional
+def p_expression_xor(left, op, right):
     "expression : expression XOR expression"
-    p[0] = c_xor(p[1], p[3])
+    return c_xor(left, right)
 
 
-def p_expression_nand(p):
+@yacc.positional
+def p_expression_nand(left, op, right):
     "expression : expression NAND expression"
-    p[0] = c_nand(p[1], p[3])
+    return c_nand(left, right)
 
 
-def p_expression_nor(p):
+@yacc.positional
+def p_expression_nor(left, op, right):
     "expression : expression NOR expression"
-    p[0] = c_nor(p[1], p[3])
+    return c_nor(left, right)
 
 
-def p_expression_xnor(p):
+@yacc.positional
+def p_expression_xnor(left, op, right):
     "expression : expression XNOR expression"
-    p[0] = c_xnor(p[1], p[3])
+    return c_xnor(left, right)
 
 
-def p_equal(p):
+@yacc.positional
+def p_equal(left, op, right):
     "expression : expression EQUAL expression"
-    p[0] = c_equal(p[1], p[3])
+    return c_equal(left, right)
 
 
 # TODO: make c_return_statement
-def p_return_statement(p):
+@yacc.positional
+def p_return_statement(ret, expression):
     """return_statement : RET expression"""
-    p[0] = c_return_statement(p[2])
+    return c_return_statement(expression)
+
+
+@yacc.positional
+def p_break_statement(brk):
+    """break_statement : BRK"""
+    return c_break_statement()
+
+
+@yacc.positional
+def p_continue_statement(cnt):
+    """continue_statement : CNT"""
+    return c_continue_statement()
 
 
-def p_expression_statement(p):
+@yacc.positional
+def p_expression_statement(expression):
     "expression_statement : expression"
-    p[0] = p[1]
+    return expression
 
 
 def p_error(p):
@@ -778,67 +1243,15 @@ def p_error(p):
 parser = yacc.yacc()
 
 
-# open test.bthn file and get contents to set as code
-with open("helloworld.bthn", "r") as f:
-    code = f.read()
-
-print("\n")
-
-lexer.input(code)
-
-tokenQueue = []
-
-
-def get_token():
-    token = lexer.token()
-    if not token:
-        return token
-    if (token.type == "INDENT" or token.type == "DEDENT") and token.value > 1:
-        for i in range(token.value):
-            tokenQueue.append(token)
-    else:
-        tokenQueue.append(token)
-    return tokenQueue.pop(0)
-
-
-while True:
-    tok = get_token()
-    if not tok:
-        break
-    print(tok)
-
-
-class color:
-    PURPLE = "\033[95m"
-    CYAN = "\033[96m"
-    DARKCYAN = "\033[36m"
-    BLUE = "\033[94m"
-    GREEN = "\033[92m"
-    YELLOW = "\033[93m"
-    RED = "\033[91m"
-    BOLD = "\033[1m"
-    UNDERLINE = "\033[4m"
-    END = "\033[0m"
-
-
-print(
-    color.BOLD
-    + "\n  -\tBithon Code: \n"
-    + color.END
-    + code
-    + color.BOLD
-    + "\n\n  -\tAbstract Syntax Tree: "
-    + color.END
-)
-
-program_ast = parser.parse(code, lexer=lexer)
-
 BuiltInEnv = {
     "prn": print,
     # Add other built-in functions here...
 }
 
-ExecEnv = BuiltInEnv.copy()
+
+def find_column(source, lexpos):
+    """Return the 1-based column of offset lexpos in source, as for a span."""
+    return lexpos - source.rfind("\n", 0, lexpos)
 
 
 def print_ast(ast, indent=0):
@@ -859,24 +1272,3 @@ def print_ast(ast, indent=0):
 
     for node in ast[1:]:
         print_ast(node, indent + 1)
-
-
-ASTree = program_ast.tree()
-
-print_ast(ASTree)
-
-# print(color.BOLD + "\n  -\tExecution: " + color.END)
-
-# program_ast.execute(ExecEnv)
-
-
-print(color.BOLD + "\n  -\tTranspiled Python Code: " + color.END)
-
-TranspilerEnv = BuiltInEnv.copy()
-
-pythonCode = program_ast.transpile(TranspilerEnv)
-print(pythonCode)
-
-print(color.BOLD + "\n  -\tExecution:" + color.END)
-
-exec(pythonCode)
@@ -0,0 +1,235 @@
+import functools
+
+import compiler
+from compiler import (
+    c_and,
+    c_block,
+    c_bool,
+    c_break_statement,
+    c_continue_statement,
+    c_def_statement,
+    c_div,
+    c_env_call,
+    c_equal,
+    c_group,
+    c_if_else_statement,
+    c_if_statement,
+    c_loop_statement,
+    c_minus,
+    c_mod,
+    c_mul,
+    c_nand,
+    c_newline,
+    c_nor,
+    c_not,
+    c_number,
+    c_or,
+    c_plus,
+    c_power,
+    c_program,
+    c_return_statement,
+    c_set_statement,
+    c_string,
+    c_xnor,
+    c_xor,
+)
+from lexer import IndentFilter
+
+# A hand-written recursive descent parser for Bithon, with precedence
+# climbing for the binary operators.  It builds the same trees as the LALR
+# parser in compiler.py without going through the parser tables.
+#
+# The grammar leaves most of its conflicts to yacc's defaults, and this
+# parser follows the choices yacc makes:
+#
+#   - Operators listed in compiler.precedence bind as listed there.  All the
+#     others bind less tightly than any of those and group to the right,
+#     and so does the operand of not.
+#   - A function call takes every expression that follows its name as an
+#     argument, each as long as it can be.
+#
+# The parser works on the whole token list at once.  At a syntax error it
+# gives the tokens to the LALR parser instead, so errors are reported and
+# recovered from exactly as before.
+
+# Tokens that can start an expression
+_expression_start = frozenset(("NUMBER", "STRING", "BOOL", "LPAREN", "IDENT", "NOT"))
+
+_binary_nodes = {
+    "POWER": c_power,
+    "MUL": c_mul,
+    "DIV": c_div,
+    "MODULUS": c_mod,
+    "PLUS": c_plus,
+    "MINUS": c_minus,
+    "AND": c_and,
+    "OR": c_or,
+    "XOR": c_xor,
+    "NAND": c_nand,
+    "NOR": c_nor,
+    "XNOR": c_xnor,
+    "EQUAL": c_equal,
+}
+
+
+def _binary_operators():
+    # Operator -> (binding power, groups to the right, node class).  Binding
+    # power 0 is for the operators without a precedence.
+    levels = {}
+    for level, (assoc, *operators) in enumerate(compiler.precedence, 1):
+        for op in operators:
+            levels[op] = (level, assoc == "right")
+    return {
+        op: levels.get(op, (0, True)) + (node,) for op, node in _binary_nodes.items()
+    }
+
+
+_binary = _binary_operators()
+
+
+class ParseError(Exception):
+    pass
+
+
+class _Descent:
+    # The state of one parse.  types is the token types with a final $end.
+    def __init__(self, types, value):
+        self.types = types
+        self.value = value  # Token index -> value
+        self.pos = 0
+
+    def expect(self, type):
+        if self.types[self.pos] != type:
+            raise ParseError(self.pos)
+        self.pos += 1
+        return self.pos - 1
+
+    def program(self):
+        statements = self.statements("$end")
+        self.expect("$end")
+        return c_program(statements)
+
+    def statements(self, end):
+        statements = [self.statement()]
+        types = self.types
+        while types[self.pos] != end:
+            statements.append(self.statement())
+        return statements
+
+    def block(self):
+        self.expect("INDENT")
+        statements = self.statements("DEDENT")
+        self.expect("DEDENT")
+        return c_block(statements)
+
+    def statement(self):
+        t = self.types[self.pos]
+        if t in _expression_start:
+            return self.expression(0)
+        if t == "NEWLINE":
+            self.pos += 1
+            return c_newline()
+        self.pos += 1
+        if t == "SET":
+            name = self.value(self.expect("IDENT"))
+            return c_set_statement(name, self.expression(0))
+        if t == "IFF":
+            condition = self.expression(0)
+            statement = c_if_statement(condition, self.block())
+            if self.types[self.pos] == "ELS":
+                self.pos += 1
+                statement = c_if_else_statement(statement, self.block())
+            return statement
+        if t == "DEF":
+            name = self.value(self.expect("IDENT"))
+            arg = self.arguments()
+            return c_def_statement(name, arg, self.block())
+        if t == "LOP":
+            name = self.value(self.expect("IDENT"))
+            increment = self.expression(0)
+            end = self.expression(0)
+            return c_loop_statement(name, increment, end, self.block())
+        if t == "RET":
+            return c_return_statement(self.expression(0))
+        if t == "BRK":
+            return c_break_statement()
+        if t == "CNT":
+            return c_continue_statement()
+        raise ParseError(self.pos - 1)
+
+    def arguments(self):
+        arg = []
+        types = self.types
+        while types[self.pos] in _expression_start:
+            arg.append(self.expression(0))
+        return arg
+
+    def expression(self, min_power):
+        left = self.operand()
+        types = self.types
+        while True:
+            binary = _binary.get(types[self.pos])
+            if binary is None or binary[0] < min_power:
+                return left
+            power, right, node = binary
+            self.pos += 1
+            left = node(left, self.expression(power if right else power + 1))
+
+    def operand(self):
+        pos = self.pos
+        t = self.types[pos]
+        self.pos += 1
+        if t == "IDENT":
+            return c_env_call(self.value(pos), self.arguments())
+        if t == "NUMBER":
+            return c_number(self.value(pos))
+        if t == "STRING":
+            return c_string(self.value(pos))
+        if t == "BOOL":
+            return c_bool(self.value(pos))
+        if t == "LPAREN":
+            expression = self.expression(0)
+            self.expect("RPAREN")
+            return c_group(expression)
+        if t == "NOT":
+            return c_not(self.expression(0))
+        raise ParseError(pos)
+
+
+class Parser:
+    """Parser interface over the descent parser, for use in place of
+    compiler.parser.  lrparser takes over at syntax errors."""
+
+    def __init__(self, lrparser):
+        self.lrparser = lrparser
+
+    def clone(self):
+        return Parser(self.lrparser.clone())
+
+    def parse(self, input=None, lexer=None, debug=False, tracking=False):
+        if debug or tracking:
+            return self.lrparser.parse(input, lexer, debug, tracking)
+        if isinstance(lexer, IndentFilter) and hasattr(lexer.lexer, "tokenize_all"):
+            columns = lexer.tokenize_all(input)
+            types = list(map(columns.typenames.__getitem__, columns.types))
+            value = columns.value
+            tokens = columns
+        else:
+            if input is not None:
+                lexer.input(input)
+            tokens = list(iter(lexer.token, None))
+            types = [tok.type for tok in tokens]
+            value = lambda i: tokens[i].value
+        types.append("$end")
+        try:
+            return _Descent(types, value).program()
+        except (ParseError, RecursionError):
+            pass
+        source = functools.partial(next, iter(tokens), None)
+        return self.lrparser.parse(lexer=_TokenSource(source))
+
+
+class _TokenSource:
+    # Lexer interface over a token function
+    def __init__(self, token):
+        self.token = token
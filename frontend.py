@@ -0,0 +1,93 @@
+import threading
+
+import compiler
+from lexer import IndentFilter, lexer
+
+# The lexer and parser built when lexer.py and compiler.py are imported are
+# shared by the whole process.  A Frontend owns its own clone of each, so
+# sources can be lexed and parsed in several threads at the same time.  A
+# single Frontend must still only be used by one thread at a time.
+#
+# The scanner is either the lexer built by lex ("lex") or the specialized
+# scanner generated by scangen.py ("generated").  Both give the same tokens.
+#
+# The parser is the LRParser built by yacc ("lr"), the same parser run on the
+# whole source tokenized into columns first ("columns"), the straight-line
+# parser generated by parsegen.py ("generated") or the hand-written parser in
+# descent.py ("descent").  All of them give the same trees.  The generators
+# and descent.py are only imported when a frontend of theirs is made.
+
+scanners = ("lex", "generated")
+parsers = ("lr", "columns", "generated", "descent")
+
+
+def make_lexer(scanner="lex"):
+    # Return a new lexer of the given kind, independent of all others
+    if scanner == "generated":
+        import scangen
+
+        return scangen.load_scanner()()
+    elif scanner == "lex":
+        return lexer.clone()
+    raise ValueError(f"Unknown scanner {scanner!r}")
+
+
+def make_parser(parser="lr"):
+    # Return a new parser of the given kind, independent of all others
+    if parser == "generated":
+        import parsegen
+
+        return parsegen.load_parser()(compiler.parser.clone())
+    elif parser == "descent":
+        import descent
+
+        return descent.Parser(compiler.parser.clone())
+    elif parser == "columns":
+        return ColumnsParser(compiler.parser.clone())
+    elif parser == "lr":
+        return compiler.parser.clone()
+    raise ValueError(f"Unknown parser {parser!r}")
+
+
+class ColumnsParser:
+    """Parser interface that tokenizes the whole input into a TokenColumns
+    and runs the LRParser on it, for use in place of compiler.parser."""
+
+    def __init__(self, lrparser):
+        self.lrparser = lrparser
+
+    def clone(self):
+        return ColumnsParser(self.lrparser.clone())
+
+    def parse(self, input=None, lexer=None, debug=False, tracking=False):
+        if debug or tracking or not isinstance(lexer, IndentFilter):
+            return self.lrparser.parse(input, lexer, debug, tracking)
+        return self.lrparser.parse(lexer=lexer.tokenize_all(input))
+
+
+class Frontend:
+    def __init__(self, scanner="lex", parser="lr"):
+        self.lexer = make_lexer(scanner)
+        self.tokenstream = IndentFilter(self.lexer)
+        self.parser = make_parser(parser)
+
+    def tokenize(self, code):
+        self.tokenstream.input(code)
+        return list(self.tokenstream)
+
+    def parse(self, code, tracking=False):
+        return self.parser.parse(code, lexer=self.tokenstream, tracking=tracking)
+
+
+_local = threading.local()
+
+
+def get_frontend(scanner="lex", parser="lr"):
+    # Hand out one Frontend per thread, scanner and parser, built on first use
+    try:
+        frontends = _local.frontends
+    except AttributeError:
+        frontends = _local.frontends = {}
+    if (scanner, parser) not in frontends:
+        frontends[scanner, parser] = Frontend(scanner, parser)
+    return frontends[scanner, parser]
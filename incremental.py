@@ -0,0 +1,343 @@
+import bisect
+import contextlib
+import functools
+import io
+
+import compiler
+from frontend import make_lexer
+from lex import LexToken
+from lexer import IndentFilter
+
+# Incremental lexing for editors and watch modes.
+#
+# The source is split into records.  A record starts at a line start
+# checkpoint and runs up to and including the token made by t_NEWLINE, which
+# also takes the indentation of the next line.  t_NEWLINE is the only rule
+# that changes the line number or the indent stack, so every token of record
+# i is on line i + 1, and a record can be lexed again from its start given
+# only the indent stack in effect there.  The last record runs to the end of
+# the source and holds the tokens made by t_eof.
+#
+# After an edit, lexing restarts at the record the edit touches and stops as
+# soon as a new record ends, past the edit, where an old record started with
+# the same indent stack.  The old records from there on are reused as they
+# are, and their start offsets are only computed again when asked for.  The
+# work done depends on the size of the edit, not on the size of the source.
+#
+# What the lexer prints while lexing a record is kept with the record, along
+# with the token it was printed before, and only printed when the tokens are
+# read back, so that it comes out where a full parse prints it.
+
+# Types of the tokens made by t_NEWLINE
+_newline_types = ("NEWLINE", "INDENT", "DEDENT")
+
+
+class Record:
+    __slots__ = ("indents", "length", "tokens", "unterminated", "diagnostics")
+
+    def __init__(self, indents, length, tokens, unterminated, diagnostics=()):
+        self.indents = indents  # Indent stack at the start of the record
+        self.length = length  # Number of characters in the record
+        self.tokens = tokens  # (type, value, offset in the record) tuples
+        # True if a quote in the record didn't start a string.  The STRING
+        # rule then looked for a closing quote up to the end of the source.
+        self.unterminated = unterminated
+        # (index of a token, text) pairs of what the lexer printed before
+        # returning that token
+        self.diagnostics = diagnostics
+
+
+class IncrementalLexer:
+    def __init__(self, source="", scanner="lex"):
+        self.lexer = make_lexer(scanner)
+        self.source = ""
+        self.records = []
+        self.starts = [0]  # Start offsets of the first records
+        self.unterminated = 0  # Number of records with an unterminated quote
+        self.diagnostics = 0  # Number of records with diagnostics
+        self.edit(0, 0, source)
+
+    def start(self, i):
+        """Return the offset at which record i starts."""
+        starts = self.starts
+        records = self.records
+        while len(starts) <= i:
+            starts.append(starts[-1] + records[len(starts) - 1].length)
+        return starts[i]
+
+    def find(self, offset):
+        """Return the index of the record holding offset."""
+        starts = self.starts
+        records = self.records
+        while starts[-1] <= offset and len(starts) < len(records):
+            starts.append(starts[-1] + records[len(starts) - 1].length)
+        return bisect.bisect_right(starts, offset) - 1
+
+    def edit(self, start, end, text):
+        """Replace source[start:end] with text and lex again what changed.
+
+        Returns (first, removed, added): the removed old records starting at
+        index first were replaced by records[first:first + added].
+        """
+        records = self.records
+        self.source = source = self.source[:start] + text + self.source[end:]
+        delta = len(text) - (end - start)
+
+        # t_NEWLINE looks at the first character of the next record, so
+        # restart at the record holding the character before the edit.  A
+        # record with an unterminated quote depends on all the text after it.
+        first = self.find(start - 1) if start > 0 and records else 0
+        if self.unterminated:
+            for i in range(first):
+                if records[i].unterminated:
+                    first = i
+                    break
+        pos = self.start(first) if records else 0
+        indents = records[first].indents if records else (0,)
+
+        self.lexer.input(source)
+        new = []
+        old = first  # Index of the next old record that might be reused
+        old_pos = pos  # Start offset of records[old] in the old source
+        while True:
+            record, indents = self._lex_record(pos, indents)
+            new.append(record)
+            pos += record.length
+            if indents is None:
+                old = len(records)
+                break
+            if pos >= start + len(text):
+                # Past the edit.  Check for an old record starting here
+                target = pos - delta
+                while old < len(records) and old_pos < target:
+                    old_pos += records[old].length
+                    old += 1
+                if (
+                    old_pos == target
+                    and old < len(records)
+                    and records[old].indents == indents
+                ):
+                    break
+
+        self.unterminated += sum(r.unterminated for r in new) - sum(
+            r.unterminated for r in records[first:old]
+        )
+        self.diagnostics += sum(bool(r.diagnostics) for r in new) - sum(
+            bool(r.diagnostics) for r in records[first:old]
+        )
+        records[first:old] = new
+        del self.starts[first + 1 :]
+        return first, old - first, len(new)
+
+    def _lex_record(self, pos, indents):
+        # Lex one record starting at pos.  Returns the record and the indent
+        # stack at the start of the next one (None for the last record).
+        lexer = self.lexer
+        lexer.lexpos = pos
+        lexer.indents = list(indents)
+        tokens = []
+        strings = 0
+        diagnostics = []
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            while True:
+                tok = lexer.token()
+                if output.tell():
+                    diagnostics.append((len(tokens), output.getvalue()))
+                    output.seek(0)
+                    output.truncate()
+                if tok is None:
+                    end = len(self.source)
+                    break
+                tokens.append((tok.type, tok.value, tok.lexpos - pos))
+                if tok.type == "STRING":
+                    strings += tok.value.count('"')
+                elif tok.type in _newline_types and lexer.lexpos > tok.lexpos:
+                    end = lexer.lexpos
+                    break
+        unterminated = self.source.count('"', pos, end) != strings
+        record = Record(indents, end - pos, tokens, unterminated, diagnostics or ())
+        return record, tuple(lexer.indents) if tok else None
+
+    def tokens(self, first=0, last=None, report=False):
+        """Generate the tokens of records[first:last] as LexTokens.
+
+        If report is true, what the lexer printed is printed again as the
+        tokens are generated.
+        """
+        if last is None:
+            last = len(self.records)
+        for i in range(first, last):
+            record = self.records[i]
+            start = self.start(i)
+            diagnostics = record.diagnostics if report else ()
+            d = 0
+            for j, (type, value, offset) in enumerate(record.tokens):
+                while d < len(diagnostics) and diagnostics[d][0] == j:
+                    print(diagnostics[d][1], end="")
+                    d += 1
+                tok = LexToken()
+                tok.type = type
+                tok.value = value
+                tok.lineno = i + 1
+                tok.lexpos = start + offset
+                yield tok
+            for _, text in diagnostics[d:]:
+                print(text, end="")
+
+    def report(self, first=0, last=None):
+        """Print what the lexer printed for records[first:last]."""
+        if not self.diagnostics:
+            return
+        for record in self.records[first:last]:
+            for _, text in record.diagnostics:
+                print(text, end="")
+
+
+# Incremental parsing on top of IncrementalLexer.
+#
+# The program is split into regions of whole records, each holding one or
+# more top-level statements.  A region starts at a record that starts at
+# indentation level 0, unless the record starts with ELS, which belongs to
+# the if statement before it.  Every region parses on its own to the same
+# statements it makes in the whole program, so after an edit only the
+# regions holding changed records are parsed again, and the statements of
+# all the others, blocks included, are reused.
+#
+# The LRParser recovers from a syntax error by dropping everything it parsed
+# before the error and parsing on from the tokens after it.  So a program
+# with errors is what the LRParser makes of the tokens from the first region
+# with an error on, and only those are parsed again, with the errors
+# reported as the LRParser reports them.
+
+
+class Region:
+    __slots__ = ("length", "statements")
+
+    def __init__(self, length, statements):
+        self.length = length  # Number of records in the region
+        self.statements = statements  # Top-level statements (None on error)
+
+
+class IncrementalParser:
+    def __init__(self, source="", scanner="lex"):
+        self.lexer = IncrementalLexer(source, scanner)
+        self.parser = compiler.parser.clone()
+        # Regions are parsed by a parser that stops at the first error
+        self.region_parser = compiler.parser.clone()
+        self.region_parser.errorfunc = _region_error
+        self.regions = self._parse_regions(0, len(self.lexer.records))
+
+    @property
+    def source(self):
+        return self.lexer.source
+
+    def edit(self, start, end, text):
+        """Replace source[start:end] with text and return the new program."""
+        first, removed, added = self.lexer.edit(start, end, text)
+        regions = self.regions
+
+        # Find the regions holding the removed records.  A region starting
+        # at the first of them may now have to join the one before it.
+        r = rec = 0
+        while r < len(regions) and rec + regions[r].length <= first:
+            rec += regions[r].length
+            r += 1
+        if rec == first and r > 0:
+            r -= 1
+            rec -= regions[r].length
+        last = r
+        end_rec = rec
+        while last < len(regions) and end_rec < first + removed:
+            end_rec += regions[last].length
+            last += 1
+
+        regions[r:last] = self._parse_regions(rec, end_rec + added - removed)
+        return self.program()
+
+    def program(self):
+        """Return the c_program for the current source.
+
+        The program is what the LRParser gives for the whole source, None or
+        one recovered from syntax errors included, and the lexer and parser
+        print their messages in the order they print them in a full parse.
+        Its nodes are copies, so it can be changed, by optimize() say,
+        without changing the statements kept for the next edit.
+        """
+        statements = []
+        rec = 0
+        for region in self.regions:
+            if region.statements is None:
+                break
+            statements.extend(region.statements)
+            rec += region.length
+        else:
+            if statements:
+                self.lexer.report()
+                return compiler.c_program(_copy(statements))
+            # No tokens at all, which the LRParser reports as an error
+            rec = 0
+        self.lexer.report(0, rec)
+        tokens = self.lexer.tokens(rec, report=True)
+        return self.parser.parse(lexer=IndentFilter(_TokenSource(tokens)))
+
+    def _starts_region(self, i):
+        record = self.lexer.records[i]
+        return record.indents == (0,) and not (
+            record.tokens and record.tokens[0][0] == "ELS"
+        )
+
+    def _parse_regions(self, first, last):
+        # Split records[first:last] into regions and parse them
+        regions = []
+        start = first
+        for i in range(first + 1, last + 1):
+            if i == last or self._starts_region(i):
+                regions.append(Region(i - start, self._parse(start, i)))
+                start = i
+        return regions
+
+    def _parse(self, first, last):
+        tokens = self.lexer.tokens(first, last)
+        if not any(self.lexer.records[i].tokens for i in range(first, last)):
+            return []
+        tokenstream = IndentFilter(_TokenSource(tokens))
+        try:
+            program = self.region_parser.parse(lexer=tokenstream)
+        except _RegionError:
+            return None
+        return program.statements
+
+
+def _copy(statements):
+    # Copy the nodes of statements, and the nodes under them
+    return [_copy_node(statement) for statement in statements]
+
+
+def _copy_node(node):
+    copy = object.__new__(type(node))
+    attributes = copy.__dict__ = node.__dict__.copy()
+    for name, value in attributes.items():
+        if type(value) is list:
+            attributes[name] = [
+                _copy_node(item) if isinstance(item, compiler.c_node) else item
+                for item in value
+            ]
+        elif isinstance(value, compiler.c_node):
+            attributes[name] = _copy_node(value)
+    return copy
+
+
+class _TokenSource:
+    # Lexer interface over an iterator of tokens
+    def __init__(self, tokens):
+        self.token = functools.partial(next, tokens, None)
+
+
+class _RegionError(Exception):
+    pass
+
+
+def _region_error(token):
+    # Error function of the region parser
+    raise _RegionError
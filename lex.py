@@ -38,7 +38,20 @@ import sys
 import types
 import copy
 import os
+import io
+import codecs
 import inspect
+import importlib.util
+import functools
+from array import array
+
+try:
+    from re import _parser as sre_parse, _constants as sre_constants
+except ImportError:  # Python < 3.11
+    import sre_parse
+    import sre_constants
+
+__tabversion__ = "3.10"  # Version of table file used
 
 # This tuple contains acceptable string types
 StringTypes = (str, bytes)
@@ -61,6 +74,92 @@ class LexToken(object):
         return f"LexToken({self.type},{self.value!r},{self.lineno},{self.lexpos})"
 
 
+# -----------------------------------------------------------------------------
+# TokenColumns
+#
+# A whole token stream stored column by column, as produced by
+# Lexer.tokenize_all().  Token i has the type typenames[types[i]], starts at
+# lexpos[i] and ends at ends[i] in the input, and was found on line lineno[i].
+# Its value is the slice data[lexpos[i]:ends[i]] of the input unless the rule
+# that produced it set some other value, in which case the value is kept in
+# the values dictionary.  No per-token objects are kept.
+# -----------------------------------------------------------------------------
+class TokenColumns(object):
+    def __init__(self, data, typenames):
+        self.data = data  # Input string (None if values are all kept in values)
+        self.typenames = list(typenames)  # Type id -> token type name
+        self.typeids = {name: i for i, name in enumerate(self.typenames)}
+        self.types = array("H")  # Token type ids
+        self.lexpos = array("l")  # Start offsets
+        self.ends = array("l")  # End offsets
+        self.lineno = array("l")  # Line numbers
+        self.values = {}  # Token index -> value, for values that are not slices
+
+    def __len__(self):
+        return len(self.types)
+
+    # Return the type id of a token type name, adding it if it is new
+    def typeid(self, name):
+        i = self.typeids.get(name)
+        if i is None:
+            i = self.typeids[name] = len(self.typenames)
+            self.typenames.append(name)
+        return i
+
+    def type(self, i):
+        return self.typenames[self.types[i]]
+
+    def value(self, i):
+        values = self.values
+        if i in values:
+            return values[i]
+        return self.data[self.lexpos[i] : self.ends[i]]
+
+    # Build a LexToken for token i.  Only meant for error reporting and
+    # debugging, since it defeats the purpose of the columnar storage.
+    def token(self, i):
+        tok = LexToken()
+        tok.type = self.type(i)
+        tok.value = self.value(i)
+        tok.lineno = self.lineno[i]
+        tok.lexpos = self.lexpos[i]
+        return tok
+
+    def __iter__(self):
+        for i in range(len(self.types)):
+            yield self.token(i)
+
+    # Repeat tokens in place.  counts maps a token index to the number of
+    # times the token should appear.
+    def repeat(self, counts):
+        if not counts:
+            return
+        columns = [self.types, self.lexpos, self.ends, self.lineno]
+        result = [array(c.typecode) for c in columns]
+        start = 0
+        for i in sorted(counts):
+            for c, r in zip(columns, result):
+                r.extend(c[start:i])
+                r.extend(c[i : i + 1] * counts[i])
+            start = i + 1
+        for c, r in zip(columns, result):
+            r.extend(c[start:])
+        self.types, self.lexpos, self.ends, self.lineno = result
+
+        # Move the explicit values to their new indices
+        values = {}
+        shift = 0
+        repeated = sorted(counts)
+        k = 0
+        for i in sorted(self.values):
+            while k < len(repeated) and repeated[k] < i:
+                shift += counts[repeated[k]] - 1
+                k += 1
+            for j in range(counts.get(i, 1)):
+                values[i + shift + j] = self.values[i]
+        self.values = values
+
+
 # This object is a stand-in for a logging object created by the
 # logging module.
 
@@ -117,6 +216,12 @@ class Lexer:
         self.lexdata = None  # Actual input data (as a string)
         self.lexpos = 0  # Current position in input text
         self.lexlen = 0  # Length of the input text
+        self.lexbase = 0  # Offset of lexdata within the whole input
+        self.lexstream = None  # File object or mmap being read (if any)
+        self.lexdecoder = None  # Incremental decoder for binary streams
+        self.lexlimit = 0  # Position past which the window is refilled
+        self.lexwindow = 65536  # Number of characters read per refill
+        self.lexmargin = 4096  # Characters kept available ahead of lexpos
         self.lexerrorf = None  # Error rule (if any)
         self.lexeoff = None  # EOF rule (if any)
         self.lextokens = None  # List of valid tokens
@@ -152,13 +257,176 @@ class Lexer:
             c.lexmodule = object
         return c
 
+    # ------------------------------------------------------------
+    # writetab() - Write lexer information to a table file.  The
+    # file is written to a temporary file that then replaces the
+    # table file, so that it is never read half written.
+    # ------------------------------------------------------------
+    def writetab(self, lextab, outputdir="", signature=""):
+        filename = os.path.join(outputdir, lextab) + ".py"
+        tmpname = f"{filename}.{os.getpid()}.tmp"
+        try:
+            self._writetab(tmpname, lextab, signature)
+            os.replace(tmpname, filename)
+        except BaseException:
+            try:
+                os.remove(tmpname)
+            except OSError:
+                pass
+            raise
+
+    def _writetab(self, tmpname, lextab, signature):
+        with open(tmpname, "w") as tf:
+            tf.write(
+                f"# {lextab}.py. This file automatically created by PLY. Don't edit!\n"
+            )
+            tf.write(f"_tabversion   = {__tabversion__!r}\n")
+            tf.write(f"_lexsignature = {signature!r}\n")
+            tf.write(f"_lextokens    = set({tuple(sorted(self.lextokens))!r})\n")
+            tf.write(f"_lexreflags   = {int(self.lexreflags)!r}\n")
+            tf.write(f"_lexliterals  = {self.lexliterals!r}\n")
+            tf.write(f"_lexstateinfo = {self.lexstateinfo!r}\n")
+
+            # Rewrite the lexstatere table, replacing function objects with function names
+            tabre = {}
+            for statename, lre in self.lexstatere.items():
+                titem = []
+                for (pat, func), retext, renames in zip(
+                    lre, self.lexstateretext[statename], self.lexstaterenames[statename]
+                ):
+                    titem.append((retext, _funcs_to_names(func, renames), renames))
+                tabre[statename] = titem
+
+            tf.write(f"_lexstatere   = {tabre!r}\n")
+            tf.write(f"_lexstateignore = {self.lexstateignore!r}\n")
+
+            taberr = {}
+            for statename, ef in self.lexstateerrorf.items():
+                taberr[statename] = ef.__name__ if ef else None
+            tf.write(f"_lexstateerrorf = {taberr!r}\n")
+
+            tabeof = {}
+            for statename, ef in self.lexstateeoff.items():
+                tabeof[statename] = ef.__name__ if ef else None
+            tf.write(f"_lexstateeoff = {tabeof!r}\n")
+
+    # ------------------------------------------------------------
+    # readtab() - Read lexer information from a tab file.  Function
+    # names are rebound to the functions in fdict.  Returns the
+    # signature stored in the file.  If signature is given, a file
+    # built from other rules raises ImportError before any function
+    # name is looked up.
+    # ------------------------------------------------------------
+    def readtab(self, tabfile, fdict, outputdir="", signature=None):
+        if isinstance(tabfile, types.ModuleType):
+            lextab = tabfile
+        else:
+            filename = os.path.join(outputdir, tabfile) + ".py"
+            if not os.path.exists(filename):
+                raise ImportError(f"No table module {filename!r}")
+            spec = importlib.util.spec_from_file_location(tabfile, filename)
+            lextab = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(lextab)
+
+        if getattr(lextab, "_tabversion", "0.0") != __tabversion__:
+            raise ImportError("Inconsistent PLY version")
+        if signature is not None and lextab._lexsignature != signature:
+            raise ImportError("The lextab module was built from other rules")
+
+        self.lextokens = lextab._lextokens
+        self.lexreflags = lextab._lexreflags
+        self.lexliterals = lextab._lexliterals
+        self.lextokens_all = self.lextokens | set(self.lexliterals)
+        self.lexstateinfo = lextab._lexstateinfo
+        self.lexstateignore = lextab._lexstateignore
+        self.lexstatere = {}
+        self.lexstateretext = {}
+        self.lexstaterenames = {}
+        for statename, lre in lextab._lexstatere.items():
+            titem = []
+            txtitem = []
+            nameitem = []
+            for pat, func_name, renames in lre:
+                titem.append(
+                    (re.compile(pat, lextab._lexreflags), _names_to_funcs(func_name, fdict))
+                )
+                txtitem.append(pat)
+                nameitem.append(renames)
+
+            self.lexstatere[statename] = titem
+            self.lexstateretext[statename] = txtitem
+            self.lexstaterenames[statename] = nameitem
+
+        self.lexstateerrorf = {}
+        for statename, ef in lextab._lexstateerrorf.items():
+            self.lexstateerrorf[statename] = fdict[ef] if ef else None
+
+        self.lexstateeoff = {}
+        for statename, ef in lextab._lexstateeoff.items():
+            self.lexstateeoff[statename] = fdict[ef] if ef else None
+
+        self.begin("INITIAL")
+        return lextab._lexsignature
+
     # ------------------------------------------------------------
     # input() - Push a new string into the lexer
     # ------------------------------------------------------------
+    #
+    # s may also be a file object or an mmap.  In that case the input is
+    # read in windows of lexwindow characters as it is consumed, so the
+    # whole input is never held in memory at once.  lexdata and lexpos
+    # then refer to the current window; tokens still carry their offset
+    # in the whole input (lexbase + position in the window).
+    # ------------------------------------------------------------
     def input(self, s):
-        self.lexdata = s
+        self.lexbase = 0
+        if isinstance(s, StringTypes):
+            self.lexstream = None
+            self.lexdecoder = None
+            self.lexdata = s
+            self.lexpos = 0
+            self.lexlen = len(s)
+            self.lexlimit = self.lexlen
+            return
+
+        self.lexstream = s
+        self.lexdecoder = None
+        self.lexdata = ""
+        self.lexpos = 0
+        self.lexlen = 0
+        self.refill()
+
+    # ------------------------------------------------------------
+    # refill() - Slide the input window of a streamed input
+    #
+    # Drops the consumed part of the window and reads the next chunk
+    # from the stream.  The chunk is at least as long as the unconsumed
+    # part, so a token spanning many windows is rescanned only a few
+    # times.  Returns False once the stream is exhausted.
+    # ------------------------------------------------------------
+    def refill(self):
+        stream = self.lexstream
+        if stream is None:
+            return False
+        chunk = stream.read(max(self.lexwindow, self.lexlen - self.lexpos))
+        done = not chunk
+        if isinstance(chunk, bytes):
+            if self.lexdecoder is None:
+                self.lexdecoder = io.IncrementalNewlineDecoder(
+                    codecs.getincrementaldecoder("utf-8")(), translate=True
+                )
+            chunk = self.lexdecoder.decode(chunk, final=done)
+        self.lexbase += self.lexpos
+        self.lexdata = self.lexdata[self.lexpos :] + chunk
         self.lexpos = 0
-        self.lexlen = len(s)
+        self.lexlen = len(self.lexdata)
+        if done:
+            # End of the stream. Everything left is in the window
+            self.lexstream = None
+            self.lexlimit = self.lexlen
+            return False
+        self.lexlimit = max(self.lexlen - self.lexmargin, 0)
+        return True
 
     # ------------------------------------------------------------
     # begin() - Changes the lexing state
@@ -209,10 +477,27 @@ class Lexer:
         # Make local copies of frequently referenced attributes
         lexpos = self.lexpos
         lexlen = self.lexlen
+        lexlimit = self.lexlimit
+        lexbase = self.lexbase
         lexignore = self.lexignore
         lexdata = self.lexdata
 
-        while lexpos < lexlen:
+        while True:
+            # Past the limit, either the window of a streamed input needs to
+            # slide forward or we are at the end of the input
+            if lexpos >= lexlimit:
+                if self.lexstream is not None:
+                    self.lexpos = lexpos
+                    self.refill()
+                    lexpos = self.lexpos
+                    lexlen = self.lexlen
+                    lexlimit = self.lexlimit
+                    lexbase = self.lexbase
+                    lexdata = self.lexdata
+                    continue
+                if lexpos >= lexlen:
+                    break
+
             # This code provides some short-circuit code for whitespace, tabs, and other ignored characters
             if lexdata[lexpos] in lexignore:
                 lexpos += 1
@@ -224,11 +509,17 @@ class Lexer:
                 if not m:
                     continue
 
+                if m.end() == lexlen and self.lexstream is not None:
+                    # The match runs into the end of the window and might be
+                    # longer. Read more input and try again
+                    lexlimit = lexpos
+                    break
+
                 # Create a token for return
                 tok = LexToken()
                 tok.value = m.group()
                 tok.lineno = self.lineno
-                tok.lexpos = lexpos
+                tok.lexpos = lexbase + lexpos
 
                 i = m.lastindex
                 func, tok.type = lexindexfunc[i]
@@ -264,13 +555,26 @@ class Lexer:
                     break
                 return newtok
             else:
+                if self.lexstream is not None and any(
+                    first is None or first.match(lexdata, lexpos)
+                    for first in (
+                        _first_chars(lexre.pattern, lexre.flags)
+                        for lexre, _ in self.lexre
+                    )
+                ):
+                    # Nothing matched, but a token can start here and may end
+                    # past the window (an unterminated string, say). Read on
+                    # until a rule matches or the stream runs out
+                    lexlimit = lexpos
+                    continue
+
                 # No match, see if in literals
                 if lexdata[lexpos] in self.lexliterals:
                     tok = LexToken()
                     tok.value = lexdata[lexpos]
                     tok.lineno = self.lineno
                     tok.type = tok.value
-                    tok.lexpos = lexpos
+                    tok.lexpos = lexbase + lexpos
                     self.lexpos = lexpos + 1
                     return tok
 
@@ -281,7 +585,7 @@ class Lexer:
                     tok.lineno = self.lineno
                     tok.type = "error"
                     tok.lexer = self
-                    tok.lexpos = lexpos
+                    tok.lexpos = lexbase + lexpos
                     self.lexpos = lexpos
                     newtok = self.lexerrorf(tok)
                     if lexpos == self.lexpos:
@@ -297,7 +601,7 @@ class Lexer:
 
                 self.lexpos = lexpos
                 raise LexError(
-                    f"Illegal character {lexdata[lexpos]!r} at index {lexpos}",
+                    f"Illegal character {lexdata[lexpos]!r} at index {lexbase + lexpos}",
                     lexdata[lexpos:],
                 )
 
@@ -306,7 +610,7 @@ class Lexer:
             tok.type = "eof"
             tok.value = ""
             tok.lineno = self.lineno
-            tok.lexpos = lexpos
+            tok.lexpos = lexbase + lexpos
             tok.lexer = self
             self.lexpos = lexpos
             newtok = self.lexeoff(tok)
@@ -317,6 +621,146 @@ class Lexer:
             raise RuntimeError("No input string given with input()")
         return None
 
+    # ------------------------------------------------------------
+    # tokenize_all() - Tokenize the whole input into a TokenColumns
+    #
+    # This produces the same tokens as repeated calls to token(), but
+    # writes them into columnar storage instead of creating a LexToken
+    # per token.  Rules defined by functions are all passed one shared
+    # token object, so they must not hold on to it.  A streamed input
+    # is read whole, since the columns hold all of its tokens anyway.
+    # ------------------------------------------------------------
+    def tokenize_all(self, data=None):
+        if data is not None:
+            self.input(data)
+
+        if self.lexstream is not None and self.lexpos == 0:
+            # The values of the tokens are slices of the input, so the rest
+            # of a streamed input is read into the window.  The columns of
+            # its tokens take more room than its text anyway
+            while self.refill():
+                pass
+
+        if self.lexstream is not None or self.lexbase:
+            # Part of the streamed input was already lexed and has left the
+            # window, so values can't be taken as slices and are kept
+            # explicitly
+            columns = TokenColumns(None, sorted(self.lextokens_all))
+            for tok in self:
+                columns.types.append(columns.typeid(tok.type))
+                columns.lexpos.append(tok.lexpos)
+                columns.ends.append(
+                    tok.lexpos + len(tok.value)
+                    if isinstance(tok.value, str)
+                    else tok.lexpos
+                )
+                columns.lineno.append(tok.lineno)
+                columns.values[len(columns.types) - 1] = tok.value
+            return columns
+
+        columns = TokenColumns(self.lexdata, sorted(self.lextokens_all))
+        typeids = columns.typeids
+        values = columns.values
+        types_append = columns.types.append
+        lexpos_append = columns.lexpos.append
+        ends_append = columns.ends.append
+        lineno_append = columns.lineno.append
+
+        # Make local copies of frequently referenced attributes
+        lexpos = self.lexpos
+        lexlen = self.lexlen
+        lexignore = self.lexignore
+        lexdata = self.lexdata
+        tok = LexToken()  # Token passed to every rule function
+        tok.lexer = self
+
+        while True:
+            while lexpos < lexlen:
+                # This code provides some short-circuit code for whitespace, tabs, and other ignored characters
+                if lexdata[lexpos] in lexignore:
+                    lexpos += 1
+                    continue
+
+                # Look for a regular expression match
+                for lexre, lexindexfunc in self.lexre:
+                    m = lexre.match(lexdata, lexpos)
+                    if not m:
+                        continue
+
+                    func, tokname = lexindexfunc[m.lastindex]
+                    end = m.end()
+
+                    if not func:
+                        # Simple rule. The value is the matched slice
+                        if tokname:
+                            i = typeids.get(tokname)
+                            types_append(
+                                columns.typeid(tokname) if i is None else i
+                            )
+                            lexpos_append(lexpos)
+                            ends_append(end)
+                            lineno_append(self.lineno)
+                        lexpos = end
+                        break
+
+                    # If token is processed by a function, call it
+                    value = m.group()
+                    tok.value = value
+                    tok.type = tokname
+                    tok.lineno = self.lineno
+                    tok.lexpos = lexpos
+                    self.lexmatch = m
+                    self.lexpos = end
+                    newtok = func(tok)
+                    del self.lexmatch
+                    lexpos = self.lexpos  # This is here in case user has updated lexpos.
+                    lexignore = self.lexignore  # This is here in case there was a state change
+
+                    if newtok:
+                        i = typeids.get(newtok.type)
+                        types_append(columns.typeid(newtok.type) if i is None else i)
+                        lexpos_append(newtok.lexpos)
+                        ends_append(end)
+                        lineno_append(newtok.lineno)
+                        if newtok.value is not value:
+                            values[len(columns.types) - 1] = newtok.value
+                    break
+                else:
+                    # No match. Fall back on token() for literals and errors
+                    self.lexpos = lexpos
+                    newtok = self.token()
+                    lexpos = self.lexpos
+                    lexignore = self.lexignore
+                    if newtok:
+                        types_append(columns.typeid(newtok.type))
+                        lexpos_append(newtok.lexpos)
+                        ends_append(newtok.lexpos + len(newtok.value))
+                        lineno_append(newtok.lineno)
+                        values[len(columns.types) - 1] = newtok.value
+
+            self.lexpos = lexpos
+            if not self.lexeoff:
+                break
+
+            # The eof rule may return tokens (and even supply more input)
+            tok.type = "eof"
+            tok.value = ""
+            tok.lineno = self.lineno
+            tok.lexpos = lexpos
+            newtok = self.lexeoff(tok)
+            if not newtok:
+                break
+            types_append(columns.typeid(newtok.type))
+            lexpos_append(newtok.lexpos)
+            ends_append(newtok.lexpos)
+            lineno_append(newtok.lineno)
+            values[len(columns.types) - 1] = newtok.value
+            lexpos = self.lexpos
+            lexlen = self.lexlen
+            lexdata = self.lexdata
+
+        return columns
+
     # Iterator interface
     def __iter__(self):
         return self
@@ -358,6 +802,38 @@ def get_caller_module_dict(levels):
     return {**f.f_globals, **f.f_locals}
 
 
+# -----------------------------------------------------------------------------
+# _funcs_to_names()
+#
+# Given a list of regular expression functions, this converts it to a list
+# suitable for output to a table file
+# -----------------------------------------------------------------------------
+def _funcs_to_names(funclist, namelist):
+    result = []
+    for f, name in zip(funclist, namelist):
+        if f and f[0]:
+            result.append((name, f[1]))
+        else:
+            result.append(f)
+    return result
+
+
+# -----------------------------------------------------------------------------
+# _names_to_funcs()
+#
+# Given a list of regular expression function names, this converts it back to
+# functions.
+# -----------------------------------------------------------------------------
+def _names_to_funcs(namelist, fdict):
+    result = []
+    for n in namelist:
+        if n and n[0]:
+            result.append((fdict[n[0]], n[1]))
+        else:
+            result.append(n)
+    return result
+
+
 # -----------------------------------------------------------------------------
 # _form_master_re()
 #
@@ -396,6 +872,83 @@ def _form_master_re(relist, reflags, ldict, toknames):
         return (llist + rlist), (lre + rre), (lnames + rnames)
 
 
+# -----------------------------------------------------------------------------
+# _first_chars()
+#
+# Returns a regular expression matching the characters a match of the regular
+# expression pattern can start with.  Where that can't be told (a negated
+# class, a lookahead, a case insensitive pattern, ...) it returns None, which
+# stands for every character.
+# -----------------------------------------------------------------------------
+_category_classes = {
+    sre_constants.CATEGORY_DIGIT: r"\d",
+    sre_constants.CATEGORY_NOT_DIGIT: r"\D",
+    sre_constants.CATEGORY_SPACE: r"\s",
+    sre_constants.CATEGORY_NOT_SPACE: r"\S",
+    sre_constants.CATEGORY_WORD: r"\w",
+    sre_constants.CATEGORY_NOT_WORD: r"\W",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _first_chars(pattern, flags=0):
+    try:
+        parsed = sre_parse.parse(pattern, flags)
+        chars, nullable = _first_chars_of(parsed)
+    except Exception:
+        return None
+    if parsed.state.flags & re.IGNORECASE or chars is None or nullable:
+        return None
+    return re.compile("[%s]" % "".join(sorted(chars)), flags & re.ASCII)
+
+
+# Returns (chars, nullable) for a parsed regular expression, where chars is
+# a set of character class members or None if the match may start with any
+# character
+def _first_chars_of(items):
+    chars = set()
+    for op, av in items:
+        if op is sre_constants.AT:
+            continue
+        if op is sre_constants.LITERAL:
+            chars.add(re.escape(chr(av)))
+            return chars, False
+        if op is sre_constants.IN:
+            for inop, inav in av:
+                if inop is sre_constants.LITERAL:
+                    chars.add(re.escape(chr(inav)))
+                elif inop is sre_constants.RANGE:
+                    chars.add("%s-%s" % tuple(re.escape(chr(c)) for c in inav))
+                elif inop is sre_constants.CATEGORY and inav in _category_classes:
+                    chars.add(_category_classes[inav])
+                else:
+                    return None, False
+            return chars, False
+        if op is sre_constants.SUBPATTERN:
+            if av[1] & re.IGNORECASE:
+                return None, False
+            first, nullable = _first_chars_of(av[-1])
+        elif op is sre_constants.BRANCH:
+            first, nullable = set(), False
+            for branch in av[1]:
+                f, n = _first_chars_of(branch)
+                if f is None:
+                    return None, False
+                first |= f
+                nullable = nullable or n
+        elif op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT):
+            first, nullable = _first_chars_of(av[2])
+            nullable = nullable or av[0] == 0
+        else:
+            return None, False
+        if first is None:
+            return None, False
+        chars |= first
+        if not nullable:
+            return chars, False
+    return chars, True
+
+
 # -----------------------------------------------------------------------------
 # def _statetoken(s,names)
 #
@@ -453,6 +1006,22 @@ class LexerReflect(object):
         self.validate_rules()
         return self.error
 
+    # Compute a signature over the rule set.  This covers everything that
+    # ends up in the master regular expressions and in the table file.
+    def signature(self):
+        parts = [" ".join(sorted(self.tokens)), repr(self.literals), repr(self.reflags)]
+        for state, stype in self.stateinfo.items():
+            parts.append(f"{state}:{stype}")
+            for fname, f in self.funcsym[state]:
+                parts.append(f"{fname}={_get_regex(f)}")
+            for name, r in self.strsym[state]:
+                parts.append(f"{name}={r}")
+            parts.append(repr(self.ignore.get(state)))
+            for funcs in (self.errorf, self.eoff):
+                f = funcs.get(state)
+                parts.append(f.__name__ if f else "")
+        return "\n".join(parts)
+
     # Get the tokens map
     def get_tokens(self):
         tokens = self.ldict.get("tokens", None)
@@ -795,7 +1364,10 @@ def lex(
     module=None,
     object=None,
     debug=False,
+    optimize=False,
     reflags=int(re.VERBOSE),
+    lextab="lextab",
+    outputdir=None,
     debuglog=None,
     errorlog=None,
 ):
@@ -827,9 +1399,32 @@ def lex(
     else:
         ldict = get_caller_module_dict(2)
 
+    # The table file is written next to the module defining the rules
+    if outputdir is None:
+        srcfile = ldict.get("__file__")
+        outputdir = os.path.dirname(os.path.abspath(srcfile)) if srcfile else ""
+
     # Collect parser information from the dictionary
     linfo = LexerReflect(ldict, log=errorlog, reflags=reflags)
     linfo.get_all()
+
+    # Reuse the table file if it was built from the same rules
+    signature = None
+    if lextab and not debug and not linfo.error:
+        signature = linfo.signature()
+        try:
+            lexobj.readtab(lextab, ldict, outputdir, None if optimize else signature)
+            token = lexobj.token
+            input = lexobj.input
+            lexer = lexobj
+            return lexobj
+        except ImportError:
+            pass
+        except Exception as e:
+            # A truncated or corrupt table file is built again
+            errorlog.warning(f"There was a problem reading the lextab module: {e!r}")
+        lexobj = Lexer()
+
     if linfo.validate_all():
         raise SyntaxError("Can't build lexer")
 
@@ -936,6 +1531,13 @@ def lex(
             if s not in linfo.ignore:
                 linfo.ignore[s] = linfo.ignore.get("INITIAL", "")
 
+    # Write the table file for subsequent runs
+    if signature is not None:
+        try:
+            lexobj.writetab(lextab, outputdir, signature)
+        except IOError as e:
+            errorlog.warning(f"Couldn't write lextab module {lextab!r}. {e}")
+
     # Create global versions of the token() and input() functions
     token = lexobj.token
     input = lexobj.input
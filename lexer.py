@@ -1,3 +1,5 @@
+from collections import deque
+
 import lex
 
 reserved = {
@@ -6,6 +8,8 @@ reserved = {
     "def": "DEF",
     "lop": "LOP",
     "ret": "RET",
+    "brk": "BRK",
+    "cnt": "CNT",
     "false": "BOOL",
     "true": "BOOL",
     "not": "NOT",
@@ -58,9 +62,9 @@ def t_NEWLINE(t):
     t.lexer.indents_count = 0
     while True:  # Loop to count indents or dedents
         try:
-            if lexer.lexdata[lexer.lexpos] in " \t":
+            if t.lexer.lexdata[t.lexer.lexpos] in " \t":
                 t.lexer.indents_count += 1
-                lexer.lexpos += 1
+                t.lexer.lexpos += 1
             else:
                 break
         except IndexError:
@@ -73,7 +77,10 @@ def t_NEWLINE(t):
     elif t.lexer.indents_count < t.lexer.indents[-1]:  # It is a dedent
         t.type = "DEDENT"
         t.value = abs(t.lexer.indents_count - t.lexer.indents[-1])
-        t.lexer.indents.pop()
+        while t.lexer.indents_count < t.lexer.indents[-1]:  # Close every level left
+            t.lexer.indents.pop()
+        if t.lexer.indents_count > t.lexer.indents[-1]:
+            t.lexer.indents.append(t.lexer.indents_count)
     return t
 
 
@@ -89,15 +96,73 @@ def t_error(t):
 
 
 def t_eof(t):
-    if t.lexer.indents_count > 0:
+    if t.lexer.indents[-1] > 0:  # Close every block still open
         t.type = "DEDENT"
-        t.value = abs(t.lexer.indents_count - t.lexer.indents[-1])
+        t.value = t.lexer.indents[-1]
+        t.lexer.indents = [0]
         t.lexer.indents_count = 0
         return t
     else:
         return None
 
 
+class IndentFilter:
+    """Token filter that sits between a lexer and the parser.
+
+    The lexer reports a change of several indentation levels as a single
+    INDENT or DEDENT token whose value is the number of levels.  The parser
+    needs one token per level, so the filter expands those tokens.
+    """
+
+    def __init__(self, lexer):
+        self.lexer = lexer
+        self.queue = deque()
+
+    def input(self, s):
+        self.queue.clear()
+        self.lexer.lineno = 1
+        self.lexer.indents = [0]
+        self.lexer.indents_count = 0
+        self.lexer.input(s)
+
+    def token(self):
+        if self.queue:
+            return self.queue.popleft()
+        tok = self.lexer.token()
+        if tok and (tok.type == "INDENT" or tok.type == "DEDENT") and tok.value > 1:
+            for i in range(tok.value - 1):
+                self.queue.append(tok)
+        return tok
+
+    def tokenize_all(self, s=None):
+        """Tokenize the whole input into a lex.TokenColumns, one token per level."""
+        if s is not None:
+            self.input(s)
+        columns = self.lexer.tokenize_all()
+        levels = (columns.typeids.get("INDENT"), columns.typeids.get("DEDENT"))
+        types = columns.types
+        columns.repeat(
+            {
+                i: value
+                for i, value in columns.values.items()
+                if types[i] in levels and value > 1
+            }
+        )
+        return columns
+
+    def __getattr__(self, name):
+        return getattr(self.lexer, name)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        t = self.token()
+        if t is None:
+            raise StopIteration
+        return t
+
+
 lexer = lex.lex()
 lexer.indents = [0]
 lexer.indents_count = 0
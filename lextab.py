@@ -0,0 +1,11 @@
+# lextab.py. This file automatically created by PLY. Don't edit!
+_tabversion   = '3.10'
+_lexsignature = 'AND BOOL BRK CNT DEDENT DEF DIV ELS EQUAL IDENT IFF INDENT LOP LPAREN MINUS MODULUS MUL NAND NEWLINE NOR NOT NUMBER OR PLUS POWER RET RPAREN SET STRING XNOR XOR\n\'\'\n64\nINITIAL:inclusive\nt_NEWLINE=\\n\nt_IDENT=\\b[a-zA-Z_][a-zA-Z0-9_]*\\b\nt_STRING="[^"\\\\]*(?:\\\\.[^"\\\\]*)*"\nt_NUMBER=\\b\\d+(\\.\\d+)?\\b\nt_POWER=\\*\\*\nt_LPAREN=\\(\nt_RPAREN=\\)\nt_PLUS=\\+\nt_MUL=\\*\nt_MINUS=-\nt_DIV=/\nt_MODULUS=%\nt_EQUAL==\n\' \'\nt_error\nt_eof'
+_lextokens    = set(('AND', 'BOOL', 'BRK', 'CNT', 'DEDENT', 'DEF', 'DIV', 'ELS', 'EQUAL', 'IDENT', 'IFF', 'INDENT', 'LOP', 'LPAREN', 'MINUS', 'MODULUS', 'MUL', 'NAND', 'NEWLINE', 'NOR', 'NOT', 'NUMBER', 'OR', 'PLUS', 'POWER', 'RET', 'RPAREN', 'SET', 'STRING', 'XNOR', 'XOR'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_NEWLINE>\\n)|(?P<t_IDENT>\\b[a-zA-Z_][a-zA-Z0-9_]*\\b)|(?P<t_STRING>"[^"\\\\]*(?:\\\\.[^"\\\\]*)*")|(?P<t_NUMBER>\\b\\d+(\\.\\d+)?\\b)|(?P<t_POWER>\\*\\*)|(?P<t_LPAREN>\\()|(?P<t_RPAREN>\\))|(?P<t_PLUS>\\+)|(?P<t_MUL>\\*)|(?P<t_MINUS>-)|(?P<t_DIV>/)|(?P<t_MODULUS>%)|(?P<t_EQUAL>=)', [None, ('t_NEWLINE', 'NEWLINE'), ('t_IDENT', 'IDENT'), (None, 'STRING'), (None, 'NUMBER'), None, (None, 'POWER'), (None, 'LPAREN'), (None, 'RPAREN'), (None, 'PLUS'), (None, 'MUL'), (None, 'MINUS'), (None, 'DIV'), (None, 'MODULUS'), (None, 'EQUAL')], [None, 't_NEWLINE', 't_IDENT', 't_STRING', 't_NUMBER', None, 't_POWER', 't_LPAREN', 't_RPAREN', 't_PLUS', 't_MUL', 't_MINUS', 't_DIV', 't_MODULUS', 't_EQUAL'])]}
+_lexstateignore = {'INITIAL': ' '}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {'INITIAL': 't_eof'}
@@ -0,0 +1,254 @@
+import math
+import operator
+
+from compiler import (
+    c_and,
+    c_block,
+    c_bool,
+    c_constant,
+    c_def_statement,
+    c_div,
+    c_env_call,
+    c_equal,
+    c_group,
+    c_if_else_statement,
+    c_if_statement,
+    c_loop_statement,
+    c_minus,
+    c_mod,
+    c_mul,
+    c_nand,
+    c_newline,
+    c_nor,
+    c_not,
+    c_number,
+    c_or,
+    c_plus,
+    c_power,
+    c_program,
+    c_return_statement,
+    c_set_statement,
+    c_string,
+    c_xnor,
+    c_xor,
+)
+
+# Optimization of the syntax tree, between parsing and running or
+# transpiling it.
+#
+# optimize() replaces, in place:
+#
+#   - string literals with c_constant nodes holding the decoded string, so
+#     the escapes are decoded once instead of on every evaluation,
+#   - operators and not applied to constants with a c_constant holding the
+#     result, and and/or with a constant left operand with the operand they
+#     give,
+#   - groups with the expression they hold, where the transpiled code
+#     doesn't need the parentheses,
+#
+# and leaves the blank line statements out of blocks.  The optimized tree
+# gives the same results as the parsed one: an expression is only folded if
+# evaluating it can't fail, and a folded value is one the transpiler can
+# write as a Python literal.
+
+# Largest string, in characters, and int, in bits, a fold may make.  Bigger
+# values are computed when the program runs, as they can take long to make.
+_max_size = 4096
+
+
+def optimize(program):
+    """Optimize the c_program program in place and return it."""
+    program.statements = _statements(program.statements)
+    return program
+
+
+def optimize_node(node, operand=False):
+    """Return the optimized node.
+
+    operand is true for the operands of operators, where a group whose
+    expression isn't a single term keeps its parentheses.
+    """
+    optimizer = _optimizers.get(type(node))
+    if optimizer is None:
+        return node
+    return optimizer(node, operand)
+
+
+def _statements(statements):
+    # A block of blank lines only stays as it is
+    optimized = [optimize_node(s) for s in statements if type(s) is not c_newline]
+    return optimized or statements
+
+
+# Nodes whose value is known
+_constants = (c_constant, c_number, c_bool)
+
+# Nodes the transpiler writes as a single term
+_terms = _constants + (c_string, c_env_call, c_group)
+
+
+def _constant(value, node):
+    constant = c_constant(value)
+    constant.span = node.span
+    return constant
+
+
+def _foldable(value):
+    # Whether the transpiler can write value as a literal
+    kind = type(value)
+    if kind is float:
+        return math.isfinite(value)
+    if kind is int:
+        return value.bit_length() <= _max_size
+    if kind is str:
+        return len(value) <= _max_size
+    return kind is bool
+
+
+def _small_power(left, right):
+    if type(right) not in (int, bool) or type(left) not in (int, bool):
+        return True  # Floats overflow with an error instead
+    return right < 0 or left.bit_length() * right <= _max_size
+
+
+def _small_product(left, right):
+    for sequence, count in ((left, right), (right, left)):
+        if type(sequence) is str and type(count) in (int, bool):
+            return len(sequence) * count <= _max_size
+    return True
+
+
+def _not_format(left, right):
+    # A format string can ask for any width
+    return type(left) is not str
+
+
+# Operator node -> (function of the operand values, check that the result
+# isn't too large to compute)
+_folds = {
+    c_plus: (operator.add, None),
+    c_minus: (operator.sub, None),
+    c_mul: (operator.mul, _small_product),
+    c_div: (operator.truediv, None),
+    c_mod: (operator.mod, _not_format),
+    c_power: (pow, _small_power),
+    c_equal: (operator.eq, None),
+    c_and: (lambda left, right: left and right, None),
+    c_or: (lambda left, right: left or right, None),
+    c_xor: (operator.xor, None),
+    c_nand: (lambda left, right: not (left and right), None),
+    c_nor: (lambda left, right: not (left or right), None),
+    c_xnor: (lambda left, right: not (left ^ right), None),
+}
+
+
+def _optimize_binary(node, operand):
+    left = node.left = optimize_node(node.left, True)
+    right = node.right = optimize_node(node.right, True)
+    kind = type(node)
+    if type(left) in _constants:
+        if type(right) in _constants:
+            function, check = _folds[kind]
+            if check is None or check(left.value, right.value):
+                try:
+                    value = function(left.value, right.value)
+                except Exception:
+                    return node  # Fails when it is evaluated
+                if _foldable(value):
+                    return _constant(value, node)
+        # The right operand is evaluated for its value or not at all
+        if kind is c_and:
+            return _grouped(right, operand) if left.value else left
+        if kind is c_or:
+            return left if left.value else _grouped(right, operand)
+    return node
+
+
+def _grouped(node, operand):
+    # node in place of an operator, in parentheses where they are needed
+    if operand and type(node) not in _terms:
+        group = c_group(node)
+        group.span = node.span
+        return group
+    return node
+
+
+def _optimize_not(node, operand):
+    expression = node.expression = optimize_node(node.expression, True)
+    if type(expression) in _constants:
+        return _constant(not expression.value, node)
+    return node
+
+
+def _optimize_group(node, operand):
+    expression = node.expression = optimize_node(node.expression)
+    if operand and type(expression) not in _terms:
+        return node
+    return expression
+
+
+def _optimize_string(node, operand):
+    try:
+        value = node.value[1:-1].encode().decode("unicode_escape")
+    except UnicodeDecodeError:
+        return node  # Fails when it is evaluated
+    constant = c_constant(value, node.value)
+    constant.span = node.span
+    return constant
+
+
+def _optimize_env_call(node, operand):
+    node.arguments = [optimize_node(argument) for argument in node.arguments]
+    return node
+
+
+def _optimize_block(node, operand):
+    node.statements = _statements(node.statements)
+    return node
+
+
+def _optimize_if(node, operand):
+    node.expression = optimize_node(node.expression)
+    node.block = optimize_node(node.block)
+    return node
+
+
+def _optimize_if_else(node, operand):
+    node.if_statement = optimize_node(node.if_statement)
+    node.else_block = optimize_node(node.else_block)
+    return node
+
+
+def _optimize_loop(node, operand):
+    node.increment = optimize_node(node.increment)
+    node.end = optimize_node(node.end)
+    node.block = optimize_node(node.block)
+    return node
+
+
+def _optimize_def(node, operand):
+    node.block = optimize_node(node.block)
+    return node
+
+
+def _optimize_expression_statement(node, operand):
+    node.expression = optimize_node(node.expression)
+    return node
+
+
+_optimizers = {
+    c_program: lambda node, operand: optimize(node),
+    c_block: _optimize_block,
+    c_string: _optimize_string,
+    c_env_call: _optimize_env_call,
+    c_group: _optimize_group,
+    c_not: _optimize_not,
+    c_if_statement: _optimize_if,
+    c_if_else_statement: _optimize_if_else,
+    c_loop_statement: _optimize_loop,
+    c_def_statement: _optimize_def,
+    c_return_statement: _optimize_expression_statement,
+    c_set_statement: _optimize_expression_statement,
+}
+for kind in _folds:
+    _optimizers[kind] = _optimize_binary
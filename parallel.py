@@ -0,0 +1,105 @@
+import contextlib
+import io
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+import compiler
+from frontend import get_frontend
+from lexer import t_STRING
+
+# Parallel parsing of large programs.
+#
+# A Bithon program is mostly a sequence of top-level statements, and a line
+# starting at column 0 always starts a new top-level statement unless it is
+# an els.  The source is cut at such lines into about as many chunks as
+# there are workers, the chunks are parsed in a process pool, and their
+# statement lists are joined into one c_program.  Each chunk is lexed with
+# the line number it starts at, so line numbers stay those of the whole
+# source.  Error recovery depends on everything parsed before the error,
+# so if parsing any chunk printed a diagnostic the whole source is parsed
+# again in this process, and the recovery and messages are those of a
+# sequential parse.
+
+# Lines that may start a chunk
+_chunk_start = re.compile(r"^(?!els\b)\S", re.MULTILINE)
+
+_string = re.compile(t_STRING)
+
+
+def split_source(code, parts):
+    """Cut code into at most parts chunks at column 0 statement boundaries.
+
+    Returns (lineno, text) pairs.
+    """
+    size = len(code) // max(parts, 1) + 1
+    chunks = []
+    start = 0
+    lineno = 1
+    for m in _chunk_start.finditer(code, size):
+        pos = m.start()
+        if pos - start < size:
+            continue
+        text = code[start:pos]
+        # A string running over several lines can hide a column 0 line
+        if '"' in text and '"' in _string.sub("", text):
+            continue
+        chunks.append((lineno, text))
+        lineno += text.count("\n")
+        start = pos
+    chunks.append((lineno, code[start:]))
+    return chunks
+
+
+def parse_chunk(chunk, scanner="lex", parser="lr"):
+    """Parse one (lineno, text) chunk.
+
+    Returns its statements (None on a syntax error) and what parsing it
+    printed.
+    """
+    lineno, text = chunk
+    frontend = get_frontend(scanner, parser)
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        frontend.tokenstream.input(text)
+        frontend.lexer.lineno = lineno
+        program = frontend.parser.parse(lexer=frontend.tokenstream)
+    statements = None if program is None else program.statements
+    return statements, output.getvalue()
+
+
+def parse_parallel(code, workers=None, scanner="lex", parser="lr"):
+    """Parse code in a pool of worker processes.
+
+    Returns the c_program, or None if code has a syntax error the parser
+    can't recover from.
+    """
+    if not isinstance(code, str):
+        code = bytes(code[:]).decode("utf-8")
+        code = code.replace("\r\n", "\n").replace("\r", "\n")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    chunks = split_source(code, workers)
+    if len(chunks) == 1:
+        results = [parse_chunk(chunks[0], scanner, parser)]
+    else:
+        # Forked workers start with the lexer and parser already built
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("fork" if "fork" in methods else None)
+        with ProcessPoolExecutor(len(chunks), mp_context=context) as executor:
+            results = list(
+                executor.map(
+                    parse_chunk,
+                    chunks,
+                    [scanner] * len(chunks),
+                    [parser] * len(chunks),
+                )
+            )
+
+    if any(result is None or output for result, output in results):
+        return get_frontend(scanner, parser).parse(code)
+    statements = []
+    for result, _ in results:
+        statements.extend(result)
+    return compiler.c_program(statements)
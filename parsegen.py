@@ -0,0 +1,86 @@
+import hashlib
+import importlib.util
+import inspect
+import os
+import sys
+
+import compiler
+import yacc
+
+# parsegen writes the parser for the grammar in compiler.py as a module,
+# bithonparse.py, that runs the LALR automaton as straight-line code with the
+# rule actions written in place (see LRParser.write_module() in yacc.py).  It
+# parses exactly like compiler.parser, and hands over to it at the first
+# syntax error, so errors are reported and recovered from the same way.
+#
+# The generated module records a signature of what it was written from: the
+# grammar signature yacc checks parsetab.py against, the source of the rule
+# functions whose actions are written into it and the version of the module
+# generator.  load_parser() regenerates the module whenever the signature has
+# changed, and parses with the table-driven compiler.parser when the module
+# can't be written, for instance in a read-only install.
+
+parsemodule = "bithonparse"
+
+
+def grammar_signature():
+    digest = hashlib.sha256()
+    digest.update(yacc.__moduleversion__.encode())
+    digest.update(compiler.parser.signature.encode())
+    for p in compiler.parser.productions[1:]:
+        digest.update(inspect.getsource(p.callable).encode())
+    return digest.hexdigest()
+
+
+def generate(outputdir=None):
+    """Write the parser module for the current grammar in compiler.py."""
+    if outputdir is None:
+        outputdir = os.path.dirname(os.path.abspath(compiler.__file__))
+    return compiler.parser.write_module(parsemodule, outputdir, grammar_signature())
+
+
+_loaded = {}  # Output directory -> Parser class
+
+
+def load_parser(outputdir=None):
+    """Return the generated Parser class, regenerating the module if it is
+    missing or was generated from another grammar.  If the module can't be
+    written, return a stand-in that parses with the LR tables instead."""
+    if outputdir is None:
+        outputdir = os.path.dirname(os.path.abspath(compiler.__file__))
+    if outputdir in _loaded:
+        return _loaded[outputdir]
+    filename = os.path.join(outputdir, parsemodule + ".py")
+    signature = grammar_signature()
+    module = None
+    if os.path.exists(filename):
+        try:
+            module = _load(filename)
+        except Exception:
+            pass
+    if module is None or getattr(module, "_signature", None) != signature:
+        try:
+            module = _load(generate(outputdir))
+        except OSError as e:
+            yacc.PlyLogger(sys.stderr).warning("Couldn't create %r. %s", filename, e)
+            _loaded[outputdir] = _table_parser
+            return _table_parser
+    _loaded[outputdir] = module.Parser
+    return module.Parser
+
+
+def _table_parser(lrparser):
+    # Stand-in for the Parser class: the LR parser itself parses with the
+    # tables
+    return lrparser
+
+
+def _load(filename):
+    spec = importlib.util.spec_from_file_location(parsemodule, filename)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+if __name__ == "__main__":
+    print(generate())
@@ -0,0 +1,360 @@
+import hashlib
+import importlib.util
+import os
+import re
+
+import lexer
+
+# scangen turns the rules in lexer.py into a scanner module, bithonscan.py,
+# that produces exactly the same tokens as the lexer built by lex.lex() but
+# without its generic machinery:
+#
+#   - A single master regex.  The reserved words get a group of their own in
+#     front of the IDENT rule, so plain identifiers come straight out of the
+#     match and only real keywords are looked up in lexer.reserved.
+#   - The token type is found by indexing a tuple with m.lastindex.
+#   - t_NEWLINE and t_eof are written inline in the scanning loop.
+#
+# Only the rule functions scangen knows how to inline are supported, and the
+# generated module records a hash of lexer.py.  load_scanner() regenerates
+# the module whenever lexer.py has changed since it was written.
+
+scanmodule = "bithonscan"
+
+# Rule functions that are written inline by the templates below
+_inlined = ("t_NEWLINE", "t_IDENT")
+
+
+def lexer_hash():
+    with open(lexer.__file__, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _master_regex(lexobj):
+    # Return the text of the master regex with the keyword groups added
+    if len(lexobj.lexretext) != 1:
+        raise ValueError("scangen: the rules don't fit in one master regex")
+    if lexobj.lexliterals or list(lexobj.lexstateinfo) != ["INITIAL"]:
+        raise ValueError("scangen: literals and lexer states are not supported")
+    for entry in lexobj.lexre[0][1]:
+        if entry and entry[0] and entry[0].__name__ not in _inlined:
+            raise ValueError(f"scangen: don't know how to inline rule {entry[0].__name__}")
+        if entry and not entry[1]:
+            raise ValueError("scangen: ignore_ rules are not supported")
+
+    # All reserved words share one group.  A single alternation matches much
+    # faster than a group per token type.  Longer words come first, so a word
+    # is never cut short by its prefix.
+    words = sorted(lexer.reserved, key=lambda w: (-len(w), w))
+    keywords = "(?P<k_KEYWORD>\\b(?:%s)\\b)" % "|".join(map(re.escape, words))
+
+    retext = lexobj.lexretext[0]
+    ident = "(?P<t_IDENT>"
+    if ident not in retext:
+        raise ValueError("scangen: no t_IDENT rule")
+    return retext.replace(ident, keywords + "|" + ident, 1)
+
+
+def _group_types(regex):
+    # Token type of each group of the master regex, indexed by group number.
+    # Rule groups are named t_TYPE.  The type of the reserved words group
+    # depends on the word matched.
+    types = [None] * (regex.groups + 1)
+    for name, index in regex.groupindex.items():
+        if name.startswith("t_"):
+            types[index] = name[2:]
+    return tuple(types)
+
+
+_template = '''\
+# $scanmodule.py. This file is automatically generated by scangen.py from the
+# rules in lexer.py. Don't edit!
+import codecs
+import copy
+import io
+import re
+
+from lex import LexError, LexToken, TokenColumns
+from lexer import t_error
+
+_lexerhash = $lexerhash
+
+_match = re.compile($retext, $reflags).match
+
+# Token type of each group of the master regex
+_types = $types
+
+# Every token type, in the order TokenColumns type ids use
+_typenames = $typenames
+
+# Reserved word -> token type
+_reserved = $reserved
+
+_typeids = tuple(None if t is None else _typenames.index(t) for t in _types)
+_reservedids = {word: _typenames.index(t) for word, t in _reserved.items()}
+_NEWLINE = $newline_group
+_KEYWORD = $keyword_group
+_NEWLINE_ID = _typenames.index("NEWLINE")
+_INDENT_ID = _typenames.index("INDENT")
+_DEDENT_ID = _typenames.index("DEDENT")
+
+
+class Scanner:
+    def __init__(self):
+        self.lexdata = ""
+        self.lexpos = 0
+        self.lexlen = 0
+        self.lineno = 1
+        self.lextokens_all = set(_typenames)
+        self.indents = [0]
+        self.indents_count = 0
+        self.indentwidth = $indentwidth
+
+    def clone(self):
+        return copy.copy(self)
+
+    def input(self, s):
+        # Stream input is read in one go
+        if not isinstance(s, str):
+            if hasattr(s, "read"):
+                s = s.read()
+            if not isinstance(s, str):
+                decoder = io.IncrementalNewlineDecoder(
+                    codecs.getincrementaldecoder("utf-8")(), translate=True
+                )
+                s = decoder.decode(s[:], final=True)
+        self.lexdata = s
+        self.lexpos = 0
+        self.lexlen = len(s)
+
+    def skip(self, n):
+        self.lexpos += n
+
+    def _error(self, lexpos):
+        tok = LexToken()
+        tok.value = self.lexdata[lexpos:]
+        tok.lineno = self.lineno
+        tok.type = "error"
+        tok.lexer = self
+        tok.lexpos = lexpos
+        self.lexpos = lexpos
+        newtok = t_error(tok)
+        if lexpos == self.lexpos:
+            # Error method didn't change text position at all. This is an error.
+            raise LexError(
+                f"Scanning error. Illegal character {self.lexdata[lexpos]!r}",
+                self.lexdata[lexpos:],
+            )
+        return newtok
+
+    def token(self):
+        lexdata = self.lexdata
+        lexpos = self.lexpos
+        lexlen = self.lexlen
+        while lexpos < lexlen:
+            if lexdata[lexpos] in $ignore:
+                lexpos += 1
+                continue
+
+            m = _match(lexdata, lexpos)
+            if m is None:
+                newtok = self._error(lexpos)
+                lexpos = self.lexpos
+                if newtok:
+                    return newtok
+                continue
+
+            i = m.lastindex
+            end = m.end()
+            tok = LexToken()
+            tok.lineno = self.lineno
+            tok.lexpos = lexpos
+            if i == _NEWLINE:
+                self.lineno += end - lexpos
+                p = end
+                while p < lexlen and lexdata[p] in " \\t":
+                    p += 1
+                count = self.indents_count = (p - end) // self.indentwidth
+                indents = self.indents
+                if count > indents[-1]:  # It is an indent
+                    tok.type = "INDENT"
+                    tok.value = count - indents[-1]
+                    indents.append(count)
+                elif count < indents[-1]:  # It is a dedent
+                    tok.type = "DEDENT"
+                    tok.value = indents[-1] - count
+                    while count < indents[-1]:
+                        indents.pop()
+                    if count > indents[-1]:
+                        indents.append(count)
+                else:
+                    tok.type = "NEWLINE"
+                    tok.value = lexdata[lexpos:end]
+                self.lexpos = p
+                return tok
+
+            tok.value = value = lexdata[lexpos:end]
+            tok.type = _reserved[value] if i == _KEYWORD else _types[i]
+            self.lexpos = end
+            return tok
+
+        self.lexpos = lexpos
+        if self.indents[-1] > 0:  # Close every block still open
+            tok = LexToken()
+            tok.type = "DEDENT"
+            tok.value = self.indents[-1]
+            tok.lineno = self.lineno
+            tok.lexpos = lexpos
+            self.indents = [0]
+            self.indents_count = 0
+            return tok
+        return None
+
+    def tokenize_all(self, data=None):
+        if data is not None:
+            self.input(data)
+        columns = TokenColumns(self.lexdata, _typenames)
+        values = columns.values
+        types_append = columns.types.append
+        lexpos_append = columns.lexpos.append
+        ends_append = columns.ends.append
+        lineno_append = columns.lineno.append
+
+        lexdata = self.lexdata
+        lexpos = self.lexpos
+        lexlen = self.lexlen
+        lineno = self.lineno
+        indents = self.indents
+        indentwidth = self.indentwidth
+        while lexpos < lexlen:
+            if lexdata[lexpos] in $ignore:
+                lexpos += 1
+                continue
+
+            m = _match(lexdata, lexpos)
+            if m is None:
+                self.lineno = lineno
+                newtok = self._error(lexpos)
+                lexpos = self.lexpos
+                if newtok:
+                    types_append(columns.typeid(newtok.type))
+                    lexpos_append(newtok.lexpos)
+                    ends_append(newtok.lexpos + len(newtok.value))
+                    lineno_append(newtok.lineno)
+                    values[len(columns.types) - 1] = newtok.value
+                continue
+
+            i = m.lastindex
+            end = m.end()
+            lexpos_append(lexpos)
+            ends_append(end)
+            lineno_append(lineno)
+            if i == _NEWLINE:
+                lineno += end - lexpos
+                p = end
+                while p < lexlen and lexdata[p] in " \\t":
+                    p += 1
+                count = (p - end) // indentwidth
+                if count > indents[-1]:  # It is an indent
+                    types_append(_INDENT_ID)
+                    values[len(columns.types) - 1] = count - indents[-1]
+                    indents.append(count)
+                elif count < indents[-1]:  # It is a dedent
+                    types_append(_DEDENT_ID)
+                    values[len(columns.types) - 1] = indents[-1] - count
+                    while count < indents[-1]:
+                        indents.pop()
+                    if count > indents[-1]:
+                        indents.append(count)
+                else:
+                    types_append(_NEWLINE_ID)
+                self.indents_count = count
+                lexpos = p
+                continue
+
+            types_append(
+                _reservedids[lexdata[lexpos:end]] if i == _KEYWORD else _typeids[i]
+            )
+            lexpos = end
+
+        self.lexpos = lexpos
+        self.lineno = lineno
+        if indents[-1] > 0:  # Close every block still open
+            types_append(_DEDENT_ID)
+            lexpos_append(lexpos)
+            ends_append(lexpos)
+            lineno_append(lineno)
+            values[len(columns.types) - 1] = indents[-1]
+            self.indents = [0]
+            self.indents_count = 0
+        return columns
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        t = self.token()
+        if t is None:
+            raise StopIteration
+        return t
+'''
+
+
+def generate(outputdir=None):
+    """Write the scanner module for the current rules in lexer.py."""
+    from string import Template
+
+    lexobj = lexer.lexer
+    retext = _master_regex(lexobj)
+    regex = re.compile(retext, lexobj.lexreflags)
+    types = _group_types(regex)
+    code = Template(_template).substitute(
+        scanmodule=scanmodule,
+        lexerhash=repr(lexer_hash()),
+        retext=repr(retext),
+        reflags=lexobj.lexreflags,
+        types=repr(types),
+        typenames=repr(tuple(sorted(lexobj.lextokens_all))),
+        newline_group=regex.groupindex["t_NEWLINE"],
+        keyword_group=regex.groupindex["k_KEYWORD"],
+        reserved=repr(lexer.reserved),
+        ignore=repr(lexobj.lexignore),
+        indentwidth=lexobj.indentwidth,
+    )
+    if outputdir is None:
+        outputdir = os.path.dirname(os.path.abspath(lexer.__file__))
+    filename = os.path.join(outputdir, scanmodule + ".py")
+    with open(filename, "w") as f:
+        f.write(code)
+    return filename
+
+
+_loaded = {}  # Output directory -> Scanner class
+
+
+def load_scanner(outputdir=None):
+    """Return the generated Scanner class, regenerating the module if it is
+    missing or was generated from another version of lexer.py."""
+    if outputdir is None:
+        outputdir = os.path.dirname(os.path.abspath(lexer.__file__))
+    if outputdir in _loaded:
+        return _loaded[outputdir]
+    filename = os.path.join(outputdir, scanmodule + ".py")
+    module = None
+    if os.path.exists(filename):
+        module = _load(filename)
+    if module is None or module._lexerhash != lexer_hash():
+        module = _load(generate(outputdir))
+    _loaded[outputdir] = module.Scanner
+    return module.Scanner
+
+
+def _load(filename):
+    spec = importlib.util.spec_from_file_location(scanmodule, filename)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+if __name__ == "__main__":
+    print(generate())
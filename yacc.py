@@ -64,7 +64,16 @@
 import re
 import types
 import sys
+import copy
+import os
+import ast
+import builtins
 import inspect
+import textwrap
+import importlib.util
+import functools
+
+from lex import TokenColumns
 
 # -----------------------------------------------------------------------------
 #                     === User configurable parameters ===
@@ -72,10 +81,14 @@ import inspect
 # Change these to modify the default behavior of yacc (if you wish)
 # -----------------------------------------------------------------------------
 
+__tabversion__ = "3.10"  # Version of table file used
+__moduleversion__ = "1"  # Version of the code written by write_module()
+
 yaccdebug = False  # Debugging mode.  If set, yacc generates a
 # a 'parser.out' file in the current directory
 
 debug_file = "parser.out"  # Default name of the debugging file
+tab_module = "parsetab"  # Default name of the table module
 error_count = 3  # Number of symbols that must be shifted to leave recovery mode
 resultlimit = 40  # Size limit of results when running in debug mode.
 
@@ -120,6 +133,11 @@ class YaccError(Exception):
     pass
 
 
+# Exception raised when a cached table file was written by another version
+class VersionError(YaccError):
+    pass
+
+
 # Format the result message that the parser produces when running in debug mode.
 def format_result(r):
     repr_str = repr(r)
@@ -168,6 +186,22 @@ class YaccSymbol:
         return str(self)
 
 
+# -----------------------------------------------------------------------------
+# positional()
+#
+# Decorator for grammar rule functions using the positional protocol.  Such a
+# function is called with the values of the symbols on the right hand side
+# of its rule as arguments and returns the value of the left hand side,
+# instead of reading and setting them through a YaccProduction.  When every
+# rule function is positional, parse() uses the parseopt_values() engine.
+# -----------------------------------------------------------------------------
+
+
+def positional(func):
+    func.positional = True
+    return func
+
+
 # This class is a wrapper around the objects actually passed to each
 # grammar rule.   Index lookup and assignment actually assign the
 # .value attribute of the underlying YaccSymbol object.
@@ -228,6 +262,80 @@ class YaccProduction:
         raise SyntaxError
 
 
+# Lexer interface over a lex.TokenColumns, building the tokens from index
+# start on one at a time.  Used where a parse needs token objects.
+class ColumnTokens:
+    lineno = lexpos = 0
+
+    def __init__(self, columns, start=0):
+        self.token = functools.partial(
+            next, map(columns.token, range(start, len(columns))), None
+        )
+
+
+# -----------------------------------------------------------------------------
+#                            == LRDenseTable ==
+#
+# The action and goto tables of an LRParser as one row per state, with a
+# column per grammar symbol.  Column 0 holds the default reduction of the
+# state, column 1 is used for token types the grammar doesn't know, then come
+# the terminals and the nonterminals.  The parsing engines find an action or
+# a goto with two indexes instead of two dict lookups.
+#
+# Entries are small codes: 0 is a syntax error (or no default reduction),
+# 1 .. nstates-1 shift or go to that state and nstates + n reduces by
+# production n.  Production 0 is the start production, so nstates accepts.
+#
+# Rows are tuples rather than array('i').  CPython specializes indexing of
+# tuples but not of arrays, and an array boxes a new int object for every
+# entry read, so array rows parse no faster than the dicts.  Small codes
+# keep every entry one of CPython's cached int objects, which is what keeps
+# the tuples smaller than the dicts as well.
+# -----------------------------------------------------------------------------
+
+
+class LRDenseTable:
+    def __init__(self, action, goto, productions, defaulted_states):
+        terminals = set(["$end", "error"])
+        for row in action.values():
+            terminals.update(row)
+        nonterminals = set()
+        for row in goto.values():
+            nonterminals.update(row)
+        terminals = sorted(terminals)
+        nonterminals = sorted(nonterminals)
+
+        self.symbols = ["$default", "$unknown"] + terminals + nonterminals
+        self.termids = {name: i for i, name in enumerate(terminals, 2)}
+        self.ntermids = {
+            name: i for i, name in enumerate(nonterminals, 2 + len(terminals))
+        }
+        nstates = self.nstates = max(action) + 1
+
+        self.rows = []
+        for state in range(nstates):
+            row = [0] * len(self.symbols)
+            if state in defaulted_states:
+                row[0] = nstates - defaulted_states[state]
+            for name, t in action.get(state, {}).items():
+                row[self.termids[name]] = t if t > 0 else nstates - t
+            for name, t in goto.get(state, {}).items():
+                row[self.ntermids[name]] = t
+            self.rows.append(tuple(row))
+
+        # Goto column of the left hand side of each production
+        self.lhs = tuple(self.ntermids.get(p.name, 1) for p in productions)
+
+        # States entered by shifting the error symbol
+        self.errorstates = frozenset(
+            row["error"] for row in action.values() if row.get("error", 0) > 0
+        )
+
+        # Production number -> whether its rule may make a value with a span.
+        # Filled in by LRParser.span_rules().
+        self.spanrules = None
+
+
 # -----------------------------------------------------------------------------
 #                               == LRParser ==
 #
@@ -236,24 +344,31 @@ class YaccProduction:
 
 
 class LRParser:
-    def __init__(self, lrtab, errorf):
+    def __init__(self, lrtab, errorf, signature=""):
         self.productions = lrtab.lr_productions
         self.action = lrtab.lr_action
         self.goto = lrtab.lr_goto
         self.errorfunc = errorf
+        self.signature = signature  # Signature of the grammar of the tables
         self.set_defaulted_states()
         self.errorok = True
+        self.restarted = False  # Set by restart() during a parse
+        # True if every rule function uses the positional protocol
+        self.positional = all(p.positional for p in self.productions[1:])
 
     def errok(self):
         self.errorok = True
 
+    # Return a parser sharing the tables of this one.  Each thread parsing at
+    # the same time needs a parser of its own.
+    def clone(self):
+        return copy.copy(self)
+
+    # Discard the stacks and go back to the start state.  Called from the
+    # error function; the engine in use empties its stacks once the error
+    # function returns.
     def restart(self):
-        del self.statestack[:]
-        del self.symstack[:]
-        sym = YaccSymbol()
-        sym.type = "$end"
-        self.symstack.append(sym)
-        self.statestack.append(0)
+        self.restarted = True
 
     # Defaulted state support.
     # This method identifies parser states where there is only one possible reduction action.
@@ -269,19 +384,71 @@ class LRParser:
             rules = list(actions.values())
             if len(rules) == 1 and rules[0] < 0:
                 self.defaulted_states[state] = rules[0]
+        self.dense = None
 
     def disable_defaulted_states(self):
         self.defaulted_states = {}
+        self.dense = None
+
+    # Return the LRDenseTable used by the optimized engines, building it on
+    # first use.
+    def dense_table(self):
+        if self.dense is None:
+            self.dense = LRDenseTable(
+                self.action, self.goto, self.productions, self.defaulted_states
+            )
+        return self.dense
+
+    # Return the spanrules of the dense table, working them out on first use.
+    def span_rules(self):
+        dense = self.dense_table()
+        if dense.spanrules is None:
+            dense.spanrules = tuple(
+                bool(p.callable) and rule_may_make_node(p.callable)
+                for p in self.productions
+            )
+        return dense.spanrules
 
     # parse().
     #
-    # This is the core parsing engine.  To operate, it requires a lexer object.
+    # This is the core parsing entry point.  To operate, it requires a lexer object.
     # Two options are provided.  The debug flag turns on debugging so that you can
     # see the various rule reductions and parsing steps.  tracking turns on position
     # tracking.  In this mode, symbols will record the starting/ending line number and
     # character index.
+    #
+    # The work is done by one of five engines.  parseopt_notrack() is used
+    # when neither option is given and leaves out all of the instrumentation,
+    # and parseopt_values() replaces it when every rule function is
+    # positional.  parsedebug() supports both options.
+    #
+    # tracking="spans" is a cheaper form of tracking for positional rules:
+    # parseopt_spans() gives each value that has a span attribute the
+    # positions of its first and last token, and no symbol records anything.
+    #
+    # lexer may also be a lex.TokenColumns made by Lexer.tokenize_all().
+    # Without either option and with positional rules it is parsed by
+    # parsecolumns(), and otherwise by the engines above, one token object at
+    # a time.
 
     def parse(self, input=None, lexer=None, debug=False, tracking=False):
+        if isinstance(lexer, TokenColumns):
+            if self.positional and not debug and not tracking:
+                return self.parsecolumns(lexer)
+            lexer = ColumnTokens(lexer)
+        if tracking == "spans" and not debug and self.positional:
+            return self.parseopt_spans(input, lexer)
+        if debug or tracking:
+            return self.parsedebug(input, lexer, debug, tracking)
+        if self.positional:
+            return self.parseopt_values(input, lexer)
+        return self.parseopt_notrack(input, lexer)
+
+    # parsedebug().
+    #
+    # The instrumented parsing engine.  Supports the debug and tracking options.
+
+    def parsedebug(self, input=None, lexer=None, debug=False, tracking=False):
         # If debugging has been specified as a flag, turn it into a logging object
         if isinstance(debug, int) and debug:
             debug = PlyLogger(sys.stderr)
@@ -316,23 +483,8 @@ class LRParser:
         if input is not None:
             lexer.input(input)
 
-        tokenQueue = []
-
-        def get_token():
-            token = lexer.token()
-            if not token:
-                return token
-            if (token.type == "INDENT" or token.type == "DEDENT") and token.value > 1:
-                for i in range(token.value):
-                    tokenQueue.append(token)
-
-            else:
-                tokenQueue.append(token)
-            print(tokenQueue)
-            return tokenQueue.pop(0)
-
         # Set the token function
-        self.token = get_token
+        get_token = self.token = lexer.token
 
         # Set up the state and symbol stacks
         statestack = self.statestack = []  # Stack of parsing states
@@ -367,7 +519,6 @@ class LRParser:
 
                 # Check the action table
                 ltype = lookahead.type
-                print(ltype)
                 t = actions[state].get(ltype)
             else:
                 t = defaulted_states[state]
@@ -457,7 +608,10 @@ class LRParser:
                             # Call the grammar rule with our special slice object
                             del symstack[-plen:]
                             self.state = state
-                            p.callable(pslice)
+                            if p.positional:
+                                sym.value = p.callable(*[s.value for s in targ[1:]])
+                            else:
+                                p.callable(pslice)
                             del statestack[-plen:]
                             if debug:
                                 debug.info("Result : %s", format_result(pslice[0]))
@@ -480,79 +634,844 @@ class LRParser:
                             errorcount = error_count
                             self.errorok = False
 
-                        continue
+                        continue
+
+                    else:
+                        if tracking:
+                            sym.lineno = lexer.lineno
+                            sym.lexpos = lexer.lexpos
+
+                        targ = [sym]
+
+                        # !!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+                        # The code enclosed in this section is duplicated
+                        # above as a performance optimization.  Make sure
+                        # changes get made in both locations.
+
+                        pslice.slice = targ
+
+                        try:
+                            # Call the grammar rule with our special slice object
+                            self.state = state
+                            if p.positional:
+                                sym.value = p.callable()
+                            else:
+                                p.callable(pslice)
+                            if debug:
+                                debug.info("Result : %s", format_result(pslice[0]))
+                            symstack.append(sym)
+                            state = goto[statestack[-1]][pname]
+                            statestack.append(state)
+                        except SyntaxError:
+                            # If an error was set. Enter error recovery state
+                            lookaheadstack.append(
+                                lookahead
+                            )  # Save the current lookahead token
+                            statestack.pop()  # Pop back one state (before the reduce)
+                            state = statestack[-1]
+                            sym.type = "error"
+                            sym.value = "error"
+                            lookahead = sym
+                            errorcount = error_count
+                            self.errorok = False
+
+                        continue
+
+                if t == 0:
+                    n = symstack[-1]
+                    result = getattr(n, "value", None)
+
+                    if debug:
+                        debug.info("Done   : Returning %s", format_result(result))
+                        debug.info("PLY: PARSE DEBUG END")
+
+                    return result
+
+            if t is None:
+                if debug:
+                    debug.error(
+                        "Error  : %s",
+                        (
+                            "%s . %s"
+                            % (
+                                " ".join([xx.type for xx in symstack][1:]),
+                                str(lookahead),
+                            )
+                        ).lstrip(),
+                    )
+
+                # We have some kind of parsing error here.  To handle
+                # this, we are going to push the current token onto
+                # the tokenstack and replace it with an 'error' token.
+                # If there are any synchronization rules, they may
+                # catch it.
+                #
+                # In addition to pushing the error token, we call call
+                # the user defined p_error() function if this is the
+                # first syntax error.  This function is only called if
+                # errorcount == 0.
+                if errorcount == 0 or self.errorok:
+                    errorcount = error_count
+                    self.errorok = False
+                    errtoken = lookahead
+                    if errtoken.type == "$end":
+                        errtoken = None  # End of file!
+                    if self.errorfunc:
+                        if errtoken and not hasattr(errtoken, "lexer"):
+                            errtoken.lexer = lexer
+                        self.state = state
+                        tok = self.errorfunc(errtoken)
+                        if self.restarted:
+                            # restart() was called. Back to the start state
+                            self.restarted = False
+                            state = 0
+                            del statestack[1:]
+                            del symstack[1:]
+                        if self.errorok:
+                            # User must have done some kind of panic
+                            # mode recovery on their own.  The
+                            # returned token is the next lookahead
+                            lookahead = tok
+                            errtoken = None
+                            continue
+                    else:
+                        if errtoken:
+                            if hasattr(errtoken, "lineno"):
+                                lineno = lookahead.lineno
+                            else:
+                                lineno = 0
+                            if lineno:
+                                sys.stderr.write(
+                                    "yacc: Syntax error at line %d, token=%s\n"
+                                    % (lineno, errtoken.type)
+                                )
+                            else:
+                                sys.stderr.write(
+                                    "yacc: Syntax error, token=%s" % errtoken.type
+                                )
+                        else:
+                            sys.stderr.write("yacc: Parse error in input. EOF\n")
+                            return
+
+                else:
+                    errorcount = error_count
+
+                # case 1:  the statestack only has 1 entry on it.  If we're in this state, the
+                # entire parse has been rolled back and we're completely hosed.   The token is
+                # discarded and we just keep going.
+
+                if len(statestack) <= 1 and lookahead.type != "$end":
+                    lookahead = None
+                    errtoken = None
+                    state = 0
+                    # Nuke the pushback stack
+                    del lookaheadstack[:]
+                    continue
+
+                # case 2: the statestack has a couple of entries on it, but we're
+                # at the end of the file. nuke the top entry and generate an error token
+
+                # Start nuking entries on the stack
+                if lookahead.type == "$end":
+                    # Whoa. We're really hosed here. Bail out
+                    return
+
+                if lookahead.type != "error":
+                    sym = symstack[-1]
+                    if sym.type == "error":
+                        # Hmmm. Error is on top of stack, we'll just nuke input
+                        # symbol and continue
+                        if tracking:
+                            sym.endlineno = getattr(lookahead, "lineno", sym.lineno)
+                            sym.endlexpos = getattr(lookahead, "lexpos", sym.lexpos)
+                        lookahead = None
+                        continue
+
+                    # Create the error symbol for the first time and make it the new lookahead symbol
+                    t = YaccSymbol()
+                    t.type = "error"
+
+                    if hasattr(lookahead, "lineno"):
+                        t.lineno = t.endlineno = lookahead.lineno
+                    if hasattr(lookahead, "lexpos"):
+                        t.lexpos = t.endlexpos = lookahead.lexpos
+                    t.value = lookahead
+                    lookaheadstack.append(lookahead)
+                    lookahead = t
+                else:
+                    sym = symstack.pop()
+                    if tracking:
+                        lookahead.lineno = sym.lineno
+                        lookahead.lexpos = sym.lexpos
+                    statestack.pop()
+                    state = statestack[-1]
+
+                continue
+
+            # If we'r here, something really bad happened
+            raise RuntimeError("yacc: internal parser error!!!\n")
+
+    # parseopt_notrack().
+    #
+    # Optimized version of parsedebug() with the debugging and position tracking
+    # code removed.  This is the engine used by parse() by default.  The stacks
+    # and the current state are kept in locals only, so the statestack, symstack
+    # and state attributes are only available with parsedebug().
+    #
+    # !!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+    # The parsing logic here mirrors parsedebug().  Make sure changes get made
+    # in both engines.
+    # !!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+
+    def parseopt_notrack(self, input=None, lexer=None):
+        lookahead = None  # Current lookahead symbol
+        lookaheadstack = []  # Stack of lookahead symbols
+        dense = self.dense_table()
+        rows = dense.rows  # Local reference to the dense action/goto rows
+        nstates = dense.nstates  # First reduction code
+        termids = dense.termids  # Terminal name -> table column
+        lhs = dense.lhs  # Production number -> goto column
+        prod = self.productions  # Local reference to production list
+        pslice = YaccProduction(None)  # Production object passed to grammar rules
+        errorcount = 0  # Used during error recovery
+
+        # If no lexer was given, we will try to use the lex module
+        if not lexer:
+            from . import lex
+
+            lexer = lex.lexer
+
+        # Set up the lexer and parser objects on pslice
+        pslice.lexer = lexer
+        pslice.parser = self
+
+        # If input was supplied, pass to lexer
+        if input is not None:
+            lexer.input(input)
+
+        # Set the token function
+        get_token = lexer.token
+
+        # Set up the state and symbol stacks
+        statestack = []  # Stack of parsing states
+        symstack = []  # Stack of grammar symbols
+        pslice.stack = symstack  # Put in the production
+        errtoken = None  # Err token
+
+        # The start state is assumed to be (0,$end)
+
+        statestack.append(0)
+        sym = YaccSymbol()
+        sym.type = "$end"
+        symstack.append(sym)
+        state = 0
+        ltid = None  # Table column of the lookahead
+        while True:
+            # Get the next symbol on the input.  If a lookahead symbol
+            # is already set, we just use that. Otherwise, we'll pull
+            # the next token off of the lookaheadstack or from the lexer
+
+            row = rows[state]
+            t = row[0]  # Default reduction
+            if not t:
+                if not lookahead:
+                    if not lookaheadstack:
+                        lookahead = get_token()  # Get the next token
+                    else:
+                        lookahead = lookaheadstack.pop()
+                    if not lookahead:
+                        lookahead = YaccSymbol()
+                        lookahead.type = "$end"
+                    ltid = termids.get(lookahead.type, 1)
+
+                # Check the action table
+                t = row[ltid]
+
+            if t:
+                if t < nstates:
+                    # shift a symbol on the stack
+                    statestack.append(t)
+                    state = t
+
+                    symstack.append(lookahead)
+                    lookahead = None
+
+                    # Decrease error count on successful shift
+                    if errorcount:
+                        errorcount -= 1
+                    continue
+
+                t -= nstates
+                if t:
+                    # reduce a symbol on the stack, emit a production
+                    p = prod[t]
+                    pname = p.name
+                    plen = p.len
+
+                    # Get production function
+                    sym = YaccSymbol()
+                    sym.type = pname  # Production name
+                    sym.value = None
+
+                    if plen:
+                        targ = symstack[-plen - 1 :]
+                        targ[0] = sym
+
+                        # !!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+                        # The code enclosed in this section is duplicated
+                        # below as a performance optimization.  Make sure
+                        # changes get made in both locations.
+
+                        pslice.slice = targ
+
+                        try:
+                            # Call the grammar rule with our special slice object
+                            del symstack[-plen:]
+                            if p.positional:
+                                sym.value = p.callable(*[s.value for s in targ[1:]])
+                            else:
+                                p.callable(pslice)
+                            del statestack[-plen:]
+                            symstack.append(sym)
+                            state = rows[statestack[-1]][lhs[t]]
+                            statestack.append(state)
+                        except SyntaxError:
+                            # If an error was set. Enter error recovery state
+                            lookaheadstack.append(
+                                lookahead
+                            )  # Save the current lookahead token
+                            symstack.extend(
+                                targ[1:-1]
+                            )  # Put the production slice back on the stack
+                            statestack.pop()  # Pop back one state (before the reduce)
+                            state = statestack[-1]
+                            sym.type = "error"
+                            sym.value = "error"
+                            lookahead = sym
+                            ltid = termids["error"]
+                            errorcount = error_count
+                            self.errorok = False
+
+                        continue
+
+                    else:
+                        targ = [sym]
+
+                        # !!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+                        # The code enclosed in this section is duplicated
+                        # above as a performance optimization.  Make sure
+                        # changes get made in both locations.
+
+                        pslice.slice = targ
+
+                        try:
+                            # Call the grammar rule with our special slice object
+                            if p.positional:
+                                sym.value = p.callable()
+                            else:
+                                p.callable(pslice)
+                            symstack.append(sym)
+                            state = rows[statestack[-1]][lhs[t]]
+                            statestack.append(state)
+                        except SyntaxError:
+                            # If an error was set. Enter error recovery state
+                            lookaheadstack.append(
+                                lookahead
+                            )  # Save the current lookahead token
+                            statestack.pop()  # Pop back one state (before the reduce)
+                            state = statestack[-1]
+                            sym.type = "error"
+                            sym.value = "error"
+                            lookahead = sym
+                            ltid = termids["error"]
+                            errorcount = error_count
+                            self.errorok = False
+
+                        continue
+
+                if t == 0:
+                    n = symstack[-1]
+                    result = getattr(n, "value", None)
+                    return result
+
+            else:
+                # We have some kind of parsing error here.  To handle
+                # this, we are going to push the current token onto
+                # the tokenstack and replace it with an 'error' token.
+                # If there are any synchronization rules, they may
+                # catch it.
+                #
+                # In addition to pushing the error token, we call call
+                # the user defined p_error() function if this is the
+                # first syntax error.  This function is only called if
+                # errorcount == 0.
+                if errorcount == 0 or self.errorok:
+                    errorcount = error_count
+                    self.errorok = False
+                    errtoken = lookahead
+                    if errtoken.type == "$end":
+                        errtoken = None  # End of file!
+                    if self.errorfunc:
+                        if errtoken and not hasattr(errtoken, "lexer"):
+                            errtoken.lexer = lexer
+                        tok = self.errorfunc(errtoken)
+                        if self.restarted:
+                            # restart() was called. Back to the start state
+                            self.restarted = False
+                            state = 0
+                            del statestack[1:]
+                            del symstack[1:]
+                        if self.errorok:
+                            # User must have done some kind of panic
+                            # mode recovery on their own.  The
+                            # returned token is the next lookahead
+                            lookahead = tok
+                            if tok:
+                                ltid = termids.get(tok.type, 1)
+                            errtoken = None
+                            continue
+                    else:
+                        if errtoken:
+                            if hasattr(errtoken, "lineno"):
+                                lineno = lookahead.lineno
+                            else:
+                                lineno = 0
+                            if lineno:
+                                sys.stderr.write(
+                                    "yacc: Syntax error at line %d, token=%s\n"
+                                    % (lineno, errtoken.type)
+                                )
+                            else:
+                                sys.stderr.write(
+                                    "yacc: Syntax error, token=%s" % errtoken.type
+                                )
+                        else:
+                            sys.stderr.write("yacc: Parse error in input. EOF\n")
+                            return
+
+                else:
+                    errorcount = error_count
+
+                # case 1:  the statestack only has 1 entry on it.  If we're in this state, the
+                # entire parse has been rolled back and we're completely hosed.   The token is
+                # discarded and we just keep going.
+
+                if len(statestack) <= 1 and lookahead.type != "$end":
+                    lookahead = None
+                    errtoken = None
+                    state = 0
+                    # Nuke the pushback stack
+                    del lookaheadstack[:]
+                    continue
+
+                # case 2: the statestack has a couple of entries on it, but we're
+                # at the end of the file. nuke the top entry and generate an error token
+
+                # Start nuking entries on the stack
+                if lookahead.type == "$end":
+                    # Whoa. We're really hosed here. Bail out
+                    return
+
+                if lookahead.type != "error":
+                    sym = symstack[-1]
+                    if sym.type == "error":
+                        # Hmmm. Error is on top of stack, we'll just nuke input
+                        # symbol and continue
+                        lookahead = None
+                        continue
+
+                    # Create the error symbol for the first time and make it the new lookahead symbol
+                    t = YaccSymbol()
+                    t.type = "error"
+
+                    if hasattr(lookahead, "lineno"):
+                        t.lineno = t.endlineno = lookahead.lineno
+                    if hasattr(lookahead, "lexpos"):
+                        t.lexpos = t.endlexpos = lookahead.lexpos
+                    t.value = lookahead
+                    lookaheadstack.append(lookahead)
+                    lookahead = t
+                    ltid = termids["error"]
+                else:
+                    sym = symstack.pop()
+                    statestack.pop()
+                    state = statestack[-1]
+
+                continue
+
+            # If we'r here, something really bad happened
+            raise RuntimeError("yacc: internal parser error!!!\n")
+
+    # parseopt_values().
+    #
+    # Engine used by parse() when every grammar rule function uses the
+    # positional protocol.  The stacks hold parser states and plain values
+    # only.  A shift pushes the value of the lookahead token and a reduce
+    # calls the rule function with the values it replaces, so no YaccSymbol
+    # or slice is made for the nonterminals.  During error recovery, the
+    # error symbol on top of the stack is recognized by the state it leads
+    # into (LRDenseTable.errorstates).
+    #
+    # stacks is a (statestack, valstack, lookahead) tuple to carry on a parse
+    # from, as left by a parser module made by write_module() when it runs
+    # into a syntax error.
+    #
+    # !!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+    # The parsing logic here mirrors parseopt_notrack().  Make sure changes get
+    # made in all engines.
+    # !!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+
+    def parseopt_values(self, input=None, lexer=None, stacks=None):
+        lookahead = None  # Current lookahead symbol
+        lookaheadstack = []  # Stack of lookahead symbols
+        dense = self.dense_table()
+        rows = dense.rows  # Local reference to the dense action/goto rows
+        nstates = dense.nstates  # First reduction code
+        termids = dense.termids  # Terminal name -> table column
+        lhs = dense.lhs  # Production number -> goto column
+        errorstates = dense.errorstates  # States entered by shifting error
+        prod = self.productions  # Local reference to production list
+        errorcount = 0  # Used during error recovery
+
+        # If no lexer was given, we will try to use the lex module
+        if not lexer:
+            from . import lex
+
+            lexer = lex.lexer
+
+        # If input was supplied, pass to lexer
+        if input is not None:
+            lexer.input(input)
+
+        # Set the token function
+        get_token = lexer.token
+
+        if stacks is None:
+            # The start state is assumed to be (0,$end)
+            statestack = [0]  # Stack of parsing states
+            valstack = [None]  # Stack of symbol values
+        else:
+            statestack, valstack, lookahead = stacks
+        errtoken = None  # Err token
+        state = statestack[-1]
+        ltid = termids.get(lookahead.type, 1) if lookahead else None
+        while True:
+            row = rows[state]
+            t = row[0]  # Default reduction
+            if not t:
+                if not lookahead:
+                    if not lookaheadstack:
+                        lookahead = get_token()  # Get the next token
+                    else:
+                        lookahead = lookaheadstack.pop()
+                    if not lookahead:
+                        lookahead = YaccSymbol()
+                        lookahead.type = "$end"
+                        lookahead.value = None
+                    ltid = termids.get(lookahead.type, 1)
+
+                # Check the action table
+                t = row[ltid]
+
+            if t:
+                if t < nstates:
+                    # shift a symbol on the stack
+                    statestack.append(t)
+                    state = t
+                    valstack.append(lookahead.value)
+                    lookahead = None
+
+                    # Decrease error count on successful shift
+                    if errorcount:
+                        errorcount -= 1
+                    continue
+
+                t -= nstates
+                if t:
+                    # reduce a symbol on the stack, emit a production
+                    p = prod[t]
+                    plen = p.len
+                    try:
+                        if plen == 1:
+                            value = p.callable(valstack[-1])
+                        elif plen:
+                            value = p.callable(*valstack[-plen:])
+                        else:
+                            value = p.callable()
+                    except SyntaxError:
+                        # If an error was set. Enter error recovery state,
+                        # leaving the stacks as parseopt_notrack() does
+                        lookaheadstack.append(lookahead)
+                        if plen:
+                            valstack.pop()
+                        statestack.pop()  # Pop back one state (before the reduce)
+                        state = statestack[-1]
+                        lookahead = YaccSymbol()
+                        lookahead.type = "error"
+                        lookahead.value = "error"
+                        ltid = termids["error"]
+                        errorcount = error_count
+                        self.errorok = False
+                        continue
+
+                    if plen:
+                        del valstack[-plen:]
+                        del statestack[-plen:]
+                    valstack.append(value)
+                    state = rows[statestack[-1]][lhs[t]]
+                    statestack.append(state)
+                    continue
+
+                if t == 0:
+                    return valstack[-1]
+
+            else:
+                # We have some kind of parsing error here.  See
+                # parseopt_notrack() for the details.
+                if errorcount == 0 or self.errorok:
+                    errorcount = error_count
+                    self.errorok = False
+                    errtoken = lookahead
+                    if errtoken.type == "$end":
+                        errtoken = None  # End of file!
+                    if self.errorfunc:
+                        if errtoken and not hasattr(errtoken, "lexer"):
+                            errtoken.lexer = lexer
+                        tok = self.errorfunc(errtoken)
+                        if self.restarted:
+                            # restart() was called. Back to the start state
+                            self.restarted = False
+                            state = 0
+                            del statestack[1:]
+                            del valstack[1:]
+                        if self.errorok:
+                            # User must have done some kind of panic
+                            # mode recovery on their own.  The
+                            # returned token is the next lookahead
+                            lookahead = tok
+                            if tok:
+                                ltid = termids.get(tok.type, 1)
+                            errtoken = None
+                            continue
+                    else:
+                        if errtoken:
+                            if hasattr(errtoken, "lineno"):
+                                lineno = lookahead.lineno
+                            else:
+                                lineno = 0
+                            if lineno:
+                                sys.stderr.write(
+                                    "yacc: Syntax error at line %d, token=%s\n"
+                                    % (lineno, errtoken.type)
+                                )
+                            else:
+                                sys.stderr.write(
+                                    "yacc: Syntax error, token=%s" % errtoken.type
+                                )
+                        else:
+                            sys.stderr.write("yacc: Parse error in input. EOF\n")
+                            return
+
+                else:
+                    errorcount = error_count
+
+                # case 1:  the statestack only has 1 entry on it.  The entire
+                # parse has been rolled back.  The token is discarded and we
+                # just keep going.
+
+                if len(statestack) <= 1 and lookahead.type != "$end":
+                    lookahead = None
+                    errtoken = None
+                    state = 0
+                    # Nuke the pushback stack
+                    del lookaheadstack[:]
+                    continue
+
+                # case 2: the statestack has a couple of entries on it, but we're
+                # at the end of the file. nuke the top entry and generate an error token
+
+                # Start nuking entries on the stack
+                if lookahead.type == "$end":
+                    # Whoa. We're really hosed here. Bail out
+                    return
+
+                if lookahead.type != "error":
+                    if statestack[-1] in errorstates:
+                        # Hmmm. Error is on top of stack, we'll just nuke input
+                        # symbol and continue
+                        lookahead = None
+                        continue
+
+                    # Create the error symbol for the first time and make it the new lookahead symbol
+                    t = YaccSymbol()
+                    t.type = "error"
+
+                    if hasattr(lookahead, "lineno"):
+                        t.lineno = t.endlineno = lookahead.lineno
+                    if hasattr(lookahead, "lexpos"):
+                        t.lexpos = t.endlexpos = lookahead.lexpos
+                    t.value = lookahead
+                    lookaheadstack.append(lookahead)
+                    lookahead = t
+                    ltid = termids["error"]
+                else:
+                    valstack.pop()
+                    statestack.pop()
+                    state = statestack[-1]
+
+                continue
+
+            # If we'r here, something really bad happened
+            raise RuntimeError("yacc: internal parser error!!!\n")
+
+    # parseopt_spans().
+    #
+    # parseopt_values() with cheap position tracking, used by parse() for
+    # tracking="spans".  Next to the value stack it keeps the first token of
+    # every symbol on the stack, and the last token of a right hand side is
+    # always the last token shifted.  When a reduction makes a value whose
+    # span attribute is None, the span is set to the (lineno, lexpos,
+    # endlineno, endlexpos) of those tokens, where endlineno and endlexpos
+    # are the position of the last token as in parsedebug().  Values without
+    # a span attribute (lists, strings, None) are left alone, and a value
+    # passed up by a unit rule keeps the span it got first.
+    #
+    # !!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+    # The parsing logic here mirrors parseopt_values().  Make sure changes get
+    # made in all engines.
+    # !!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+
+    def parseopt_spans(self, input=None, lexer=None):
+        lookahead = None  # Current lookahead symbol
+        lookaheadstack = []  # Stack of lookahead symbols
+        dense = self.dense_table()
+        rows = dense.rows  # Local reference to the dense action/goto rows
+        nstates = dense.nstates  # First reduction code
+        termids = dense.termids  # Terminal name -> table column
+        lhs = dense.lhs  # Production number -> goto column
+        errorstates = dense.errorstates  # States entered by shifting error
+        prod = self.productions  # Local reference to production list
+        spanrules = self.span_rules()  # Rules that may make a node
+        errorcount = 0  # Used during error recovery
 
-                    else:
-                        if tracking:
-                            sym.lineno = lexer.lineno
-                            sym.lexpos = lexer.lexpos
+        # If no lexer was given, we will try to use the lex module
+        if not lexer:
+            from . import lex
 
-                        targ = [sym]
+            lexer = lex.lexer
 
-                        # !!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
-                        # The code enclosed in this section is duplicated
-                        # above as a performance optimization.  Make sure
-                        # changes get made in both locations.
+        # If input was supplied, pass to lexer
+        if input is not None:
+            lexer.input(input)
 
-                        pslice.slice = targ
+        # Set the token function
+        get_token = lexer.token
 
-                        try:
-                            # Call the grammar rule with our special slice object
-                            self.state = state
-                            p.callable(pslice)
-                            if debug:
-                                debug.info("Result : %s", format_result(pslice[0]))
-                            symstack.append(sym)
-                            state = goto[statestack[-1]][pname]
-                            statestack.append(state)
-                        except SyntaxError:
-                            # If an error was set. Enter error recovery state
-                            lookaheadstack.append(
-                                lookahead
-                            )  # Save the current lookahead token
-                            statestack.pop()  # Pop back one state (before the reduce)
-                            state = statestack[-1]
-                            sym.type = "error"
-                            sym.value = "error"
-                            lookahead = sym
-                            errorcount = error_count
-                            self.errorok = False
+        # The start state is assumed to be (0,$end)
+        statestack = [0]  # Stack of parsing states
+        valstack = [None]  # Stack of symbol values
+        last = YaccSymbol()  # Last token shifted, at first a stand-in
+        last.lineno = last.lexpos = 0
+        firststack = [last]  # First token of each symbol
+        push_first = firststack.append
+        errtoken = None  # Err token
+        state = 0
+        ltid = None
+        while True:
+            row = rows[state]
+            t = row[0]  # Default reduction
+            if not t:
+                if not lookahead:
+                    if not lookaheadstack:
+                        lookahead = get_token()  # Get the next token
+                    else:
+                        lookahead = lookaheadstack.pop()
+                    if not lookahead:
+                        lookahead = YaccSymbol()
+                        lookahead.type = "$end"
+                        lookahead.value = None
+                    ltid = termids.get(lookahead.type, 1)
 
-                        continue
+                # Check the action table
+                t = row[ltid]
 
-                if t == 0:
-                    n = symstack[-1]
-                    result = getattr(n, "value", None)
+            if t:
+                if t < nstates:
+                    # shift a symbol on the stack
+                    statestack.append(t)
+                    state = t
+                    valstack.append(lookahead.value)
+                    push_first(lookahead)
+                    last = lookahead
+                    lookahead = None
 
-                    if debug:
-                        debug.info("Done   : Returning %s", format_result(result))
-                        debug.info("PLY: PARSE DEBUG END")
+                    # Decrease error count on successful shift
+                    if errorcount:
+                        errorcount -= 1
+                    continue
 
-                    return result
+                t -= nstates
+                if t:
+                    # reduce a symbol on the stack, emit a production
+                    p = prod[t]
+                    plen = p.len
+                    try:
+                        if plen == 1:
+                            value = p.callable(valstack[-1])
+                        elif plen:
+                            value = p.callable(*valstack[-plen:])
+                        else:
+                            value = p.callable()
+                    except SyntaxError:
+                        # If an error was set. Enter error recovery state,
+                        # leaving the stacks as parseopt_notrack() does
+                        lookaheadstack.append(lookahead)
+                        if plen:
+                            valstack.pop()
+                            firststack.pop()
+                        statestack.pop()  # Pop back one state (before the reduce)
+                        state = statestack[-1]
+                        lookahead = YaccSymbol()
+                        lookahead.type = "error"
+                        lookahead.value = "error"
+                        lookahead.lineno = last.lineno
+                        lookahead.lexpos = last.lexpos
+                        ltid = termids["error"]
+                        errorcount = error_count
+                        self.errorok = False
+                        continue
 
-            if t is None:
-                if debug:
-                    debug.error(
-                        "Error  : %s",
-                        (
-                            "%s . %s"
-                            % (
-                                " ".join([xx.type for xx in symstack][1:]),
-                                str(lookahead),
-                            )
-                        ).lstrip(),
-                    )
+                    if plen:
+                        # The first token of the right hand side stays on
+                        # the stack as the first token of the left hand side
+                        first = firststack[-plen]
+                        if plen > 1:
+                            del firststack[1 - plen :]
+                        del valstack[-plen:]
+                        del statestack[-plen:]
+                    else:
+                        # An empty symbol sits right after the last token
+                        first = last
+                        push_first(last)
+                    # The first rule to make a value gives it its span
+                    if spanrules[t] and getattr(value, "span", 0) is None:
+                        value.span = (
+                            first.lineno,
+                            first.lexpos,
+                            last.lineno,
+                            last.lexpos,
+                        )
+                    valstack.append(value)
+                    state = rows[statestack[-1]][lhs[t]]
+                    statestack.append(state)
+                    continue
 
-                # We have some kind of parsing error here.  To handle
-                # this, we are going to push the current token onto
-                # the tokenstack and replace it with an 'error' token.
-                # If there are any synchronization rules, they may
-                # catch it.
-                #
-                # In addition to pushing the error token, we call call
-                # the user defined p_error() function if this is the
-                # first syntax error.  This function is only called if
-                # errorcount == 0.
+                if t == 0:
+                    return valstack[-1]
+
+            else:
+                # We have some kind of parsing error here.  See
+                # parseopt_notrack() for the details.
                 if errorcount == 0 or self.errorok:
                     errorcount = error_count
                     self.errorok = False
@@ -562,13 +1481,21 @@ class LRParser:
                     if self.errorfunc:
                         if errtoken and not hasattr(errtoken, "lexer"):
                             errtoken.lexer = lexer
-                        self.state = state
                         tok = self.errorfunc(errtoken)
+                        if self.restarted:
+                            # restart() was called. Back to the start state
+                            self.restarted = False
+                            state = 0
+                            del statestack[1:]
+                            del valstack[1:]
+                            del firststack[1:]
                         if self.errorok:
                             # User must have done some kind of panic
                             # mode recovery on their own.  The
                             # returned token is the next lookahead
                             lookahead = tok
+                            if tok:
+                                ltid = termids.get(tok.type, 1)
                             errtoken = None
                             continue
                     else:
@@ -593,9 +1520,9 @@ class LRParser:
                 else:
                     errorcount = error_count
 
-                # case 1:  the statestack only has 1 entry on it.  If we're in this state, the
-                # entire parse has been rolled back and we're completely hosed.   The token is
-                # discarded and we just keep going.
+                # case 1:  the statestack only has 1 entry on it.  The entire
+                # parse has been rolled back.  The token is discarded and we
+                # just keep going.
 
                 if len(statestack) <= 1 and lookahead.type != "$end":
                     lookahead = None
@@ -614,19 +1541,16 @@ class LRParser:
                     return
 
                 if lookahead.type != "error":
-                    sym = symstack[-1]
-                    if sym.type == "error":
+                    if statestack[-1] in errorstates:
                         # Hmmm. Error is on top of stack, we'll just nuke input
                         # symbol and continue
-                        if tracking:
-                            sym.endlineno = getattr(lookahead, "lineno", sym.lineno)
-                            sym.endlexpos = getattr(lookahead, "lexpos", sym.lexpos)
                         lookahead = None
                         continue
 
                     # Create the error symbol for the first time and make it the new lookahead symbol
                     t = YaccSymbol()
                     t.type = "error"
+                    t.lineno = t.lexpos = 0
 
                     if hasattr(lookahead, "lineno"):
                         t.lineno = t.endlineno = lookahead.lineno
@@ -635,12 +1559,11 @@ class LRParser:
                     t.value = lookahead
                     lookaheadstack.append(lookahead)
                     lookahead = t
+                    ltid = termids["error"]
                 else:
-                    sym = symstack.pop()
-                    if tracking:
-                        lookahead.lineno = sym.lineno
-                        lookahead.lexpos = sym.lexpos
+                    valstack.pop()
                     statestack.pop()
+                    firststack.pop()
                     state = statestack[-1]
 
                 continue
@@ -648,6 +1571,458 @@ class LRParser:
             # If we'r here, something really bad happened
             raise RuntimeError("yacc: internal parser error!!!\n")
 
+    # parsecolumns().
+    #
+    # Parse a token stream that was already tokenized into a lex.TokenColumns
+    # by Lexer.tokenize_all().  Every rule function must be positional.  Token
+    # values are taken straight from the columns and the stacks only hold
+    # states and plain values, so no object is created per token.  At the
+    # first syntax error the stacks are handed over to parseopt_values(),
+    # which goes on with tokens built from the columns, so error reporting
+    # and recovery are exactly those of the other engines.
+    def parsecolumns(self, columns):
+        dense = self.dense_table()
+        rows = dense.rows  # Local reference to the dense action/goto rows
+        nstates = dense.nstates  # First reduction code
+        lhs = dense.lhs  # Production number -> goto column
+        prod = self.productions  # Local reference to production list
+
+        # Table column of each type id of the columns, then of $end
+        termids = [dense.termids.get(name, 1) for name in columns.typenames]
+        termids.append(dense.termids["$end"])
+        types = columns.types
+        starts = columns.lexpos
+        ends = columns.ends
+        values = columns.values
+        data = columns.data
+        ntokens = len(types)
+        index = 0  # Index of the lookahead token
+
+        statestack = [0]  # Stack of parsing states
+        valstack = [None]  # Stack of values
+        state = 0
+        ltid = None  # Table column of the lookahead
+        while True:
+            row = rows[state]
+            t = row[0]  # Default reduction
+            if not t:
+                if ltid is None:
+                    ltid = termids[types[index] if index < ntokens else -1]
+                t = row[ltid]
+
+            if t:
+                if t < nstates:
+                    # shift the lookahead value on the stack
+                    statestack.append(t)
+                    state = t
+                    if index in values:
+                        valstack.append(values[index])
+                    else:
+                        valstack.append(data[starts[index] : ends[index]])
+                    index += 1
+                    ltid = None
+                    continue
+
+                t -= nstates
+                if t:
+                    # reduce a symbol on the stack, emit a production
+                    p = prod[t]
+                    plen = p.len
+                    if plen:
+                        value = p.callable(*valstack[-plen:])
+                        del valstack[-plen:]
+                        del statestack[-plen:]
+                    else:
+                        value = p.callable()
+                    valstack.append(value)
+                    state = rows[statestack[-1]][lhs[t]]
+                    statestack.append(state)
+                    continue
+
+                return valstack[-1]
+
+            # Syntax error.  Only now are token objects built
+            return self.parseopt_values(
+                lexer=ColumnTokens(columns, index), stacks=(statestack, valstack, None)
+            )
+
+    # write_module().
+    #
+    # Write a module running this parser as straight-line code.  See the
+    # Parser Module Generator section below.  Every rule function must be
+    # positional.  Returns the name of the file written.
+
+    def write_module(self, module, outputdir="", signature=""):
+        dense = self.dense_table()
+        rows = dense.rows
+        nstates = dense.nstates
+        prods = self.productions
+        for p in prods[1:]:
+            if not p.positional:
+                raise YaccError("Rule %r isn't positional" % p.func)
+
+        imports = {}  # Module name -> names imported from it
+        actions = {}  # Production number -> (value slot names, expression)
+        for n, p in enumerate(prods):
+            if n == 0:
+                continue
+            func = p.callable
+            names = ["v%d" % (i + 1) for i in range(p.len)]
+            rule = rule_expression(func)
+            if rule and len(rule[0]) == p.len:
+                params, expr = rule
+                used = {x.id for x in ast.walk(expr) if isinstance(x, ast.Name)}
+                free = used - set(params)
+                if all(
+                    x not in _module_names
+                    and x not in names
+                    and not x.startswith("_")
+                    and (x in func.__globals__ or hasattr(builtins, x))
+                    for x in free
+                ):
+                    expr = _RenameParameters(dict(zip(params, names))).visit(expr)
+                    for name in sorted(free):
+                        if name in func.__globals__:
+                            imports.setdefault(func.__module__, set()).add(name)
+                    actions[n] = (names, ast.unparse(expr))
+                    continue
+            name = func.__name__
+            if getattr(sys.modules.get(func.__module__), name, None) is not func:
+                raise YaccError("Rule function %r can't be imported" % p.func)
+            if name in _module_names or name.startswith("_"):
+                raise YaccError("Rule function %r clashes with the parser" % p.func)
+            imports.setdefault(func.__module__, set()).add(name)
+            actions[n] = (names, "%s(%s)" % (name, ", ".join(names)))
+
+        # Goto tables by nonterminal, and the nonterminals always going to
+        # the same state
+        gotos = {}
+        for name, col in sorted(dense.ntermids.items(), key=lambda x: x[1]):
+            column = tuple(row[col] for row in rows)
+            targets = set(column) - {0}
+            gotos[name] = (column, targets.pop() if len(targets) == 1 else None)
+
+        def value_code(n, out, indent):
+            # Replace the values of the right hand side of production n on
+            # valstack by the value of its left hand side
+            p = prods[n]
+            names, expr = actions[n]
+            out.append("%s# %s" % (indent, p))
+            if p.len == 0:
+                out.append("%svalstack.append(%s)" % (indent, expr))
+            elif p.len == 1:
+                if expr != names[0]:
+                    out.append("%sv1 = valstack[-1]" % indent)
+                    out.append("%svalstack[-1] = %s" % (indent, expr))
+            else:
+                out.append("%s%s = valstack[-%d:]" % (indent, ", ".join(names), p.len))
+                out.append("%sdel valstack[-%d:]" % (indent, p.len - 1))
+                out.append("%svalstack[-1] = %s" % (indent, expr))
+
+        def fetch_code(out, indent):
+            out.append("%sif lookahead is None:" % indent)
+            out.append("%s    lookahead = get_token()" % indent)
+            out.append("%s    if lookahead is None:" % indent)
+            out.append("%s        lookahead = YaccSymbol()" % indent)
+            out.append('%s        lookahead.type = "$end"' % indent)
+            out.append("%s        lookahead.value = None" % indent)
+            out.append("%s    ltid = _termids.get(lookahead.type, 1)" % indent)
+
+        def goto_code(state, push, out, indent):
+            # Make state the current state and go on from there
+            if push:
+                out.append("%sstate = %d" % (indent, state))
+                out.append("%sstatestack.append(%d)" % (indent, state))
+            else:
+                out.append("%sstate = statestack[-1] = %d" % (indent, state))
+            out.append("%scontinue" % indent)
+
+        def only_reduction(state):
+            # The production state reduces by whatever the lookahead is, if
+            # any, and whether the lookahead must be checked first
+            row = rows[state]
+            if row[0]:
+                return row[0] - nstates, False
+            codes = set(row[2 : 2 + len(dense.termids)]) - {0}
+            if len(codes) == 1 and min(codes) > nstates:
+                return min(codes) - nstates, True
+            return None, False
+
+        # The code below keeps track of the current state while it is known
+        # when the code is generated, and only stores it when needed.  With
+        # push true, state isn't on statestack yet.  Otherwise it takes the
+        # place of the top entry.  below is the state under it, or None when
+        # it is only known at run time.
+
+        def reduce_code(n, state, below, push, out, indent):
+            # Reduce by production n in state.  Returns the state, below and
+            # push after the goto, or None if the code goes on at run time.
+            p = prods[n]
+            value_code(n, out, indent)
+            column, target = gotos[p.name]
+            if p.len == 0:
+                if push:
+                    out.append("%sstatestack.append(%d)" % (indent, state))
+                return column[state], state, True
+            if p.len > 1:
+                out.append("%sdel statestack[-%d:]" % (indent, p.len - 1))
+                below = None
+            if below is not None:
+                target = column[below]
+            if target is not None:
+                return target, below, push
+            under = "statestack[-1]" if push else "statestack[-2]"
+            out.append("%sstate = _goto_%s[%s]" % (indent, p.name, under))
+            if push:
+                out.append("%sstatestack.append(state)" % indent)
+            else:
+                out.append("%sstatestack[-1] = state" % indent)
+            out.append("%scontinue" % indent)
+            return None
+
+        def enter(state, below, push, out, indent):
+            # Go to state.  The reductions that follow for sure, or after a
+            # check of the lookahead, are made right here for as long as the
+            # states they lead to are known.
+            for _ in range(8):
+                n, check = only_reduction(state)
+                if n is None:
+                    break
+                if check:
+                    fetch_code(out, indent)
+                    out.append(
+                        "%sif _row%d[ltid] != %d:" % (indent, state, nstates + n)
+                    )
+                    goto_code(state, push, out, indent + "    ")
+                result = reduce_code(n, state, below, push, out, indent)
+                if result is None:
+                    return
+                state, below, push = result
+            goto_code(state, push, out, indent)
+
+        def state_code(state, out, indent):
+            # Code for state, which is on top of statestack
+            row = rows[state]
+            if row[0]:
+                result = reduce_code(row[0] - nstates, state, None, False, out, indent)
+                if result:
+                    enter(*result, out, indent)
+                return
+            fetch_code(out, indent)
+            out.append("%st = _row%d[ltid]" % (indent, state))
+            codes = set(row[2 : 2 + len(dense.termids)]) - {0}
+            shifts = sorted(t for t in codes if t < nstates)
+            # Shifts into states that reduce next get code of their own
+            fused = [t for t in shifts if only_reduction(t)[0] is not None]
+            for t in fused:
+                out.append("%sif t == %d:" % (indent, t))
+                out.append("%s    valstack.append(lookahead.value)" % indent)
+                out.append("%s    lookahead = None" % indent)
+                enter(t, state, True, out, indent + "    ")
+            if len(fused) < len(shifts):
+                out.append("%sif 0 < t < %d:" % (indent, nstates))
+                out.append("%s    valstack.append(lookahead.value)" % indent)
+                out.append("%s    lookahead = None" % indent)
+                out.append("%s    state = t" % indent)
+                out.append("%s    statestack.append(t)" % indent)
+                out.append("%s    continue" % indent)
+            for t in sorted(codes):
+                if t > nstates:
+                    out.append("%sif t == %d:" % (indent, t))
+                    result = reduce_code(
+                        t - nstates, state, None, False, out, indent + "    "
+                    )
+                    if result:
+                        enter(*result, out, indent + "    ")
+            if nstates in codes:
+                out.append("%sif t == %d:" % (indent, nstates))
+                out.append("%s    return valstack[-1]" % indent)
+            out.append(
+                "%sreturn self.lrparser.parseopt_values("
+                "lexer=lexer, stacks=(statestack, valstack, lookahead))" % indent
+            )
+
+        def dispatch(lo, hi, out, indent):
+            # Binary tree of comparisons finding the code for states lo .. hi-1
+            if hi - lo == 1:
+                state_code(lo, out, indent)
+                return
+            mid = (lo + hi) // 2
+            out.append("%sif state < %d:" % (indent, mid))
+            dispatch(lo, mid, out, indent + "    ")
+            out.append("%selse:" % indent)
+            dispatch(mid, hi, out, indent + "    ")
+
+        filename = os.path.join(outputdir, module) + ".py"
+        out = [
+            "# %s" % os.path.basename(filename),
+            "# This file is automatically generated by yacc.py. Do not edit.",
+            "# pylint: disable=W,C,R",
+            "",
+            "from %s import YaccSymbol" % __name__,
+        ]
+        for modname in sorted(imports):
+            names = ", ".join(sorted(imports[modname]))
+            out.append("from %s import %s" % (modname, names))
+        out.append("")
+        out.append("_signature = %r" % signature)
+        out.append("")
+        out.append("_termids = %r" % dict(sorted(dense.termids.items())))
+        out.append("")
+        for name, (column, target) in gotos.items():
+            if target is None:
+                out.append("_goto_%s = %r" % (name, column))
+        for state, row in enumerate(rows):
+            if not row[0]:
+                out.append("_row%d = %r" % (state, row[: 2 + len(dense.termids)]))
+        out.append("")
+        out.append("")
+        out.extend(_module_parser.splitlines())
+        dispatch(0, nstates, out, " " * 12)
+        out.append("")
+
+        # Written like the table module, through a temporary file
+        tmpname = "%s.%d.tmp" % (filename, os.getpid())
+        try:
+            with open(tmpname, "w") as f:
+                f.write("\n".join(out))
+            os.replace(tmpname, filename)
+        except BaseException:
+            try:
+                os.remove(tmpname)
+            except OSError:
+                pass
+            raise
+        return filename
+
+
+# -----------------------------------------------------------------------------
+#                       === Parser Module Generator ===
+#
+# LRParser.write_module() writes a Python module that runs the automaton of a
+# parser as straight-line code instead of interpreting its tables.  The
+# module's parse() finds the code for the current state with a binary tree of
+# comparisons, and the code of each state shifts, or reduces with the action
+# of the rule written in place when the rule function is positional and only
+# returns an expression.  Other rule functions are imported and called.
+# Gotos that lead to the same state from everywhere become constants.
+#
+# The generated parser uses the same state numbers and stacks as
+# parseopt_values(), and hands its stacks over to it at the first syntax
+# error, so error reporting and recovery are exactly those of the LRParser.
+# Rule functions raising SyntaxError to start error recovery are not
+# supported.
+#
+# The module only depends on the tables and on the rule functions, and is
+# written the same way every time for the same grammar and rules.
+# -----------------------------------------------------------------------------
+
+# The generated Parser class.  The code for the states follows.
+_module_parser = """\
+class Parser:
+    def __init__(self, lrparser):
+        self.lrparser = lrparser  # Takes over at a syntax error
+
+    def clone(self):
+        return Parser(self.lrparser.clone())
+
+    def parse(self, input=None, lexer=None, debug=False, tracking=False):
+        if debug or tracking:
+            return self.lrparser.parse(input, lexer, debug, tracking)
+        if input is not None:
+            lexer.input(input)
+        get_token = lexer.token
+        statestack = [0]
+        valstack = [None]
+        state = 0
+        lookahead = None
+        while True:
+"""
+
+# Names used by the generated module that an inlined action can't use, on
+# top of the names starting with _
+_module_names = {
+    "self",
+    "input",
+    "lexer",
+    "debug",
+    "tracking",
+    "get_token",
+    "statestack",
+    "valstack",
+    "state",
+    "lookahead",
+    "ltid",
+    "t",
+    "YaccSymbol",
+    "Parser",
+}
+
+_scoped_nodes = (
+    ast.Lambda,
+    ast.ListComp,
+    ast.SetComp,
+    ast.DictComp,
+    ast.GeneratorExp,
+    ast.NamedExpr,
+    ast.Await,
+    ast.Yield,
+    ast.YieldFrom,
+)
+
+
+def rule_expression(func):
+    """Return (parameter names, expression) for a rule function whose body is
+    a single return statement, or None."""
+    try:
+        source = textwrap.dedent(inspect.getsource(func))
+    except (OSError, TypeError):
+        return None
+    node = ast.parse(source).body[0]
+    if not isinstance(node, ast.FunctionDef):
+        return None
+    args = node.args
+    if args.posonlyargs or args.vararg or args.kwonlyargs or args.kwarg:
+        return None
+    body = node.body
+    if isinstance(body[0], ast.Expr) and isinstance(body[0].value, ast.Constant):
+        body = body[1:]  # Docstring
+    if len(body) != 1 or not isinstance(body[0], ast.Return) or not body[0].value:
+        return None
+    expr = body[0].value
+    for n in ast.walk(expr):
+        # Anything with a scope of its own could see the parameters
+        if isinstance(n, _scoped_nodes):
+            return None
+    return [a.arg for a in args.args], expr
+
+
+# Expressions that never make a node
+_plain_values = (ast.Constant, ast.List, ast.ListComp, ast.Tuple)
+
+
+def rule_may_make_node(func):
+    """Return False if a rule function only returns one of its arguments or a
+    plain value such as a list, so no span has to be looked for on what it
+    returns."""
+    found = rule_expression(func)
+    if found is None:
+        return True
+    names, expr = found
+    if isinstance(expr, ast.Name):
+        return expr.id not in names
+    return not isinstance(expr, _plain_values)
+
+
+class _RenameParameters(ast.NodeTransformer):
+    def __init__(self, names):
+        self.names = names
+
+    def visit_Name(self, node):
+        if node.id in self.names:
+            return ast.copy_location(ast.Name(self.names[node.id], node.ctx), node)
+        return node
+
 
 # -----------------------------------------------------------------------------
 #                          === Grammar Representation ===
@@ -695,6 +2070,7 @@ class Production(object):
         self.number = number
         self.func = func
         self.callable = None
+        self.positional = False
         self.file = file
         self.line = line
         self.prec = precedence
@@ -754,6 +2130,40 @@ class Production(object):
     def bind(self, pdict):
         if self.func:
             self.callable = pdict[self.func]
+            self.positional = getattr(self.callable, "positional", False)
+
+
+# -----------------------------------------------------------------------------
+# class MiniProduction
+#
+# This class is a stripped down version of Production that is used when a
+# parser is loaded from a cached table file.  It only holds the information
+# needed by the parsing engine (name, length, and the function to call).
+# -----------------------------------------------------------------------------
+
+
+class MiniProduction(object):
+    def __init__(self, str, name, len, func, file, line):
+        self.name = name
+        self.len = len
+        self.func = func
+        self.callable = None
+        self.positional = False
+        self.file = file
+        self.line = line
+        self.str = str
+
+    def __str__(self):
+        return self.str
+
+    def __repr__(self):
+        return "MiniProduction(%s)" % self.str
+
+    # Bind the production function name to a callable
+    def bind(self, pdict):
+        if self.func:
+            self.callable = pdict[self.func]
+            self.positional = getattr(self.callable, "positional", False)
 
 
 # -----------------------------------------------------------------------------
@@ -1360,7 +2770,10 @@ class Grammar(object):
 #     F(x) = F'(x) U U{F(y) | x R y}
 #
 # This is used to compute the values of Read() sets as well as FOLLOW sets
-# in LALR(1) generation.
+# in LALR(1) generation.  The sets are bitsets of terminals (see
+# LRTable.add_lalr_lookaheads()), so a union is a single or.  traverse() keeps
+# its own stack of relations being walked instead of recursing, so deep
+# relations don't run into the recursion limit.
 #
 # Inputs:  X    - An input set
 #          R    - A relation
@@ -1369,9 +2782,7 @@ class Grammar(object):
 
 
 def digraph(X, R, FP):
-    N = {}
-    for x in X:
-        N[x] = 0
+    N = dict.fromkeys(X, 0)
     stack = []
     F = {}
     for x in X:
@@ -1382,26 +2793,33 @@ def digraph(X, R, FP):
 
 def traverse(x, N, stack, F, X, R, FP):
     stack.append(x)
-    d = len(stack)
-    N[x] = d
+    d = N[x] = len(stack)
     F[x] = FP(x)  # F(X) <- F'(x)
-
-    rel = R(x)  # Get y's related to x
-    for y in rel:
-        if N[y] == 0:
-            traverse(y, N, stack, F, X, R, FP)
-        N[x] = min(N[x], N[y])
-        for a in F.get(y, []):
-            if a not in F[x]:
-                F[x].append(a)
-    if N[x] == d:
-        N[stack[-1]] = MAXINT
-        F[stack[-1]] = F[x]
-        element = stack.pop()
-        while element != x:
-            N[stack[-1]] = MAXINT
-            F[stack[-1]] = F[x]
-            element = stack.pop()
+    work = [(x, iter(R(x)), d)]  # Nodes being traversed, their y's left, depth
+    while work:
+        x, rel, d = work[-1]
+        for y in rel:
+            if N[y] == 0:
+                # Traverse y before going on with the rest of x's relation
+                stack.append(y)
+                N[y] = len(stack)
+                F[y] = FP(y)
+                work.append((y, iter(R(y)), N[y]))
+                break
+            N[x] = min(N[x], N[y])
+            F[x] |= F.get(y, 0)
+        else:
+            work.pop()
+            if N[x] == d:
+                f = F[x]
+                while len(stack) >= d:
+                    element = stack.pop()
+                    N[element] = MAXINT
+                    F[element] = f
+            if work:
+                parent = work[-1][0]
+                N[parent] = min(N[parent], N[x])
+                F[parent] |= F[x]
 
 
 class LALRError(YaccError):
@@ -1602,15 +3020,14 @@ class LRTable:
     # -----------------------------------------------------------------------------
 
     def find_nonterminal_transitions(self, C):
-        trans = []
+        trans = {}
         for stateno, state in enumerate(C):
             for p in state:
                 if p.lr_index < p.len - 1:
                     t = (stateno, p.prod[p.lr_index + 1])
                     if t[1] in self.grammar.Nonterminals:
-                        if t not in trans:
-                            trans.append(t)
-        return trans
+                        trans[t] = None
+        return list(trans)
 
     # -----------------------------------------------------------------------------
     # dr_relation()
@@ -1618,24 +3035,24 @@ class LRTable:
     # Computes the DR(p,A) relationships for non-terminal transitions.  The input
     # is a tuple (state,N) where state is a number and N is a nonterminal symbol.
     #
-    # Returns a list of terminals.
+    # Returns a bitset of terminals.
     # -----------------------------------------------------------------------------
 
     def dr_relation(self, C, trans, nullable):
         state, N = trans
-        terms = []
+        termbits = self.termbits
+        terms = 0
 
         g = self.lr0_goto(C[state], N)
         for p in g:
             if p.lr_index < p.len - 1:
                 a = p.prod[p.lr_index + 1]
                 if a in self.grammar.Terminals:
-                    if a not in terms:
-                        terms.append(a)
+                    terms |= termbits[a]
 
         # This extra bit is to handle the start state
         if state == 0 and N == self.grammar.Productions[0].prod[0]:
-            terms.append("$end")
+            terms |= termbits["$end"]
 
         return terms
 
@@ -1697,6 +3114,10 @@ class LRTable:
         for t in trans:
             dtrans[t] = 1
 
+        # Items of each state with the . at the end.  Lookaheads are only
+        # used by these, so lookbacks are only looked for among them.
+        completed = {}
+
         # Loop over all transitions and compute lookbacks and includes
         for state, N in trans:
             lookb = []
@@ -1735,7 +3156,9 @@ class LRTable:
                     j = self.lr0_cidhash.get(id(g), -1)  # Go to next state
 
                 # When we get here, j is the final state, now we have to locate the production
-                for r in C[j]:
+                if j not in completed:
+                    completed[j] = [r for r in C[j] if r.lr_index == r.len - 1]
+                for r in completed[j]:
                     if r.name != p.name:
                         continue
                     if r.len != p.len:
@@ -1765,7 +3188,7 @@ class LRTable:
     #          ntrans   = Set of nonterminal transitions
     #          nullable = Set of empty transitions
     #
-    # Returns a set containing the read sets
+    # Returns a dictionary of read bitsets
     # -----------------------------------------------------------------------------
 
     def compute_read_sets(self, C, ntrans, nullable):
@@ -1787,7 +3210,7 @@ class LRTable:
     #            readsets   = Readset (previously computed)
     #            inclsets   = Include sets (previously computed)
     #
-    # Returns a set containing the follow sets
+    # Returns a dictionary of follow bitsets
     # -----------------------------------------------------------------------------
 
     def compute_follow_sets(self, ntrans, readsets, inclsets):
@@ -1802,22 +3225,35 @@ class LRTable:
     # Attaches the lookahead symbols to grammar rules.
     #
     # Inputs:    lookbacks         -  Set of lookback relations
-    #            followset         -  Computed follow set
+    #            followset         -  Computed follow bitsets
     #
     # This function directly attaches the lookaheads to productions contained
-    # in the lookbacks set
+    # in the lookbacks set, as lists of terminals
     # -----------------------------------------------------------------------------
 
     def add_lookaheads(self, lookbacks, followset):
+        items = {}  # Items given lookaheads, which are bitsets for now
         for trans, lb in lookbacks.items():
+            f = followset.get(trans, 0)
             # Loop over productions in lookback
             for state, p in lb:
-                if state not in p.lookaheads:
-                    p.lookaheads[state] = []
-                f = followset.get(trans, [])
-                for a in f:
-                    if a not in p.lookaheads[state]:
-                        p.lookaheads[state].append(a)
+                lookaheads = p.lookaheads
+                lookaheads[state] = lookaheads.get(state, 0) | f
+                items[id(p)] = p
+
+        termnames = self.termnames
+        decoded = {}  # Bitset -> list of terminals, shared by equal sets
+        for p in items.values():
+            lookaheads = p.lookaheads
+            for state, bits in lookaheads.items():
+                terms = decoded.get(bits)
+                if terms is None:
+                    terms = decoded[bits] = []
+                    while bits:
+                        low = bits & -bits
+                        terms.append(termnames[low.bit_length() - 1])
+                        bits ^= low
+                lookaheads[state] = terms
 
     # -----------------------------------------------------------------------------
     # add_lalr_lookaheads()
@@ -1827,6 +3263,10 @@ class LRTable:
     # -----------------------------------------------------------------------------
 
     def add_lalr_lookaheads(self, C):
+        # Sets of terminals are kept as bitsets, with bit i for termnames[i]
+        self.termnames = ["$end"] + list(self.grammar.Terminals)
+        self.termbits = {a: 1 << i for i, a in enumerate(self.termnames)}
+
         # Determine all of the nullable nonterminals
         nullable = self.compute_nullable_nonterminals()
 
@@ -2056,6 +3496,175 @@ class LRTable:
             goto[st] = st_goto
             st += 1
 
+    # -----------------------------------------------------------------------------
+    # write_table()
+    #
+    # This function writes the LR parsing tables to a file.  The file is a plain
+    # Python module that can be read back with LRCachedTable.read_table().  The
+    # signature is recorded so that a stale table can be detected later.
+    # -----------------------------------------------------------------------------
+
+    def write_table(self, tabmodule, outputdir="", signature=""):
+        filename = os.path.join(outputdir, tabmodule) + ".py"
+        # The table is written to a temporary file that then replaces the
+        # table module, so that it is never read half written.
+        tmpname = "%s.%d.tmp" % (filename, os.getpid())
+        try:
+            self._write_table(tmpname, filename, signature)
+            os.replace(tmpname, filename)
+        except BaseException:
+            try:
+                os.remove(tmpname)
+            except OSError:
+                pass
+            raise
+
+    def _write_table(self, tmpname, filename, signature):
+        with open(tmpname, "w") as f:
+            f.write(
+                """
+# %s
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = %r
+
+_lr_method = %r
+
+_lr_signature = %r
+    """
+                % (os.path.basename(filename), __tabversion__, "LALR", signature)
+            )
+
+            # Factor out names to try and make the table smaller
+            items = {}
+            for s, nd in self.lr_action.items():
+                for name, v in nd.items():
+                    i = items.get(name)
+                    if not i:
+                        i = ([], [])
+                        items[name] = i
+                    i[0].append(s)
+                    i[1].append(v)
+
+            f.write("\n_lr_action_items = {")
+            for k, v in items.items():
+                f.write("%r:([" % k)
+                for i in v[0]:
+                    f.write("%r," % i)
+                f.write("],[")
+                for i in v[1]:
+                    f.write("%r," % i)
+                f.write("]),")
+            f.write("}\n")
+
+            f.write(
+                """
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+"""
+            )
+
+            items = {}
+            for s, nd in self.lr_goto.items():
+                for name, v in nd.items():
+                    i = items.get(name)
+                    if not i:
+                        i = ([], [])
+                        items[name] = i
+                    i[0].append(s)
+                    i[1].append(v)
+
+            f.write("\n_lr_goto_items = {")
+            for k, v in items.items():
+                f.write("%r:([" % k)
+                for i in v[0]:
+                    f.write("%r," % i)
+                f.write("],[")
+                for i in v[1]:
+                    f.write("%r," % i)
+                f.write("]),")
+            f.write("}\n")
+
+            f.write(
+                """
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+"""
+            )
+
+            # Write production table
+            f.write("_lr_productions = [\n")
+            for p in self.lr_productions:
+                if p.func:
+                    f.write(
+                        "  (%r,%r,%d,%r,%r,%d),\n"
+                        % (
+                            p.str,
+                            p.name,
+                            p.len,
+                            p.func,
+                            os.path.basename(p.file),
+                            p.line,
+                        )
+                    )
+                else:
+                    f.write("  (%r,%r,%d,None,None,None),\n" % (str(p), p.name, p.len))
+            f.write("]\n")
+
+
+# -----------------------------------------------------------------------------
+#                             == LRCachedTable ==
+#
+# This class holds LR parsing tables that were read back from a table module
+# written by LRTable.write_table().  It provides the same attributes that the
+# LRParser needs from an LRTable, without running the table generator.
+# -----------------------------------------------------------------------------
+
+
+class LRCachedTable:
+    def __init__(self):
+        self.lr_action = None
+        self.lr_goto = None
+        self.lr_productions = None
+        self.lr_method = None
+
+    # Read the tables from a module.  Returns the signature stored in the module.
+    def read_table(self, module, outputdir=""):
+        if isinstance(module, types.ModuleType):
+            parsetab = module
+        else:
+            filename = os.path.join(outputdir, module) + ".py"
+            if not os.path.exists(filename):
+                raise ImportError("No table module %r" % filename)
+            spec = importlib.util.spec_from_file_location(module, filename)
+            parsetab = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(parsetab)
+
+        if parsetab._tabversion != __tabversion__:
+            raise VersionError("yacc table file version is out of date")
+
+        self.lr_action = parsetab._lr_action
+        self.lr_goto = parsetab._lr_goto
+
+        self.lr_productions = []
+        for p in parsetab._lr_productions:
+            self.lr_productions.append(MiniProduction(*p))
+
+        self.lr_method = parsetab._lr_method
+        return parsetab._lr_signature
+
+    # Bind all production function names to callable objects in pdict
+    def bind_callables(self, pdict):
+        for p in self.lr_productions:
+            p.bind(pdict)
 
 # -----------------------------------------------------------------------------
 #                            === INTROSPECTION ===
@@ -2370,12 +3979,13 @@ class ParserReflect(object):
                 reqargs = 2
             else:
                 reqargs = 1
-            if func.__code__.co_argcount > reqargs:
+            positional = getattr(func, "positional", False)
+            if not positional and func.__code__.co_argcount > reqargs:
                 self.log.error(
                     "%s:%d: Rule %r has too many arguments", file, line, func.__name__
                 )
                 self.error = True
-            elif func.__code__.co_argcount < reqargs:
+            elif not positional and func.__code__.co_argcount < reqargs:
                 self.log.error(
                     "%s:%d: Rule %r requires an argument", file, line, func.__name__
                 )
@@ -2445,6 +4055,9 @@ def yacc(
     start=None,
     check_recursion=True,
     optimize=False,
+    write_tables=True,
+    tabmodule=tab_module,
+    outputdir=None,
     debugfile=debug_file,
     debuglog=None,
     errorlog=None
@@ -2469,6 +4082,11 @@ def yacc(
     else:
         pdict = get_caller_module_dict(2)
 
+    # The table module is written next to the module defining the grammar
+    if outputdir is None:
+        srcfile = pdict.get("__file__")
+        outputdir = os.path.dirname(os.path.abspath(srcfile)) if srcfile else ""
+
     # Set start symbol if it's specified directly using an argument
     if start is not None:
         pdict["start"] = start
@@ -2480,6 +4098,29 @@ def yacc(
     if pinfo.error:
         raise YaccError("Unable to build parser")
 
+    # Check signature against table files (if any)
+    signature = pinfo.signature()
+
+    # Read the tables
+    try:
+        lr = LRCachedTable()
+        read_signature = lr.read_table(tabmodule, outputdir)
+        if optimize or (read_signature == signature):
+            try:
+                lr.bind_callables(pinfo.pdict)
+                parser = LRParser(lr, pinfo.error_func, read_signature)
+                parse = parser.parse
+                return parser
+            except Exception as e:
+                errorlog.warning("There was a problem loading the table file: %r", e)
+    except VersionError as e:
+        errorlog.warning(str(e))
+    except ImportError:
+        pass
+    except Exception as e:
+        # A truncated or corrupt table file is generated again
+        errorlog.warning("There was a problem reading the table file: %r", e)
+
     if debuglog is None:
         if debug:
             try:
@@ -2677,9 +4318,16 @@ def yacc(
                 errorlog.warning("Rule (%s) is never reduced", rejected)
                 warned_never.append(rejected)
 
+    # Write the table file for subsequent runs
+    if write_tables:
+        try:
+            lr.write_table(tabmodule, outputdir, signature)
+        except IOError as e:
+            errorlog.warning("Couldn't create %r. %s" % (tabmodule, e))
+
     # Build the parser
     lr.bind_callables(pinfo.pdict)
-    parser = LRParser(lr, pinfo.error_func)
+    parser = LRParser(lr, pinfo.error_func, signature)
 
     parse = parser.parse
     return parser